@@ -7,14 +7,14 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database import get_db, engine, Base
+from database import get_db, init_db
 from models import User
 import hashlib
 
 def create_admin_user():
     """Create an admin user"""
     # Create database tables
-    Base.metadata.create_all(bind=engine)
+    init_db()
     
     # Get database session
     db = next(get_db())
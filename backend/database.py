@@ -23,4 +23,13 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def init_db():
+    """Create any missing tables. Run at startup or as an explicit migration step."""
+    import models  # noqa: F401  (registers the tables on Base.metadata)
+    Base.metadata.create_all(bind=engine)
+
+if __name__ == "__main__":
+    init_db()
+    print("Database schema is up to date")
@@ -3,7 +3,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from database import get_db
 from models import User
-from simple_auth import verify_token
+from services.auth import get_user_cached, verify_token_cached
 
 security = HTTPBearer()
 
@@ -17,15 +17,14 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # Both lookups are cached, so repeat requests with the same token skip the database
+    payload = verify_token_cached(credentials.credentials)
     try:
-        payload = verify_token(credentials.credentials)
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_user_cached(db, user_id)
     if user is None:
         raise credentials_exception
     return user
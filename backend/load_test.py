@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Load-test harness for the main.py API.
+
+Seeds a job and some candidates, then drives the chosen scenarios at a fixed
+concurrency and reports throughput and latency percentiles per endpoint. Run
+the backend against mock_llm_server.py to exercise question generation,
+analysis and match reasoning without calling a paid API.
+
+Usage:
+    python load_test.py --base-url http://localhost:8000 --concurrency 32 --duration 30 \
+        --scenarios job,matches,interview
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
+
+SKILLS = ["python", "fastapi", "sql", "react", "docker", "aws", "typescript", "kubernetes"]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.latencies[name].append(time.perf_counter() - started)
+        if not ok:
+            self.errors[name] += 1
+        return response if ok else None
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))]
+
+
+async def seed(client: httpx.AsyncClient, candidates: int) -> int:
+    job = await client.post("/api/jobs/", json={
+        "title": "Load Test Engineer",
+        "description": "Synthetic job created by load_test.py",
+        "requirements": ["Bachelor's degree"],
+        "skills_required": SKILLS[:5],
+        "experience_required": 3,
+        "location": "Remote",
+    })
+    job.raise_for_status()
+    for i in range(candidates):
+        response = await client.post("/api/candidates/", json={
+            "name": f"Load Candidate {i}",
+            "email": f"load-{uuid.uuid4().hex[:10]}@example.com",
+            "skills": random.sample(SKILLS, k=random.randint(2, 6)),
+            "experience_years": random.randint(0, 12),
+            "location": "Remote",
+        })
+        response.raise_for_status()
+    return job.json()["id"]
+
+
+async def run_interview(client, recorder: Recorder, job_id: int, candidate_id: int, poll_seconds: float):
+    created = await recorder.request(client, "create_interview", "POST", "/api/interviews/", json={
+        "candidate_id": candidate_id, "job_id": job_id,
+    })
+    if created is None:
+        return
+    interview = created.json()
+    answers = [f"Synthetic answer {i} with enough detail to score." for i in range(len(interview["questions"]))]
+    for i, answer in enumerate(answers, 1):
+        await recorder.request(client, "submit_answer", "POST", f"/api/interview/{interview['id']}/answer",
+                               json={"question_id": i, "answer": answer})
+    conducted = await recorder.request(client, "conduct_interview", "POST",
+                                       f"/api/interviews/{interview['id']}/conduct", json=answers)
+    if conducted is None or conducted.status_code != 202:
+        return
+    started = time.perf_counter()
+    while True:
+        await asyncio.sleep(poll_seconds)
+        status = await recorder.request(client, "poll_analysis", "GET", f"/api/interviews/{interview['id']}/analysis")
+        if status is None or status.json()["status"] != "analyzing":
+            break
+    recorder.latencies["analysis_end_to_end"].append(time.perf_counter() - started)
+
+
+async def worker(client, recorder: Recorder, scenarios: List[str], job_id: int,
+                 candidate_ids: List[int], deadline: float, poll_seconds: float):
+    while time.perf_counter() < deadline:
+        scenario = random.choice(scenarios)
+        if scenario == "job":
+            await recorder.request(client, "get_job", "GET", f"/api/jobs/{job_id}")
+        elif scenario == "candidates":
+            await recorder.request(client, "get_candidates", "GET", "/api/candidates/", params={"fast": "true"})
+        elif scenario == "matches":
+            await recorder.request(client, "get_matches", "GET", f"/api/matches/{job_id}/compact")
+        elif scenario == "interview":
+            await run_interview(client, recorder, job_id, random.choice(candidate_ids), poll_seconds)
+
+
+def report(recorder: Recorder, elapsed: float):
+    print(f"\n{'endpoint':<22}{'count':>8}{'errors':>8}{'rps':>9}{'p50 ms':>10}{'p90 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    print("-" * 87)
+    for name in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[name])
+        print(
+            f"{name:<22}{len(values):>8}{recorder.errors.get(name, 0):>8}{len(values) / elapsed:>9.1f}"
+            + "".join(f"{percentile(values, p) * 1000:>10.1f}" for p in (50, 90, 95, 99))
+        )
+
+
+async def main_async(args):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        print(f"Seeding {args.candidates} candidates...")
+        job_id = await seed(client, args.candidates)
+        candidates = (await client.get("/api/candidates/", params={"fields": "id", "limit": args.candidates})).json()
+        candidate_ids = [c["id"] for c in candidates] or [1]
+
+        recorder = Recorder()
+        scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+        print(f"Running {scenarios} at concurrency {args.concurrency} for {args.duration}s...")
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*[
+            worker(client, recorder, scenarios, job_id, candidate_ids, deadline, args.poll_seconds)
+            for _ in range(args.concurrency)
+        ])
+        report(recorder, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument("--candidates", type=int, default=50, help="candidates to seed")
+    parser.add_argument("--scenarios", default="job,candidates,matches,interview",
+                        help="comma-separated: job, candidates, matches, interview")
+    parser.add_argument("--poll-seconds", type=float, default=0.5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
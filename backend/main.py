@@ -1,21 +1,29 @@
+import json
 import os
+import time
+
+_import_started = time.perf_counter()
+
 from datetime import timedelta
 from typing import List, Optional
 
 from dotenv import load_dotenv
 from fastapi import (
+    BackgroundTasks,
     Depends,
     FastAPI,
     File,
     HTTPException,
+    Request,
     UploadFile,
     status,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
-from database import Base, engine, get_db
+from database import SessionLocal, get_db, init_db
 from dependencies import get_admin_user, get_current_active_user
 from models import (
     Candidate,
@@ -27,10 +35,14 @@ from models import (
     UserResume,
 )
 from schemas import (
+    AnswerSubmit,
     CandidateCreate,
     CandidateResponse,
+    CompactJobMatchesResponse,
+    CompactMatchesResponse,
     InterviewCreate,
     InterviewResponse,
+    InterviewSummaryResponse,
     JobCreate,
     JobMatchResponse,
     JobResponse,
@@ -41,20 +53,47 @@ from schemas import (
     UserResponse,
     UserResumeResponse,
 )
+from services import metrics
+from services.analysis_jobs import ANALYZING, COMPLETED, analysis_jobs
+from services.answer_scoring import answer_scoring
 from services.auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
-    authenticate_user,
+    authenticate_user_async,
     create_access_token,
-    create_user,
+    create_user_async,
+)
+from services.cache import (
+    cache_candidate,
+    cache_job,
+    get_cached_active_jobs,
+    get_cached_candidates,
+    get_cached_job,
+)
+from services.password_pool import admit_auth_attempt
+from services.registry import (
+    get_interview_ai,
+    get_matching_engine,
+    get_resume_parser,
+    preload_all,
+)
+from services.serialization import (
+    CANDIDATE_FIELDS,
+    INTERVIEW_SUMMARY_FIELDS,
+    as_record,
+    candidate_row,
+    fast_response,
+    parse_fields,
+    select_fields,
+    sort_rows,
 )
-from services.interview_ai import InterviewAI
-from services.matching_engine import MatchingEngine
-from services.resume_parser import ResumeParser
 
 load_dotenv()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Schema creation runs at startup (or via `python database.py`), not at import
+AUTO_CREATE_SCHEMA = os.getenv("AUTO_CREATE_SCHEMA", "true").lower() == "true"
+PRELOAD_SERVICES = os.getenv("PRELOAD_SERVICES", "false").lower() == "true"
+PREWARM_QUESTIONS = os.getenv("PREWARM_QUESTIONS", "true").lower() == "true"
+ANALYSIS_POLL_SECONDS = float(os.getenv("ANALYSIS_POLL_SECONDS", "15"))
 
 app = FastAPI(
     title="AI Recruitment Platform",
@@ -73,10 +112,26 @@ app.add_middleware(
 
 security = HTTPBearer()
 
-# Initialize AI services
-resume_parser = ResumeParser()
-matching_engine = MatchingEngine()
-interview_ai = InterviewAI()
+@app.on_event("startup")
+async def startup():
+    started = time.perf_counter()
+    if AUTO_CREATE_SCHEMA:
+        init_db()
+    analysis_jobs.start_resumer()
+    if PRELOAD_SERVICES:
+        preload_all()
+    metrics.set_gauge("startup_seconds", time.perf_counter() - started)
+
+@app.middleware("http")
+async def record_first_request(request, call_next):
+    response = await call_next(request)
+    metrics.set_gauge_once(
+        "time_to_first_request_seconds", time.perf_counter() - _import_started
+    )
+    return response
+
+async def prewarm_interview_questions(job_id: int):
+    await get_interview_ai().prewarm_questions(job_id)
 
 @app.get("/")
 async def root():
@@ -89,9 +144,16 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics")
+async def get_metrics():
+    return metrics.snapshot()
+
 # Authentication endpoints
 @app.post("/api/auth/register", response_model=Token)
-async def register(user: UserRegister, db: Session = Depends(get_db)):
+async def register(
+    user: UserRegister, request: Request, db: Session = Depends(get_db)
+):
+    admit_auth_attempt(request.client.host if request.client else None, user.email)
     db_user = db.query(User).filter(User.email == user.email).first()
     if db_user:
         raise HTTPException(
@@ -99,7 +161,7 @@ async def register(user: UserRegister, db: Session = Depends(get_db)):
             detail="Email already registered",
         )
 
-    db_user = create_user(
+    db_user = await create_user_async(
         db=db,
         email=user.email,
         password=user.password,
@@ -120,9 +182,12 @@ async def register(user: UserRegister, db: Session = Depends(get_db)):
 
 @app.post("/api/auth/login", response_model=Token)
 async def login(
-    user_credentials: UserLogin, db: Session = Depends(get_db)
+    user_credentials: UserLogin, request: Request, db: Session = Depends(get_db)
 ):
-    user = authenticate_user(
+    admit_auth_attempt(
+        request.client.host if request.client else None, user_credentials.email
+    )
+    user = await authenticate_user_async(
         db, user_credentials.email, user_credentials.password
     )
     if not user:
@@ -158,13 +223,24 @@ async def create_candidate(
     db.add(db_candidate)
     db.commit()
     db.refresh(db_candidate)
+    cache_candidate(db_candidate)
     return db_candidate
 
 @app.get("/api/candidates/", response_model=List[CandidateResponse])
 async def get_candidates(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    fast: bool = False,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
 ):
+    """List candidates; fields=name,email,... returns only those columns"""
+    columns = parse_fields(fields, CANDIDATE_FIELDS)
+    if columns:
+        return fast_response(select_fields(db, Candidate, columns, skip, limit))
     candidates = db.query(Candidate).offset(skip).limit(limit).all()
+    if fast:
+        return fast_response([candidate_row(c) for c in candidates])
     return candidates
 
 @app.post("/api/candidates/upload-resume")
@@ -179,7 +255,7 @@ async def upload_resume(
             content = await file.read()
             buffer.write(content)
         
-        parsed_data = resume_parser.parse_resume(file_path)
+        parsed_data = get_resume_parser().parse_resume(file_path)
         
         candidate = Candidate(
             name=parsed_data.get("name", "Unknown"),
@@ -194,6 +270,7 @@ async def upload_resume(
         db.add(candidate)
         db.commit()
         db.refresh(candidate)
+        cache_candidate(candidate)
         
         return {
             "message": "Resume uploaded and parsed successfully",
@@ -207,12 +284,17 @@ async def upload_resume(
 # Job endpoints
 @app.post("/api/jobs/", response_model=JobResponse)
 async def create_job(
-    job: JobCreate, db: Session = Depends(get_db)
+    job: JobCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
 ):
     db_job = Job(**job.dict())
     db.add(db_job)
     db.commit()
     db.refresh(db_job)
+    cache_job(db_job)
+    if PREWARM_QUESTIONS:
+        background_tasks.add_task(prewarm_interview_questions, db_job.id)
     return db_job
 
 @app.get("/api/jobs/", response_model=List[JobResponse])
@@ -224,31 +306,60 @@ async def get_jobs(
 
 @app.get("/api/jobs/{job_id}", response_model=JobResponse)
 async def get_job(job_id: int, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = get_cached_job(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
 @app.get("/api/matches/{job_id}", response_model=List[MatchResponse])
-async def get_matches(job_id: int, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.id == job_id).first()
+async def get_matches(
+    job_id: int,
+    fast: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Match every candidate against a job.
+
+    fast=true serializes plain rows with orjson instead of building
+    MatchResponse models.
+    """
+    job, matches = await _match_candidates(db, job_id)
+    for match in matches:
+        match["job"] = job
+        del match["job_id"]
+    if fast:
+        return fast_response(matches)
+    return [MatchResponse(**match) for match in matches]
+
+@app.get("/api/matches/{job_id}/compact", response_model=CompactMatchesResponse)
+async def get_matches_compact(job_id: int, db: Session = Depends(get_db)):
+    """Match every candidate against a job; the job is returned once and referenced by job_id"""
+    job, matches = await _match_candidates(db, job_id)
+    return fast_response({"job": job, "matches": matches})
+
+async def _match_candidates(db: Session, job_id: int):
+    """The cached job and its stored matches (best first), each referencing the job by job_id"""
+    job = get_cached_job(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    job_record = as_record(job)
     
-    candidates = db.query(Candidate).all()
+    candidate_ids = [row.id for row in db.query(Candidate.id).all()]
+    candidates = get_cached_candidates(db, candidate_ids)
+    scores = await get_matching_engine().calculate_matches(
+        [as_record(candidate) for candidate in candidates], job_record
+    )
     matches = []
     
-    for candidate in candidates:
-        match_score, reasoning = await matching_engine.calculate_match(candidate, job)
-        
+    for candidate, (match_score, reasoning) in zip(candidates, scores):
         match = db.query(Match).filter(
-            Match.candidate_id == candidate.id,
+            Match.candidate_id == candidate["id"],
             Match.job_id == job_id
         ).first()
         
         if not match:
             match = Match(
-                candidate_id=candidate.id,
+                candidate_id=candidate["id"],
                 job_id=job_id,
                 match_score=match_score,
                 reasoning=reasoning,
@@ -260,21 +371,18 @@ async def get_matches(job_id: int, db: Session = Depends(get_db)):
         
         db.commit()
         
-        matches.append(
-            MatchResponse(
-                candidate=candidate,
-                job=job,
-                match_score=match_score,
-                reasoning=reasoning,
-            )
-        )
+        matches.append({
+            "candidate": candidate,
+            "job_id": job_id,
+            "match_score": match_score,
+            "reasoning": reasoning,
+        })
     
-    matches.sort(key=lambda x: x.match_score, reverse=True)
-    return matches
+    return job, sort_rows(matches, "match_score")
 
 @app.post("/api/interviews/", response_model=InterviewResponse)
 async def create_interview(interview: InterviewCreate, db: Session = Depends(get_db)):
-    questions = await interview_ai.generate_questions(
+    questions = await get_interview_ai().generate_questions(
         interview.candidate_id, interview.job_id, db
     )
     
@@ -288,32 +396,158 @@ async def create_interview(interview: InterviewCreate, db: Session = Depends(get
     db.refresh(db_interview)
     return db_interview
 
-@app.post("/api/interviews/{interview_id}/conduct")
-async def conduct_interview(
-    interview_id: int, responses: List[str], db: Session = Depends(get_db)
+@app.post("/api/interview/{interview_id}/answer")
+async def submit_answer(
+    interview_id: int, answer: AnswerSubmit, db: Session = Depends(get_db)
 ):
+    """Store one answer and score it in the background while the interview continues"""
     interview = db.query(Interview).filter(Interview.id == interview_id).first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    analysis = await interview_ai.analyze_responses(interview.questions, responses)
+    questions = interview.questions or []
+    index = answer.question_id - 1
+    if index < 0 or index >= len(questions):
+        raise HTTPException(status_code=400, detail="Unknown question_id")
     
+    responses = list(interview.responses or [])
+    responses += [""] * (len(questions) - len(responses))
+    responses[index] = answer.answer
     interview.responses = responses
-    interview.analysis = analysis
-    interview.status = "completed"
-    interview.score = analysis.get("overall_score", 0)
-    
+    if interview.status == "scheduled":
+        interview.status = "in_progress"
     db.commit()
     
+    answer_scoring.submit(interview_id, index, questions[index], answer.answer)
+    
     return {
-        "message": "Interview completed successfully",
-        "analysis": analysis,
-        "score": interview.score,
+        "interview_id": interview_id,
+        "question_id": answer.question_id,
+        "answer_submitted": True,
+        "next_question": answer.question_id + 1 if answer.question_id < len(questions) else None,
     }
 
+@app.post("/api/interviews/{interview_id}/conduct", status_code=202)
+async def conduct_interview(
+    interview_id: int, responses: List[str], db: Session = Depends(get_db)
+):
+    """
+    Store the responses and complete the interview.
+
+    If every answer was already scored via /api/interview/{id}/answer, the
+    stored results are aggregated and returned immediately (200). Otherwise
+    the analysis runs in the background and this returns 202 with a status
+    URL to poll and an SSE URL that emits a single event when it is stored.
+    """
+    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    
+    if interview.status != ANALYZING:
+        analysis = answer_scoring.aggregate_if_ready(db, interview, responses)
+        interview.responses = responses
+        if analysis is not None:
+            interview.analysis = analysis
+            interview.status = COMPLETED
+            interview.score = analysis.get("overall_score", 0)
+            db.commit()
+            return JSONResponse(
+                status_code=200,
+                content={
+                    "message": "Interview completed successfully",
+                    "analysis": analysis,
+                    "score": interview.score,
+                },
+            )
+        interview.status = ANALYZING
+        db.commit()
+    elif responses != (interview.responses or []):
+        # Resubmitted with different answers: analyse those instead (submit restarts the job)
+        interview.responses = responses
+        db.commit()
+    analysis_jobs.submit(interview_id, interview.questions or [], interview.responses or [])
+    
+    status_url = f"/api/interviews/{interview_id}/analysis"
+    return JSONResponse(
+        status_code=202,
+        content={
+            "message": "Interview analysis started",
+            "status": ANALYZING,
+            "status_url": status_url,
+            "events_url": f"{status_url}/events",
+        },
+        headers={"Location": status_url},
+    )
+
+def _analysis_status(db: Session, interview_id: int) -> Optional[dict]:
+    interview = (
+        db.query(Interview)
+        .options(undefer(Interview.analysis))
+        .filter(Interview.id == interview_id)
+        .first()
+    )
+    if not interview:
+        return None
+    payload = {"interview_id": interview.id, "status": interview.status}
+    if interview.status != ANALYZING:
+        payload["analysis"] = interview.analysis
+        payload["score"] = interview.score
+    return payload
+
+@app.get("/api/interviews/{interview_id}/analysis")
+async def get_interview_analysis(interview_id: int, db: Session = Depends(get_db)):
+    payload = _analysis_status(db, interview_id)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    return payload
+
+@app.get("/api/interviews/{interview_id}/analysis/events")
+async def stream_interview_analysis(interview_id: int):
+    """Server-sent events: keepalive comments until the analysis is stored, then one result event"""
+    async def events():
+        while True:
+            db = SessionLocal()
+            try:
+                payload = _analysis_status(db, interview_id)
+            finally:
+                db.close()
+            if payload is None:
+                yield 'event: error\ndata: {"detail": "Interview not found"}\n\n'
+                return
+            if payload["status"] != ANALYZING:
+                yield f"event: {payload['status']}\ndata: {json.dumps(payload, default=str)}\n\n"
+                return
+            yield ": analyzing\n\n"
+            await analysis_jobs.wait(interview_id, ANALYSIS_POLL_SECONDS)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/api/interviews/", response_model=List[InterviewSummaryResponse])
+async def get_interviews(
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """List interviews without analysis; fields=status,score,... returns only those columns"""
+    columns = parse_fields(fields, INTERVIEW_SUMMARY_FIELDS)
+    if columns:
+        return fast_response(select_fields(db, Interview, columns, skip, limit))
+    interviews = db.query(Interview).offset(skip).limit(limit).all()
+    return interviews
+
 @app.get("/api/interviews/{interview_id}", response_model=InterviewResponse)
 async def get_interview(interview_id: int, db: Session = Depends(get_db)):
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = (
+        db.query(Interview)
+        .options(undefer(Interview.analysis))
+        .filter(Interview.id == interview_id)
+        .first()
+    )
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     return interview
@@ -332,7 +566,7 @@ async def upload_user_resume(
             content = await file.read()
             buffer.write(content)
         
-        parsed_data = resume_parser.parse_resume(file_path)
+        parsed_data = get_resume_parser().parse_resume(file_path)
         
         user_resume = UserResume(
             user_id=current_user.id,
@@ -366,9 +600,37 @@ async def get_user_resumes(
 
 @app.get("/api/user/job-matches", response_model=List[JobMatchResponse])
 async def get_user_job_matches(
+    fast: bool = False,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Match the current user's latest resume against every active job.
+
+    fast=true serializes plain rows with orjson.
+    """
+    jobs, matches = await _match_user_jobs(db, current_user)
+    jobs_by_id = {job["id"]: job for job in jobs}
+    for match in matches:
+        match["job"] = jobs_by_id[match.pop("job_id")]
+    if fast:
+        return fast_response(matches)
+    return [JobMatchResponse(**match) for match in matches]
+
+@app.get("/api/user/job-matches/compact", response_model=CompactJobMatchesResponse)
+async def get_user_job_matches_compact(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
+    """Match the current user's latest resume against every active job; each job is returned once, keyed by id"""
+    jobs, matches = await _match_user_jobs(db, current_user)
+    return fast_response({
+        "jobs": {str(job["id"]): job for job in jobs},
+        "matches": matches,
+    })
+
+async def _match_user_jobs(db: Session, current_user: User):
+    """Active jobs and the user's stored matches against them (best first), referencing jobs by job_id"""
     latest_resume = db.query(UserResume).filter(
         UserResume.user_id == current_user.id
     ).order_by(UserResume.created_at.desc()).first()
@@ -379,7 +641,7 @@ async def get_user_job_matches(
             detail="No resume found. Please upload a resume first.",
         )
     
-    jobs = db.query(Job).filter(Job.status == "active").all()
+    jobs = get_cached_active_jobs(db)
     matches = []
     
     for job in jobs:
@@ -388,20 +650,20 @@ async def get_user_job_matches(
             matched_skills,
             missing_skills,
             reasoning,
-        ) = await matching_engine.calculate_user_job_match(
-            latest_resume, job
+        ) = await get_matching_engine().calculate_user_job_match(
+            latest_resume, as_record(job)
         )
         
         existing_match = db.query(UserJobMatch).filter(
             UserJobMatch.user_id == current_user.id,
-            UserJobMatch.job_id == job.id
+            UserJobMatch.job_id == job["id"]
         ).first()
         
         if not existing_match:
             match_record = UserJobMatch(
                 user_id=current_user.id,
                 resume_id=latest_resume.id,
-                job_id=job.id,
+                job_id=job["id"],
                 match_percentage=match_score,
                 matched_skills=matched_skills,
                 missing_skills=missing_skills,
@@ -416,21 +678,20 @@ async def get_user_job_matches(
         
         db.commit()
         
-        matches.append(
-            JobMatchResponse(
-                job=job,
-                match_percentage=match_score,
-                matched_skills=matched_skills,
-                missing_skills=missing_skills,
-                reasoning=reasoning,
-                created_at=existing_match.created_at
-                if existing_match
-                else None,
-            )
-        )
+        matches.append({
+            "job_id": job["id"],
+            "match_percentage": match_score,
+            "matched_skills": matched_skills,
+            "missing_skills": missing_skills,
+            "reasoning": reasoning,
+            "created_at": existing_match.created_at
+            if existing_match
+            else None,
+        })
     
-    matches.sort(key=lambda x: x.match_percentage, reverse=True)
-    return matches
+    return jobs, sort_rows(matches, "match_percentage")
+
+metrics.set_gauge("import_seconds", time.perf_counter() - _import_started)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Local OpenAI-compatible stand-in for load testing.
+
+Serves POST /v1/chat/completions with configurable latency and error rate,
+answering with canned text in the formats InterviewAI and MatchingEngine parse.
+Point the backend at it with:
+
+    OPENAI_BASE_URL=http://localhost:8100/v1 OPENAI_API_KEY=mock uvicorn main:app
+
+Usage:
+    python mock_llm_server.py --port 8100 --latency-median 0.8 --latency-sigma 0.5 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+app = FastAPI(title="Mock LLM Server")
+
+config = {
+    "latency_median": 0.5,
+    "latency_sigma": 0.4,
+    "latency_max": 30.0,
+    "error_rate": 0.0,
+    "rate_limit_rate": 0.0,
+}
+rng = random.Random()
+
+QUESTIONS = [
+    "Walk me through how you would design a REST API for this role's core product.",
+    "Tell me about a time you disagreed with a teammate and how you resolved it.",
+    "A production deploy breaks checkout at 5pm on a Friday. What do you do?",
+    "Which project from your experience best prepares you for this position?",
+    "What motivates you to apply for this role?",
+]
+
+ANALYSIS = """Technical Knowledge: {tech}
+Communication Skills: {comm}
+Problem Solving: {prob}
+Cultural Fit: {fit}
+Overall Score: {overall}
+Strengths: Clear explanations, Solid fundamentals, Structured thinking
+Areas for Improvement: More concrete examples, Deeper system design
+Recommendation: {recommendation} - consistent answers across the interview"""
+
+FEEDBACK = (
+    "Thank you for interviewing with us. You explained your past work clearly and showed "
+    "solid fundamentals. To strengthen future interviews, add concrete metrics to your examples "
+    "and go deeper on system design trade-offs."
+)
+
+REASONING = (
+    "The candidate covers most of the required skills and meets the experience bar. "
+    "Missing skills are learnable on the job, so this is a reasonable match."
+)
+
+
+def sample_latency() -> float:
+    median = config["latency_median"]
+    if median <= 0:
+        return 0.0
+    latency = rng.lognormvariate(math.log(median), config["latency_sigma"])
+    return min(latency, config["latency_max"])
+
+
+def canned_response(prompt: str) -> str:
+    if "interview questions" in prompt:
+        return "\n".join(QUESTIONS)
+    if "Analyze these interview responses" in prompt or "Evaluate this single interview answer" in prompt:
+        scores = {key: rng.randint(4, 10) for key in ("tech", "comm", "prob", "fit")}
+        overall = round(sum(scores.values()) / len(scores))
+        recommendation = "Hire" if overall >= 7 else "Maybe" if overall >= 5 else "No Hire"
+        return ANALYSIS.format(overall=overall, recommendation=recommendation, **scores)
+    if "constructive feedback" in prompt:
+        return FEEDBACK
+    if '{"reasonings"' in prompt:
+        ids = [int(i) for i in re.findall(r'^\s*\{"id": (\d+)', prompt, re.MULTILINE)]
+        return json.dumps({"reasonings": [{"id": i, "reasoning": REASONING} for i in ids]})
+    return REASONING
+
+
+def error_response(status_code: int, message: str, error_type: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": error_type, "code": None}},
+    )
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    prompt = "\n".join(m.get("content", "") for m in body.get("messages", []))
+
+    await asyncio.sleep(sample_latency())
+
+    roll = rng.random()
+    if roll < config["rate_limit_rate"]:
+        return error_response(429, "Rate limit reached (mock)", "rate_limit_error")
+    if roll < config["rate_limit_rate"] + config["error_rate"]:
+        return error_response(500, "Internal server error (mock)", "server_error")
+
+    content = canned_response(prompt)
+    prompt_tokens = len(prompt.split())
+    completion_tokens = len(content.split())
+    return {
+        "id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+@app.get("/v1/models")
+async def list_models():
+    return {"object": "list", "data": [{"id": "gpt-3.5-turbo", "object": "model", "owned_by": "mock"}]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-median", type=float, default=config["latency_median"],
+                        help="median response latency in seconds (lognormal)")
+    parser.add_argument("--latency-sigma", type=float, default=config["latency_sigma"],
+                        help="lognormal sigma; larger means a heavier tail")
+    parser.add_argument("--latency-max", type=float, default=config["latency_max"])
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of calls answered with 429")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config.update(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        latency_max=args.latency_max,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+    )
+    if args.seed is not None:
+        rng.seed(args.seed)
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
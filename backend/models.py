@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, JSON, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, JSON, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from database import Base
 import bcrypt
@@ -16,7 +16,8 @@ class Candidate(Base):
     experience_years = Column(Integer, default=0)
     education = Column(Text, nullable=True)
     location = Column(String, nullable=True)
-    raw_data = Column(JSON, nullable=True)
+    # Full parsed resume; deferred because list endpoints never return it
+    raw_data = deferred(Column(JSON, nullable=True))
     score = Column(Float, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -54,21 +55,21 @@ class Interview(Base):
     job_id = Column(Integer, ForeignKey("jobs.id"))
     questions = Column(JSON, default=list)
     responses = Column(JSON, default=list)
-    analysis = Column(JSON, nullable=True)
+    analysis = deferred(Column(JSON, nullable=True))
     score = Column(Float, default=0.0)
-    status = Column(String, default="scheduled")  # scheduled, in_progress, completed
+    status = Column(String, default="scheduled")  # scheduled, in_progress, analyzing, completed, analysis_failed
     recording_url = Column(String, nullable=True)
     transcript = Column(Text, nullable=True)
     scheduled_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
-    # Enhanced interview data
+    # Enhanced interview data (large JSON blobs are deferred until accessed)
     video_url = Column(String, nullable=True)
     audio_url = Column(String, nullable=True)
-    eye_tracking_data = Column(JSON, nullable=True)
-    speech_analysis = Column(JSON, nullable=True)
-    fraud_detection = Column(JSON, nullable=True)
+    eye_tracking_data = deferred(Column(JSON, nullable=True))
+    speech_analysis = deferred(Column(JSON, nullable=True))
+    fraud_detection = deferred(Column(JSON, nullable=True))
     attention_score = Column(Float, nullable=True)
     communication_score = Column(Float, nullable=True)
     technical_score = Column(Float, nullable=True)
@@ -80,6 +81,42 @@ class Interview(Base):
     candidate = relationship("Candidate", back_populates="interviews")
     job = relationship("Job", back_populates="interviews")
 
+class InterviewQuestionSet(Base):
+    __tablename__ = "interview_question_sets"
+    __table_args__ = (
+        UniqueConstraint("job_id", "job_version", "fingerprint", name="uq_question_set_key"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), index=True)
+    job_version = Column(String)
+    fingerprint = Column(String)  # see services.question_cache.skill_profile
+    questions = Column(JSON, default=list)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class InterviewAnswerAnalysis(Base):
+    """Score of one interview answer; one row per question so concurrent scoring never collides"""
+    __tablename__ = "interview_answer_analyses"
+    __table_args__ = (
+        UniqueConstraint("interview_id", "question_index", name="uq_answer_analysis_key"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id"), index=True)
+    question_index = Column(Integer)
+    answer_hash = Column(String)
+    analysis = Column(JSON)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class InterviewAnalysisLease(Base):
+    """Which worker is analysing an interview, and until when; expired leases may be taken over"""
+    __tablename__ = "interview_analysis_leases"
+    
+    interview_id = Column(Integer, ForeignKey("interviews.id"), primary_key=True)
+    owner = Column(String, nullable=False)
+    responses_hash = Column(String, nullable=False)
+    expires_at = Column(Float, nullable=False, index=True)  # Unix time
+
 class Match(Base):
     __tablename__ = "matches"
     
@@ -122,7 +159,7 @@ class UserResume(Base):
     skills = Column(JSON, default=list)
     experience_years = Column(Integer, default=0)
     education = Column(Text, nullable=True)
-    raw_data = Column(JSON, nullable=True)
+    raw_data = deferred(Column(JSON, nullable=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -58,6 +58,19 @@ class InterviewBase(BaseModel):
 class InterviewCreate(InterviewBase):
     pass
 
+class InterviewSummaryResponse(InterviewBase):
+    id: int
+    questions: List[str] = []
+    responses: List[str] = []
+    score: float = 0.0
+    status: str = "scheduled"
+    recording_url: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
 class InterviewResponse(InterviewBase):
     id: int
     questions: List[str] = []
@@ -73,6 +86,10 @@ class InterviewResponse(InterviewBase):
     class Config:
         from_attributes = True
 
+class AnswerSubmit(BaseModel):
+    question_id: int  # 1-based position in Interview.questions
+    answer: str
+
 # Match schemas
 class MatchResponse(BaseModel):
     candidate: CandidateResponse
@@ -83,6 +100,17 @@ class MatchResponse(BaseModel):
     class Config:
         from_attributes = True
 
+# Compact match lists: the job is sent once and each match references it by job_id
+class CompactMatch(BaseModel):
+    candidate: CandidateResponse
+    job_id: int
+    match_score: float
+    reasoning: Optional[str] = None
+
+class CompactMatchesResponse(BaseModel):
+    job: JobResponse
+    matches: List[CompactMatch]
+
 # Resume upload response
 class ResumeUploadResponse(BaseModel):
     message: str
@@ -143,4 +171,16 @@ class JobMatchResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class CompactJobMatch(BaseModel):
+    job_id: int
+    match_percentage: float
+    matched_skills: List[str]
+    missing_skills: List[str]
+    reasoning: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+class CompactJobMatchesResponse(BaseModel):
+    jobs: Dict[str, JobResponse]
+    matches: List[CompactJobMatch]
+
 
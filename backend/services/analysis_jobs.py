@@ -0,0 +1,233 @@
+"""
+Background interview analysis.
+
+conduct_interview marks the interview 'analyzing' and returns straight away;
+the LLM analysis runs here as an asyncio task and the result is written back
+to the interview row when it finishes. Submitting different responses while an
+analysis is running cancels it and starts over with the new responses.
+
+With several workers, an analysis is only started after its worker claims the
+interview's lease row. The claim is a single conditional UPDATE (or INSERT for
+a new row), so only one worker wins it. A running analysis renews its lease
+every third of ANALYSIS_LEASE_SECONDS and cancels itself if the lease has been
+taken over. Every worker periodically resumes 'analyzing' interviews whose
+lease is missing or expired, i.e. whose worker died.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from database import SessionLocal
+from models import Interview, InterviewAnalysisLease
+from services.answer_scoring import answer_scoring
+from services.registry import get_interview_ai
+
+load_dotenv()
+
+# Configuration
+ANALYSIS_LEASE_SECONDS = float(os.getenv("ANALYSIS_LEASE_SECONDS", "60"))
+
+ANALYZING = "analyzing"
+COMPLETED = "completed"
+FAILED = "analysis_failed"
+
+
+def responses_hash(responses: List[str]) -> str:
+    return hashlib.sha1(json.dumps(responses or []).encode("utf-8")).hexdigest()
+
+
+class AnalysisJobs:
+    def __init__(self, lease_seconds: float = ANALYSIS_LEASE_SECONDS):
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: Dict[int, "asyncio.Task"] = {}
+        self._hashes: Dict[int, str] = {}
+        self._done: Dict[int, asyncio.Event] = {}
+        self._resumer: Optional["asyncio.Task"] = None
+
+    def submit(self, interview_id: int, questions: List[str], responses: List[str]) -> bool:
+        """
+        Start analysing an interview in this worker. Returns whether it is running here.
+
+        A no-op if the same responses are already being analysed, here or by a
+        live worker elsewhere; different responses cancel the running analysis
+        and restart it.
+        """
+        digest = responses_hash(responses)
+        running = self._tasks.get(interview_id)
+        if running is not None and self._hashes.get(interview_id) == digest:
+            return True
+        if not self.claim(interview_id, digest):
+            return False
+        if running is not None:
+            running.cancel()
+        self._done.setdefault(interview_id, asyncio.Event())
+        self._hashes[interview_id] = digest
+        self._tasks[interview_id] = asyncio.create_task(
+            self._run(interview_id, questions, responses)
+        )
+        return True
+
+    async def wait(self, interview_id: int, timeout: float) -> bool:
+        """
+        Wait up to timeout for an analysis running in this worker to finish.
+
+        Returns False on timeout. If the analysis is not running here (another
+        worker owns it), sleeps for timeout so callers can poll the database.
+        """
+        event = self._done.get(interview_id)
+        if event is None:
+            await asyncio.sleep(timeout)
+            return False
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def claim(self, interview_id: int, digest: str) -> bool:
+        """
+        Take the interview's analysis lease for these responses.
+
+        Succeeds if there is no lease, it has expired, it is ours, or it is for
+        different responses (which are superseded); fails while another live
+        worker analyses the same responses.
+        """
+        now = time.time()
+        values = {"owner": self.owner, "responses_hash": digest, "expires_at": now + self.lease_seconds}
+        db = SessionLocal()
+        try:
+            updated = db.query(InterviewAnalysisLease).filter(
+                InterviewAnalysisLease.interview_id == interview_id,
+                or_(
+                    InterviewAnalysisLease.expires_at < now,
+                    InterviewAnalysisLease.owner == self.owner,
+                    InterviewAnalysisLease.responses_hash != digest,
+                ),
+            ).update(values, synchronize_session=False)
+            if not updated:
+                db.add(InterviewAnalysisLease(interview_id=interview_id, **values))
+            try:
+                db.commit()
+            except IntegrityError:
+                # A live lease exists, or another worker inserted one first
+                db.rollback()
+                return False
+            return True
+        finally:
+            db.close()
+
+    def _renew(self, interview_id: int, digest: str) -> bool:
+        db = SessionLocal()
+        try:
+            renewed = db.query(InterviewAnalysisLease).filter(
+                InterviewAnalysisLease.interview_id == interview_id,
+                InterviewAnalysisLease.owner == self.owner,
+                InterviewAnalysisLease.responses_hash == digest,
+            ).update({"expires_at": time.time() + self.lease_seconds}, synchronize_session=False)
+            db.commit()
+            return bool(renewed)
+        finally:
+            db.close()
+
+    def _release(self, interview_id: int, digest: str):
+        db = SessionLocal()
+        try:
+            db.query(InterviewAnalysisLease).filter(
+                InterviewAnalysisLease.interview_id == interview_id,
+                InterviewAnalysisLease.owner == self.owner,
+                InterviewAnalysisLease.responses_hash == digest,
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    async def _keep_lease(self, interview_id: int, digest: str, task: "asyncio.Task"):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not self._renew(interview_id, digest):
+                # Another worker took the interview over; stop duplicating its work
+                task.cancel()
+                return
+
+    def resume_pending(self):
+        """Start analyses left in 'analyzing' whose lease is missing or expired"""
+        db = SessionLocal()
+        try:
+            pending = (
+                db.query(Interview.id, Interview.questions, Interview.responses)
+                .outerjoin(InterviewAnalysisLease, InterviewAnalysisLease.interview_id == Interview.id)
+                .filter(
+                    Interview.status == ANALYZING,
+                    or_(InterviewAnalysisLease.interview_id.is_(None), InterviewAnalysisLease.expires_at < time.time()),
+                )
+                .all()
+            )
+        finally:
+            db.close()
+        for interview_id, questions, responses in pending:
+            self.submit(interview_id, questions or [], responses or [])
+
+    def start_resumer(self):
+        """Resume orphaned analyses now and every lease period, so a dead worker's jobs are picked up"""
+        if self._resumer is None:
+            self._resumer = asyncio.create_task(self._resume_forever())
+
+    async def _resume_forever(self):
+        while True:
+            try:
+                self.resume_pending()
+            except Exception as e:
+                print(f"Error resuming interview analyses: {e}")
+            await asyncio.sleep(self.lease_seconds)
+
+    async def _run(self, interview_id: int, questions: List[str], responses: List[str]):
+        digest = responses_hash(responses)
+        heartbeat = asyncio.create_task(self._keep_lease(interview_id, digest, asyncio.current_task()))
+        try:
+            analysis = await answer_scoring.finish(interview_id, questions, responses)
+            if analysis is None:
+                analysis = await get_interview_ai().analyze_responses(questions, responses)
+            self._store(interview_id, responses, analysis, COMPLETED)
+        except Exception as e:
+            print(f"Error analyzing interview {interview_id}: {e}")
+            self._store(interview_id, responses, {"error": str(e), "overall_score": 0}, FAILED)
+        finally:
+            heartbeat.cancel()
+            # A restarted analysis owns the entries now; leave them and its waiters alone
+            if self._tasks.get(interview_id) is asyncio.current_task():
+                self._tasks.pop(interview_id, None)
+                self._hashes.pop(interview_id, None)
+                self._release(interview_id, digest)
+                event = self._done.pop(interview_id, None)
+                if event is not None:
+                    event.set()
+
+    def _store(self, interview_id: int, responses: List[str], analysis: Dict[str, Any], status: str):
+        db = SessionLocal()
+        try:
+            interview = db.query(Interview).filter(Interview.id == interview_id).first()
+            if not interview:
+                return
+            if responses_hash(interview.responses) != responses_hash(responses):
+                # Superseded by newer responses, possibly in another worker
+                return
+            interview.analysis = analysis
+            interview.status = status
+            interview.score = analysis.get("overall_score", 0)
+            db.commit()
+        finally:
+            db.close()
+
+
+analysis_jobs = AnalysisJobs()
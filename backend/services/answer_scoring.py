@@ -0,0 +1,140 @@
+"""
+Incremental per-answer interview analysis.
+
+Each answer submitted during an interview is scored in the background as soon
+as it arrives and the result is stored as its own InterviewAnswerAnalysis row,
+so answers scored at the same time (even in different worker processes) never
+overwrite each other. Completing the interview then only aggregates stored results
+instead of sending every answer to the model in one long prompt.
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import InterviewAnswerAnalysis
+from services.registry import get_interview_ai
+
+
+def _answer_hash(response: str) -> str:
+    return hashlib.sha1((response or "").encode("utf-8")).hexdigest()
+
+
+def _is_current(result: Optional[Dict[str, Any]], response: str) -> bool:
+    return bool(result) and result.get("answer_hash") == _answer_hash(response)
+
+
+class AnswerScoring:
+    def __init__(self):
+        self._tasks: Dict[Tuple[int, int], "asyncio.Task"] = {}
+
+    def submit(self, interview_id: int, index: int, question: str, response: str):
+        """Score one answer in the background, replacing any scoring of an older version"""
+        key = (interview_id, index)
+        previous = self._tasks.get(key)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        task = asyncio.create_task(self._score_and_store(interview_id, index, question, response))
+        self._tasks[key] = task
+        task.add_done_callback(lambda t: self._tasks.pop(key, None) if self._tasks.get(key) is t else None)
+
+    def aggregate_if_ready(self, db: Session, interview, responses: List[str]) -> Optional[Dict[str, Any]]:
+        """Aggregated analysis if every answer already has a current stored result, else None"""
+        questions = interview.questions or []
+        if not questions or len(questions) != len(responses):
+            return None
+        if any((interview.id, index) in self._tasks for index in range(len(questions))):
+            return None
+        stored = self._load(interview.id, db)
+        results = [stored.get(str(index)) for index in range(len(questions))]
+        if not all(_is_current(result, response) for result, response in zip(results, responses)):
+            return None
+        return get_interview_ai().aggregate_answer_analyses(results)
+
+    async def finish(self, interview_id: int, questions: List[str], responses: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Wait for pending scoring, score any answers that are missing or stale, then aggregate.
+
+        Returns None if the interview never used incremental scoring, so the
+        caller can fall back to a single analyze_responses call.
+        """
+        pending = [task for (iid, _), task in list(self._tasks.items()) if iid == interview_id]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        stored = self._load(interview_id)
+        if not stored or len(questions) != len(responses):
+            return None
+
+        missing = [
+            index for index, response in enumerate(responses)
+            if not _is_current(stored.get(str(index)), response)
+        ]
+        if missing:
+            await asyncio.gather(*[
+                self._score_and_store(interview_id, index, questions[index], responses[index])
+                for index in missing
+            ])
+            stored = self._load(interview_id)
+
+        results = [stored.get(str(index)) for index in range(len(questions))]
+        if not all(results):
+            return None
+        return get_interview_ai().aggregate_answer_analyses(results)
+
+    async def _score_and_store(self, interview_id: int, index: int, question: str, response: str):
+        result = await get_interview_ai().analyze_answer(question, response)
+        if "error" in result:
+            # Left unstored so finish() retries it
+            return
+        result["answer_hash"] = _answer_hash(response)
+        db = SessionLocal()
+        try:
+            self._store(db, interview_id, index, result)
+        finally:
+            db.close()
+
+    def _store(self, db: Session, interview_id: int, index: int, result: Dict[str, Any]):
+        """Upsert the row for one answer; only that answer's row is written"""
+        for _ in range(2):
+            row = (
+                db.query(InterviewAnswerAnalysis)
+                .filter(
+                    InterviewAnswerAnalysis.interview_id == interview_id,
+                    InterviewAnswerAnalysis.question_index == index,
+                )
+                .first()
+            )
+            if row is None:
+                row = InterviewAnswerAnalysis(interview_id=interview_id, question_index=index)
+                db.add(row)
+            row.answer_hash = result["answer_hash"]
+            row.analysis = result
+            try:
+                db.commit()
+                return
+            except IntegrityError:
+                # Another process inserted this answer's row first; update it instead
+                db.rollback()
+
+    def _load(self, interview_id: int, db: Optional[Session] = None) -> Dict[str, Any]:
+        """Stored results keyed by str(question index)"""
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            rows = (
+                db.query(InterviewAnswerAnalysis.question_index, InterviewAnswerAnalysis.analysis)
+                .filter(InterviewAnswerAnalysis.interview_id == interview_id)
+                .all()
+            )
+            return {str(index): analysis for index, analysis in rows}
+        finally:
+            if own_session:
+                db.close()
+
+
+answer_scoring = AnswerScoring()
@@ -0,0 +1,282 @@
+"""
+Speech metrics from recorded WAV answers, computed locally with NumPy.
+
+The sample data is memory-mapped and read in blocks of AUDIO_BLOCK_FRAMES
+analysis frames, so memory use does not grow with the recording length.
+Each AUDIO_FRAME_MS frame gets an RMS level in dBFS. Frames above
+AUDIO_SILENCE_DBFS count as speech. Silences of at least AUDIO_MIN_PAUSE_MS
+between speech are pauses. Pace is estimated from syllable-like peaks in the
+level envelope, because there is no transcript to count words from.
+
+Analysis runs on a bounded thread pool (NumPy releases the GIL for the heavy
+array work), and results are cached per file version, so the analyze and
+voice/stop endpoints can share one pass over a recording.
+"""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, NamedTuple, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+
+from services import metrics
+
+load_dotenv()
+
+# Configuration
+AUDIO_FRAME_MS = int(os.getenv("AUDIO_FRAME_MS", "20"))
+AUDIO_BLOCK_FRAMES = int(os.getenv("AUDIO_BLOCK_FRAMES", "500"))
+AUDIO_SILENCE_DBFS = float(os.getenv("AUDIO_SILENCE_DBFS", "-40"))
+AUDIO_MIN_PAUSE_MS = int(os.getenv("AUDIO_MIN_PAUSE_MS", "250"))
+AUDIO_LONG_PAUSE_MS = int(os.getenv("AUDIO_LONG_PAUSE_MS", "2000"))
+# A syllable peak must rise this far above the silence threshold
+AUDIO_SYLLABLE_PROMINENCE_DB = float(os.getenv("AUDIO_SYLLABLE_PROMINENCE_DB", "6"))
+AUDIO_MIN_SYLLABLE_GAP_MS = int(os.getenv("AUDIO_MIN_SYLLABLE_GAP_MS", "100"))
+AUDIO_ANALYSIS_WORKERS = int(os.getenv("AUDIO_ANALYSIS_WORKERS", str(min(os.cpu_count() or 2, 4))))
+AUDIO_ANALYSIS_MAX_PENDING = int(os.getenv("AUDIO_ANALYSIS_MAX_PENDING", "16"))
+AUDIO_ANALYSIS_CACHE_SIZE = int(os.getenv("AUDIO_ANALYSIS_CACHE_SIZE", "256"))
+
+SYLLABLES_PER_WORD = 1.5
+TARGET_WORDS_PER_MINUTE = 140
+_PCM, _FLOAT, _EXTENSIBLE = 1, 3, 0xFFFE
+
+
+class AudioFormatError(ValueError):
+    pass
+
+
+class WavInfo(NamedTuple):
+    sample_rate: int
+    channels: int
+    dtype: str
+    bits: int
+    data_offset: int
+    frames: int
+
+
+def read_wav_info(path: str) -> WavInfo:
+    """Locate the sample data of a PCM or float WAV file"""
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12:
+            raise AudioFormatError("Not a WAV file")
+        riff, _, wave = struct.unpack("<4sI4s", header)
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise AudioFormatError("Not a WAV file")
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise AudioFormatError("WAV file has no data chunk")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                body = f.read(size)
+                if size < 16 or len(body) < 16:
+                    raise AudioFormatError("WAV format chunk is truncated")
+                audio_format, channels, sample_rate, _, block_align, bits = struct.unpack("<HHIIHH", body[:16])
+                if audio_format == _EXTENSIBLE and len(body) >= 26:
+                    audio_format = struct.unpack("<H", body[24:26])[0]
+                fmt = (audio_format, channels, sample_rate, block_align, bits)
+                if size & 1:
+                    f.seek(1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise AudioFormatError("WAV data chunk precedes its format")
+                data_offset = f.tell()
+                # Streaming writers leave the size at 0 or 0xFFFFFFFF
+                if size in (0, 0xFFFFFFFF) or data_offset + size > file_size:
+                    size = file_size - data_offset
+                break
+            else:
+                f.seek(size + (size & 1), os.SEEK_CUR)
+
+    audio_format, channels, sample_rate, block_align, bits = fmt
+    dtypes = {(_PCM, 8): "u1", (_PCM, 16): "<i2", (_PCM, 32): "<i4", (_FLOAT, 32): "<f4", (_FLOAT, 64): "<f8"}
+    dtype = dtypes.get((audio_format, bits))
+    if dtype is None or channels < 1 or sample_rate < 1:
+        raise AudioFormatError(f"Unsupported WAV encoding (format {audio_format}, {bits} bit)")
+    if block_align != channels * bits // 8:
+        raise AudioFormatError(f"WAV block alignment {block_align} does not match {channels} x {bits} bit")
+    return WavInfo(sample_rate, channels, dtype, bits, data_offset, size // block_align)
+
+
+def _to_float(block: np.ndarray, info: WavInfo) -> np.ndarray:
+    """Mono float32 samples in [-1, 1]"""
+    samples = block.astype(np.float32)
+    if info.dtype == "u1":
+        samples = (samples - 128.0) / 128.0
+    elif info.dtype[1] == "i":
+        samples /= float(2 ** (info.bits - 1))
+    return samples.mean(axis=1) if info.channels > 1 else samples[:, 0]
+
+
+def analyze_wav(path: str) -> Dict[str, Any]:
+    """Speech metrics of a WAV recording"""
+    info = read_wav_info(path)
+    frame_len = max(int(info.sample_rate * AUDIO_FRAME_MS / 1000), 1)
+    frame_seconds = frame_len / info.sample_rate
+    min_pause = max(round(AUDIO_MIN_PAUSE_MS / 1000 / frame_seconds), 1)
+    long_pause = max(round(AUDIO_LONG_PAUSE_MS / 1000 / frame_seconds), 1)
+    min_gap = max(round(AUDIO_MIN_SYLLABLE_GAP_MS / 1000 / frame_seconds), 1)
+    peak_db = AUDIO_SILENCE_DBFS + AUDIO_SYLLABLE_PROMINENCE_DB
+
+    total_frames = info.frames // frame_len
+    if info.frames:
+        samples = np.memmap(path, dtype=info.dtype, mode="r", offset=info.data_offset, shape=(info.frames, info.channels))
+    else:
+        # np.memmap refuses zero-length maps
+        samples = np.zeros((0, info.channels), dtype=info.dtype)
+
+    voiced_frames = 0
+    voiced_power = silent_power = 0.0
+    clipped = 0
+    peak = 0.0
+    pause_count = pause_frames = longest_pause = long_pauses = 0
+    silence_run, seen_speech = 0, False
+    syllables, last_syllable = 0, -min_gap
+
+    block_len = frame_len * AUDIO_BLOCK_FRAMES
+    for block_start in range(0, total_frames * frame_len, block_len):
+        x = _to_float(samples[block_start:min(block_start + block_len, total_frames * frame_len)], info)
+        frames = x.reshape(-1, frame_len)
+        first_frame = block_start // frame_len
+
+        power = np.einsum("ij,ij->i", frames, frames) / frame_len
+        db = 10.0 * np.log10(power + 1e-12)
+        voiced = db > AUDIO_SILENCE_DBFS
+        voiced_frames += int(voiced.sum())
+        voiced_power += float(power[voiced].sum())
+        silent_power += float(power[~voiced].sum())
+        abs_x = np.abs(x)
+        clipped += int(np.count_nonzero(abs_x >= 0.999))
+        peak = max(peak, float(abs_x.max()))
+
+        # Run-length encode speech/silence; only run boundaries are visited in Python
+        boundaries = np.flatnonzero(np.diff(voiced.view(np.int8))) + 1
+        starts = np.concatenate(([0], boundaries))
+        lengths = np.diff(np.concatenate((starts, [len(voiced)])))
+        for is_voiced, length in zip(voiced[starts], lengths):
+            if not is_voiced:
+                silence_run += int(length)
+                continue
+            # Leading and trailing silence never close, so they are not pauses
+            if seen_speech and silence_run >= min_pause:
+                pause_count += 1
+                pause_frames += silence_run
+                longest_pause = max(longest_pause, silence_run)
+                long_pauses += silence_run >= long_pause
+            silence_run, seen_speech = 0, True
+
+        # Syllable-like local maxima of the smoothed level envelope; a peak
+        # straddling a block boundary may be missed, one frame per block at most
+        envelope = np.convolve(db, np.ones(3) / 3, mode="same")
+        is_peak = (envelope[1:-1] > envelope[:-2]) & (envelope[1:-1] >= envelope[2:]) & (envelope[1:-1] > peak_db)
+        for frame in np.flatnonzero(is_peak) + 1 + first_frame:
+            if frame - last_syllable >= min_gap:
+                syllables += 1
+                last_syllable = frame
+
+    duration = info.frames / info.sample_rate
+    speaking_seconds = voiced_frames * frame_seconds
+    speech_db = 10.0 * np.log10(voiced_power / voiced_frames + 1e-12) if voiced_frames else None
+    silent_frames = total_frames - voiced_frames
+    noise_db = 10.0 * np.log10(silent_power / silent_frames + 1e-12) if silent_frames else None
+    snr_db = speech_db - noise_db if speech_db is not None and noise_db is not None else None
+    words_per_minute = syllables / SYLLABLES_PER_WORD / (duration / 60) if duration else 0.0
+
+    return {
+        "duration_seconds": round(duration, 3),
+        "speaking_seconds": round(speaking_seconds, 3),
+        "speaking_ratio": round(speaking_seconds / duration, 4) if duration else 0.0,
+        "pause_count": pause_count,
+        "long_pause_count": long_pauses,
+        "total_pause_seconds": round(pause_frames * frame_seconds, 3),
+        "mean_pause_seconds": round(pause_frames * frame_seconds / pause_count, 3) if pause_count else 0.0,
+        "longest_pause_seconds": round(longest_pause * frame_seconds, 3),
+        "syllables_per_second": round(syllables / speaking_seconds, 3) if speaking_seconds else 0.0,
+        "estimated_words_per_minute": round(words_per_minute, 1),
+        "speech_level_dbfs": round(float(speech_db), 2) if speech_db is not None else None,
+        "noise_floor_dbfs": round(float(noise_db), 2) if noise_db is not None else None,
+        "snr_db": round(float(snr_db), 2) if snr_db is not None else None,
+        "peak_amplitude": round(peak, 4),
+        "clipping_ratio": round(clipped / (total_frames * frame_len), 6) if total_frames else 0.0,
+        "sample_rate": info.sample_rate,
+        "channels": info.channels,
+    }
+
+
+def speech_scores(features: Dict[str, Any]) -> Dict[str, float]:
+    """0-1 confidence, clarity and pace scores in the shape the analysis endpoints return"""
+    if not features["speaking_seconds"]:
+        return {"confidence": 0.0, "clarity": 0.0, "pace": 0.0}
+    snr = features["snr_db"] if features["snr_db"] is not None else 30.0
+    clarity = np.clip((snr - 10.0) / 30.0, 0.0, 1.0) * (1.0 - min(features["clipping_ratio"] * 100, 0.5))
+    pace = 1.0 - min(abs(features["estimated_words_per_minute"] - TARGET_WORDS_PER_MINUTE) / 100.0, 1.0)
+    confidence = min(features["speaking_ratio"] / 0.6, 1.0) * (1.0 - min(features["long_pause_count"] * 0.1, 0.5))
+    return {"confidence": round(float(confidence), 3), "clarity": round(float(clarity), 3), "pace": round(float(pace), 3)}
+
+
+class AudioAnalysisPool:
+    """Runs recording analysis off the event loop, caching results per file version"""
+
+    def __init__(
+        self,
+        workers: int = AUDIO_ANALYSIS_WORKERS,
+        max_pending: int = AUDIO_ANALYSIS_MAX_PENDING,
+        cache_size: int = AUDIO_ANALYSIS_CACHE_SIZE,
+    ):
+        self.max_pending = max_pending
+        self.cache_size = cache_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="audio-analysis")
+        self._pending = 0
+        self._cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def analyze(self, path: str) -> Dict[str, Any]:
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+            if self._pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Audio analysis is busy, please retry shortly",
+                    headers={"Retry-After": "2"},
+                )
+            self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            features = await loop.run_in_executor(self._executor, analyze_wav, path)
+        finally:
+            with self._lock:
+                self._pending -= 1
+        metrics.observe("audio_analysis", time.perf_counter() - started)
+        with self._lock:
+            self._cache[key] = features
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return features
+
+
+audio_pool = AudioAnalysisPool()
+
+metrics.register_collector(
+    "audio_analysis_pool",
+    lambda: {"pending": audio_pool.pending, "max_pending": audio_pool.max_pending},
+)
@@ -1,16 +1,25 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 from models import User
+from schemas import UserResponse
+from services.cache import cache
+from services.password_pool import password_pool
 import os
+import threading
+import time
 
 # Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -41,6 +50,71 @@ def verify_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+# Verified token -> (exp, claims); entries are dropped once the token expires
+_token_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+def verify_token_cached(token: str) -> dict:
+    """verify_token, remembering verified claims until the token's exp"""
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                _token_cache.move_to_end(token)
+                return entry[1]
+            del _token_cache[token]
+    
+    payload = verify_token(token)
+    exp = payload.get("exp")
+    if exp is not None:
+        with _token_cache_lock:
+            _token_cache[token] = (float(exp), payload)
+            while len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+    return payload
+
+def _user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+def get_user_cached(db: Session, user_id: int) -> Optional[User]:
+    """
+    Load a user by id through a short-TTL cache.
+
+    Returns a transient User built from the cached record. It carries the
+    UserResponse fields only (no password hash or relationships).
+    """
+    def load():
+        user = db.query(User).filter(User.id == user_id).first()
+        return UserResponse.model_validate(user).model_dump(mode="json") if user else None
+    
+    data = cache.get_or_set(_user_key(user_id), load, ttl=USER_CACHE_TTL_SECONDS)
+    if data is None:
+        return None
+    data = dict(data)
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    return User(**data)
+
+def invalidate_user(user_id: int):
+    cache.invalidate(_user_key(user_id))
+
+@event.listens_for(User.is_active, "set", active_history=True)
+@event.listens_for(User.role, "set", active_history=True)
+def _mark_user_stale(target, value, oldvalue, initiator):
+    state = inspect(target)
+    if not state.persistent or value == oldvalue:
+        return
+    if state.session is None:
+        invalidate_user(target.id)
+    else:
+        # Invalidate once the change is committed, so a concurrent read cannot re-cache the old row
+        state.session.info.setdefault("stale_user_ids", set()).add(target.id)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_users(session):
+    for user_id in session.info.pop("stale_user_ids", ()):
+        invalidate_user(user_id)
+
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     user = db.query(User).filter(User.email == email).first()
     if not user:
@@ -49,11 +123,28 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
         return None
     return user
 
+async def authenticate_user_async(db: Session, email: str, password: str) -> Optional[User]:
+    """authenticate_user with bcrypt verification run in the password pool"""
+    user = db.query(User).filter(User.email == email).first()
+    if not user:
+        return None
+    if not await password_pool.run(verify_password, password, user.hashed_password):
+        return None
+    return user
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 def create_user(db: Session, email: str, password: str, full_name: str, role: str = "user") -> User:
     hashed_password = get_password_hash(password)
+    return _insert_user(db, email, hashed_password, full_name, role)
+
+async def create_user_async(db: Session, email: str, password: str, full_name: str, role: str = "user") -> User:
+    """create_user with bcrypt hashing run in the password pool"""
+    hashed_password = await password_pool.run(get_password_hash, password)
+    return _insert_user(db, email, hashed_password, full_name, role)
+
+def _insert_user(db: Session, email: str, hashed_password: str, full_name: str, role: str) -> User:
     db_user = User(
         email=email,
         hashed_password=hashed_password,
@@ -0,0 +1,359 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from models import Candidate, Job
+from schemas import CandidateResponse, JobResponse
+
+load_dotenv()
+
+# Configuration
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "4096"))
+CACHE_KEY_PREFIX = "teamsync:"
+CACHE_REDIS_TIMEOUT_SECONDS = float(os.getenv("CACHE_REDIS_TIMEOUT_SECONDS", "0.1"))
+CACHE_REDIS_RETRY_SECONDS = float(os.getenv("CACHE_REDIS_RETRY_SECONDS", "5"))
+CACHE_MAX_PENDING_DELETES = int(os.getenv("CACHE_MAX_PENDING_DELETES", "10000"))
+
+
+class MemoryBackend:
+    """In-process TTL + LRU store. Values are returned as stored, so callers must not mutate them."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set_many(self, values: Dict[str, Any], ttl: int):
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys: List[str]):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """
+    Redis store shared by every worker. Values are JSON encoded.
+
+    Redis errors never reach callers: a failed read is a miss, so get_or_set
+    falls through to its loader. After an error Redis is bypassed for
+    CACHE_REDIS_RETRY_SECONDS, so an outage blocks a request for at most one
+    short socket timeout per window instead of on every call. Keys whose write
+    or delete was lost are deleted once Redis answers again, so no stale value
+    outlives an outage.
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self._errors = (redis.RedisError,)
+        self.client = redis.Redis.from_url(
+            url,
+            socket_timeout=CACHE_REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=CACHE_REDIS_TIMEOUT_SECONDS,
+        )
+        self.client.ping()
+        self.errors = 0
+        self._down_until = 0.0
+        self._pending_deletes: set = set()
+        self._pending_overflow = False
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not self._available():
+            return {}
+        try:
+            raw = self.client.mget([CACHE_KEY_PREFIX + key for key in keys])
+        except self._errors as e:
+            self._failed("read", e)
+            return {}
+        return {key: json.loads(value) for key, value in zip(keys, raw) if value is not None}
+
+    def set_many(self, values: Dict[str, Any], ttl: int):
+        if not self._available():
+            self._defer_delete(values)
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(CACHE_KEY_PREFIX + key, json.dumps(value), ex=ttl)
+            pipe.execute()
+        except self._errors as e:
+            self._failed("write", e)
+            self._defer_delete(values)
+
+    def delete(self, keys: List[str]):
+        if not keys:
+            return
+        if not self._available():
+            self._defer_delete(keys)
+            return
+        try:
+            self.client.delete(*[CACHE_KEY_PREFIX + key for key in keys])
+        except self._errors as e:
+            self._failed("delete", e)
+            self._defer_delete(keys)
+
+    def clear(self):
+        try:
+            self._clear()
+        except self._errors as e:
+            self._failed("clear", e)
+            with self._lock:
+                self._pending_overflow = True
+
+    def _clear(self):
+        keys = list(self.client.scan_iter(match=CACHE_KEY_PREFIX + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def _available(self) -> bool:
+        """False while bypassing Redis; otherwise first replays deletes lost to an outage"""
+        if time.monotonic() < self._down_until:
+            return False
+        with self._lock:
+            pending, overflow = self._pending_deletes, self._pending_overflow
+            self._pending_deletes, self._pending_overflow = set(), False
+        if not pending and not overflow:
+            return True
+        try:
+            if overflow:
+                self._clear()
+            else:
+                self.client.delete(*[CACHE_KEY_PREFIX + key for key in pending])
+            return True
+        except self._errors as e:
+            self._failed("replaying deletes", e)
+            with self._lock:
+                self._pending_deletes |= pending
+                self._pending_overflow |= overflow
+            return False
+
+    def _defer_delete(self, keys):
+        with self._lock:
+            if self._pending_overflow:
+                return
+            self._pending_deletes.update(keys)
+            if len(self._pending_deletes) > CACHE_MAX_PENDING_DELETES:
+                # Too many to track; drop every key once Redis is back
+                self._pending_deletes.clear()
+                self._pending_overflow = True
+
+    def _failed(self, operation: str, error: Exception):
+        self.errors += 1
+        self._down_until = time.monotonic() + CACHE_REDIS_RETRY_SECONDS
+        print(f"Redis cache {operation} failed, bypassing it for {CACHE_REDIS_RETRY_SECONDS}s: {error}")
+
+
+class _Flight:
+    """A load in progress that concurrent misses for the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class Cache:
+    """Read-through cache with single-flight loading on top of a pluggable backend"""
+
+    def __init__(self, backend, default_ttl: int = CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so a load that raced with it is not written back
+        self._epoch = 0
+
+    def get(self, key: str) -> Any:
+        return self.backend.get_many([key]).get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        self.backend.set_many({key: value}, ttl or self.default_ttl)
+
+    def invalidate(self, *keys: str):
+        with self._lock:
+            self._epoch += 1
+        self.backend.delete(list(keys))
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+        self.backend.clear()
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """Return the cached value for key, calling loader once on a miss"""
+        return self.get_or_set_many([key], lambda keys: {key: loader()}, ttl).get(key)
+
+    def get_or_set_many(
+        self,
+        keys: List[str],
+        loader: Callable[[List[str]], Dict[str, Any]],
+        ttl: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return cached values for keys, loading all misses with a single loader call.
+
+        Keys another caller is already loading are waited on instead of loaded again.
+        Loader results that are None are returned but not cached.
+        """
+        results = self.backend.get_many(keys)
+        missing = [key for key in keys if key not in results]
+        if not missing:
+            return results
+
+        led: Dict[str, _Flight] = {}
+        followed: Dict[str, _Flight] = {}
+        with self._lock:
+            epoch = self._epoch
+            for key in missing:
+                flight = self._flights.get(key)
+                if flight is None:
+                    led[key] = self._flights[key] = _Flight()
+                else:
+                    followed[key] = flight
+
+        if led:
+            try:
+                loaded = loader(list(led))
+                fresh = {key: loaded[key] for key in led if loaded.get(key) is not None}
+                with self._lock:
+                    stale = epoch != self._epoch
+                if fresh and not stale:
+                    self.backend.set_many(fresh, ttl or self.default_ttl)
+                for key, flight in led.items():
+                    flight.value = loaded.get(key)
+                    results[key] = flight.value
+            except BaseException as e:
+                for flight in led.values():
+                    flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    for key in led:
+                        self._flights.pop(key, None)
+                for flight in led.values():
+                    flight.done.set()
+
+        for key, flight in followed.items():
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            results[key] = flight.value
+
+        return {key: results[key] for key in keys if results.get(key) is not None}
+
+
+def _create_backend():
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            return RedisBackend(redis_url)
+        except Exception as e:
+            print(f"Redis cache unavailable, using in-process cache: {e}")
+    return MemoryBackend()
+
+
+cache = Cache(_create_backend())
+
+
+# Jobs and candidates
+def _job_key(job_id: int) -> str:
+    return f"job:{job_id}"
+
+
+ACTIVE_JOBS_KEY = "jobs:active"
+
+
+def _candidate_key(candidate_id: int) -> str:
+    return f"candidate:{candidate_id}"
+
+
+def serialize_job(job: Job) -> Dict[str, Any]:
+    return JobResponse.model_validate(job).model_dump(mode="json")
+
+
+def serialize_candidate(candidate: Candidate) -> Dict[str, Any]:
+    return CandidateResponse.model_validate(candidate).model_dump(mode="json")
+
+
+def get_cached_job(db: Session, job_id: int) -> Optional[Dict[str, Any]]:
+    """Serialized job by id, or None if it does not exist"""
+    def load():
+        job = db.query(Job).filter(Job.id == job_id).first()
+        return serialize_job(job) if job else None
+
+    return cache.get_or_set(_job_key(job_id), load)
+
+
+def get_cached_active_jobs(db: Session) -> List[Dict[str, Any]]:
+    """Serialized list of every job with status 'active'"""
+    def load():
+        return [serialize_job(job) for job in db.query(Job).filter(Job.status == "active").all()]
+
+    return cache.get_or_set(ACTIVE_JOBS_KEY, load) or []
+
+
+def get_cached_candidates(db: Session, candidate_ids: List[int]) -> List[Dict[str, Any]]:
+    """Serialized candidate records (including matching features) in candidate_ids order"""
+    keys = {_candidate_key(candidate_id): candidate_id for candidate_id in candidate_ids}
+
+    def load(missing_keys):
+        ids = [keys[key] for key in missing_keys]
+        rows = db.query(Candidate).filter(Candidate.id.in_(ids)).all()
+        return {_candidate_key(row.id): serialize_candidate(row) for row in rows}
+
+    found = cache.get_or_set_many(list(keys), load)
+    return [found[key] for key in keys if key in found]
+
+
+def cache_job(job: Job):
+    """Store a freshly created or updated job and drop the lists it appears in"""
+    cache.invalidate(ACTIVE_JOBS_KEY)
+    cache.set(_job_key(job.id), serialize_job(job))
+
+
+def invalidate_job(job_id: int):
+    cache.invalidate(_job_key(job_id), ACTIVE_JOBS_KEY)
+
+
+def cache_candidate(candidate: Candidate):
+    cache.set(_candidate_key(candidate.id), serialize_candidate(candidate))
+
+
+def invalidate_candidate(candidate_id: int):
+    cache.invalidate(_candidate_key(candidate_id))
@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Trips open when the recent error rate or p95 latency crosses a threshold.
+
+    While open every call is refused so callers can serve their fallback
+    straight away. After cooldown_seconds a single probe call is let through
+    (half-open); its outcome closes the breaker or opens it again.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 50,
+        min_calls: int = 10,
+        max_error_rate: float = 0.5,
+        max_p95_seconds: float = 10.0,
+        cooldown_seconds: float = 30.0,
+    ):
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.max_error_rate = max_error_rate
+        self.max_p95_seconds = max_p95_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        self.times_opened = 0
+        self._samples: deque = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Optional[str]:
+        """Return "normal" or "probe" if a call may proceed, None if it must be refused"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                    return None
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    return None
+                self._probe_in_flight = True
+                return "probe"
+            return "normal"
+
+    def record(self, permit: str, latency: float, ok: bool):
+        with self._lock:
+            if permit == "probe":
+                self._probe_in_flight = False
+                if ok and latency <= self.max_p95_seconds:
+                    self._close()
+                else:
+                    self._open()
+                return
+            if self.state != CLOSED:
+                # A call admitted before the breaker opened; the window restarts on close
+                return
+            self._samples.append((latency, ok))
+            if len(self._samples) >= self.min_calls and (
+                self._error_rate() >= self.max_error_rate
+                or self._p95() >= self.max_p95_seconds
+            ):
+                self._open()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "times_opened": self.times_opened,
+                "window_calls": len(self._samples),
+                "error_rate": round(self._error_rate(), 3),
+                "p95_seconds": round(self._p95(), 3),
+            }
+
+    def _open(self):
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def _close(self):
+        self.state = CLOSED
+        self._samples.clear()
+
+    def _error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    def _p95(self) -> float:
+        if not self._samples:
+            return 0.0
+        latencies = sorted(latency for latency, _ in self._samples)
+        return latencies[int(0.95 * (len(latencies) - 1))]
@@ -0,0 +1,104 @@
+"""
+Server-sent event feed for the admin dashboard.
+
+Handlers publish small delta events (an interview completed, an analysis is
+ready) and every connected dashboard receives them as they happen, instead of
+polling and re-downloading full lists. Recent events are kept in a ring
+buffer. A client that reconnects with Last-Event-ID gets everything it missed;
+if it fell further behind than the buffer, or the server restarted, it gets a
+"reset" event telling it to refetch once.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+EVENT_FEED_BUFFER = int(os.getenv("EVENT_FEED_BUFFER", "1000"))
+EVENT_FEED_HEARTBEAT_SECONDS = float(os.getenv("EVENT_FEED_HEARTBEAT_SECONDS", "15"))
+# Tells EventSource how long to wait before reconnecting
+EVENT_FEED_RETRY_MS = int(os.getenv("EVENT_FEED_RETRY_MS", "3000"))
+
+
+def format_event(event_id: str, event: str, data: Any) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class EventFeed:
+    def __init__(self, buffer_size: int = EVENT_FEED_BUFFER):
+        self._events: Deque[Tuple[int, str, Dict[str, Any]]] = deque(maxlen=buffer_size)
+        self._last_id = 0
+        # Event ids are "<boot>-<seq>" so ids from before a restart are recognized as stale
+        self._boot = f"{int(time.time() * 1000):x}"
+        self._changed: Optional[asyncio.Event] = None
+        self.subscribers = 0
+
+    def publish(self, event: str, data: Dict[str, Any]) -> int:
+        """Record an event and wake every subscriber. Call from the event loop."""
+        self._last_id += 1
+        self._events.append((self._last_id, event, data))
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+        return self._last_id
+
+    def event_id(self, seq: int) -> str:
+        return f"{self._boot}-{seq}"
+
+    def _parse_cursor(self, last_event_id: Optional[str]) -> int:
+        """Sequence number to resume after, or -1 if last_event_id is not from this feed"""
+        if not last_event_id:
+            return self._last_id
+        boot, _, seq = last_event_id.partition("-")
+        if boot != self._boot or not seq.isdigit():
+            return -1
+        return int(seq)
+
+    def _wait_handle(self) -> asyncio.Event:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    def _since(self, last_id: int):
+        if not self._events:
+            return []
+        # Ids in the buffer are consecutive, so the start index is arithmetic
+        start = max(last_id + 1 - self._events[0][0], 0)
+        return list(itertools.islice(self._events, start, None))
+
+    async def stream(self, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """SSE text for one subscriber, starting after last_event_id"""
+        self.subscribers += 1
+        try:
+            yield f"retry: {EVENT_FEED_RETRY_MS}\n\n"
+            cursor = self._parse_cursor(last_event_id)
+            oldest = self._events[0][0] if self._events else self._last_id + 1
+            if cursor > self._last_id or cursor < oldest - 1:
+                # Unknown position (restart or too far behind): client must refetch
+                yield format_event(self.event_id(self._last_id), "reset", {})
+                cursor = self._last_id
+
+            while True:
+                for event_id, event, data in self._since(cursor):
+                    yield format_event(self.event_id(event_id), event, data)
+                    cursor = event_id
+                changed = self._wait_handle()
+                if self._last_id > cursor:
+                    continue
+                try:
+                    await asyncio.wait_for(changed.wait(), EVENT_FEED_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            self.subscribers -= 1
+
+
+admin_feed = EventFeed()
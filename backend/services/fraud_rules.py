@@ -0,0 +1,154 @@
+"""
+Declarative fraud rules evaluated as NumPy vector operations.
+
+Each rule compares one answer feature against a threshold. Rules are compiled
+once into per-operator column/threshold arrays, so a whole interview, or a
+backlog of interviews, is checked with a handful of array comparisons instead
+of one if-chain per answer. A feature that is missing from an answer is NaN
+and never triggers its rule.
+
+Thresholds are shared by every endpoint (they used to disagree between answer
+submission and interview analysis) and can be tuned with FRAUD_* env vars.
+"""
+
+import os
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+FRAUD_MIN_VOICE_CONFIDENCE = float(os.getenv("FRAUD_MIN_VOICE_CONFIDENCE", "0.6"))
+FRAUD_MIN_AUDIO_SECONDS = float(os.getenv("FRAUD_MIN_AUDIO_SECONDS", "5"))
+FRAUD_MIN_ANSWER_CHARS = int(os.getenv("FRAUD_MIN_ANSWER_CHARS", "20"))
+FRAUD_MIN_ATTENTION = float(os.getenv("FRAUD_MIN_ATTENTION", "50"))
+FRAUD_MAX_DISTRACTIONS = float(os.getenv("FRAUD_MAX_DISTRACTIONS", "10"))
+
+FEATURES = ("voice_confidence", "audio_duration", "answer_chars", "attention", "distraction_count")
+
+
+class FraudRule(NamedTuple):
+    name: str
+    feature: str
+    op: str  # "<" or ">"
+    threshold: float
+    red_flag: str
+    weight: float
+
+
+DEFAULT_RULES = (
+    FraudRule("low_voice_confidence", "voice_confidence", "<", FRAUD_MIN_VOICE_CONFIDENCE, "Low voice confidence", 0.25),
+    FraudRule("short_audio", "audio_duration", "<", FRAUD_MIN_AUDIO_SECONDS, "Very short response", 0.2),
+    FraudRule("brief_text", "answer_chars", "<", FRAUD_MIN_ANSWER_CHARS, "Very brief text response", 0.15),
+    FraudRule("low_attention", "attention", "<", FRAUD_MIN_ATTENTION, "Low attention score", 0.25),
+    FraudRule("high_distraction", "distraction_count", ">", FRAUD_MAX_DISTRACTIONS, "High distraction count", 0.2),
+)
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def answer_features(data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Features of one answer payload.
+
+    Understands the /answer shape (answer, audio_duration, voice_confidence,
+    eye_tracking) and the /analyze shape (duration, eye_tracking_data).
+    """
+    eye_tracking = data.get("eye_tracking") or data.get("eye_tracking_data") or {}
+    answer = data.get("answer", data.get("answer_text"))
+    return {
+        "voice_confidence": _number(data.get("voice_confidence")),
+        "audio_duration": _number(data.get("audio_duration", data.get("duration"))),
+        "answer_chars": float(len(answer)) if isinstance(answer, str) else np.nan,
+        "attention": _number(eye_tracking.get("attentionScore")),
+        "distraction_count": _number(eye_tracking.get("distractionCount")),
+    }
+
+
+class FraudRuleEngine:
+    def __init__(self, rules: Sequence[FraudRule] = DEFAULT_RULES):
+        self.rules = tuple(rules)
+        if not all(rule.op in ("<", ">") for rule in self.rules):
+            raise ValueError("Fraud rules support only '<' and '>'")
+        columns = np.array([FEATURES.index(rule.feature) for rule in self.rules], dtype=np.intp)
+        thresholds = np.array([rule.threshold for rule in self.rules], dtype=np.float64)
+        less = np.array([rule.op == "<" for rule in self.rules], dtype=bool)
+        self._lt = (np.flatnonzero(less), columns[less], thresholds[less])
+        self._gt = (np.flatnonzero(~less), columns[~less], thresholds[~less])
+        self._weights = np.array([rule.weight for rule in self.rules], dtype=np.float64)
+        self._red_flags = np.array([rule.red_flag for rule in self.rules], dtype=object)
+
+    def feature_matrix(self, rows: Sequence[Dict[str, float]]) -> np.ndarray:
+        matrix = np.full((len(rows), len(FEATURES)), np.nan)
+        for i, row in enumerate(rows):
+            matrix[i] = [row.get(feature, np.nan) for feature in FEATURES]
+        return matrix
+
+    def flags(self, features: np.ndarray) -> np.ndarray:
+        """Boolean (answers x rules) matrix of triggered rules"""
+        flags = np.zeros((features.shape[0], len(self.rules)), dtype=bool)
+        for (rule_index, columns, thresholds), compare in ((self._lt, np.less), (self._gt, np.greater)):
+            if len(rule_index):
+                # NaN compares False, so missing features never trigger
+                flags[:, rule_index] = compare(features[:, columns], thresholds)
+        return flags
+
+    def confidence(self, flags: np.ndarray) -> np.ndarray:
+        return np.clip(1.0 - flags @ self._weights, 0.0, 1.0)
+
+    def evaluate(self, answers: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Per-answer result for answer payloads"""
+        features = self.feature_matrix([answer_features(answer) for answer in answers])
+        flags = self.flags(features)
+        confidence = self.confidence(flags)
+        return [self._result(row_flags, score) for row_flags, score in zip(flags, confidence)]
+
+    def evaluate_interviews(
+        self,
+        interviews: Sequence[Sequence[Dict[str, Any]]],
+        interview_level: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        One result per interview, from all their answers in a single batch.
+
+        A rule is flagged for an interview if any of its answers triggers it; the
+        confidence is the mean of the per-answer confidences. interview_level
+        optionally gives one payload per interview (e.g. the whole-interview eye
+        tracking summary) that is checked once, not counted as an answer: its
+        flags are added and their weights come off the mean confidence.
+        """
+        counts = np.array([len(answers) for answers in interviews], dtype=np.intp)
+        rows = [answer_features(answer) for answers in interviews for answer in answers]
+        flags = self.flags(self.feature_matrix(rows))
+        confidence = self.confidence(flags)
+
+        interview_flags = np.zeros((len(interviews), len(self.rules)), dtype=bool)
+        scores = np.ones(len(interviews))
+        present = np.flatnonzero(counts)
+        if len(present):
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[present]
+            interview_flags[present] = np.logical_or.reduceat(flags, starts, axis=0)
+            scores[present] = np.add.reduceat(confidence, starts) / counts[present]
+        if interview_level is not None:
+            level_flags = self.flags(self.feature_matrix([answer_features(data or {}) for data in interview_level]))
+            interview_flags |= level_flags
+            scores = np.clip(scores - level_flags @ self._weights, 0.0, 1.0)
+        return [self._result(row_flags, score) for row_flags, score in zip(interview_flags, scores)]
+
+    def _result(self, flags: np.ndarray, confidence: float) -> Dict[str, Any]:
+        return {
+            "is_authentic": not flags.any(),
+            "confidence_score": round(float(confidence), 4),
+            "red_flags": list(self._red_flags[flags]),
+            "rules": {rule.name: bool(flag) for rule, flag in zip(self.rules, flags)},
+        }
+
+
+fraud_engine = FraudRuleEngine()
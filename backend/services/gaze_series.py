@@ -0,0 +1,268 @@
+"""
+Compact on-disk time series of gaze and attention samples per interview.
+
+Raw samples are appended to a fixed-width binary file of typed NumPy records.
+At write time they are also rolled up into coarser buckets, one file per
+resolution in GAZE_LEVELS_MS, so a dashboard range query reads at most a few
+hundred rows from the coarsest level that fits instead of scanning raw data.
+Files are opened as read-only memmaps for queries.
+
+Samples for an interview must arrive in time order; samples older than the last
+stored one are dropped. The newest, still-filling bucket of each level is held
+in memory and written out when it closes or when the writer is evicted.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+GAZE_SERIES_DIR = os.getenv("GAZE_SERIES_DIR", "uploads/gaze")
+GAZE_LEVELS_MS = [int(level) for level in os.getenv("GAZE_LEVELS_MS", "1000,10000,60000").split(",")]
+GAZE_MAX_OPEN_WRITERS = int(os.getenv("GAZE_MAX_OPEN_WRITERS", "256"))
+GAZE_DEFAULT_MAX_POINTS = int(os.getenv("GAZE_DEFAULT_MAX_POINTS", "500"))
+
+FLAG_DISTRACTED = 1
+
+RAW_DTYPE = np.dtype([
+    ("t_ms", "<u4"),
+    ("attention", "<f4"),
+    ("gaze_x", "<f4"),
+    ("gaze_y", "<f4"),
+    ("flags", "u1"),
+])
+
+BUCKET_DTYPE = np.dtype([
+    ("t_ms", "<u4"),
+    ("count", "<u4"),
+    ("attention_sum", "<f8"),
+    ("attention_min", "<f4"),
+    ("attention_max", "<f4"),
+    ("distracted", "<u4"),
+])
+
+
+def _read(path: str, dtype: np.dtype) -> np.ndarray:
+    """Memmap a record file, or an empty array if it is missing or empty"""
+    try:
+        if os.path.getsize(path) >= dtype.itemsize:
+            return np.memmap(path, dtype=dtype, mode="r", shape=(os.path.getsize(path) // dtype.itemsize,))
+    except OSError:
+        pass
+    return np.empty(0, dtype=dtype)
+
+
+def _append(path: str, records: np.ndarray):
+    if len(records):
+        with open(path, "ab") as f:
+            f.write(records.tobytes())
+
+
+def _bucketize(samples: np.ndarray, width: int) -> np.ndarray:
+    """Roll time-ordered raw samples up into buckets of width ms"""
+    starts = (samples["t_ms"] // width) * width
+    boundaries = np.flatnonzero(np.diff(starts)) + 1
+    index = np.concatenate(([0], boundaries))
+    attention = samples["attention"].astype(np.float64)
+    buckets = np.empty(len(index), dtype=BUCKET_DTYPE)
+    buckets["t_ms"] = starts[index]
+    buckets["count"] = np.diff(np.append(index, len(samples)))
+    buckets["attention_sum"] = np.add.reduceat(attention, index)
+    buckets["attention_min"] = np.minimum.reduceat(samples["attention"], index)
+    buckets["attention_max"] = np.maximum.reduceat(samples["attention"], index)
+    buckets["distracted"] = np.add.reduceat((samples["flags"] & FLAG_DISTRACTED).astype(np.uint32), index)
+    return buckets
+
+
+def _merge_bucket(a: np.void, b: np.void) -> np.ndarray:
+    merged = np.empty(1, dtype=BUCKET_DTYPE)
+    merged["t_ms"] = a["t_ms"]
+    merged["count"] = a["count"] + b["count"]
+    merged["attention_sum"] = a["attention_sum"] + b["attention_sum"]
+    merged["attention_min"] = min(a["attention_min"], b["attention_min"])
+    merged["attention_max"] = max(a["attention_max"], b["attention_max"])
+    merged["distracted"] = a["distracted"] + b["distracted"]
+    return merged
+
+
+def _coarsen(buckets: np.ndarray, factor: int) -> np.ndarray:
+    """Merge every factor consecutive buckets into one"""
+    index = np.arange(0, len(buckets), factor)
+    coarse = np.empty(len(index), dtype=BUCKET_DTYPE)
+    coarse["t_ms"] = buckets["t_ms"][index]
+    coarse["count"] = np.add.reduceat(buckets["count"], index)
+    coarse["attention_sum"] = np.add.reduceat(buckets["attention_sum"], index)
+    coarse["attention_min"] = np.minimum.reduceat(buckets["attention_min"], index)
+    coarse["attention_max"] = np.maximum.reduceat(buckets["attention_max"], index)
+    coarse["distracted"] = np.add.reduceat(buckets["distracted"], index)
+    return coarse
+
+
+class _SeriesWriter:
+    """Appends one interview's samples and keeps each level's open bucket in memory"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.raw_path = os.path.join(directory, "raw.bin")
+        raw = _read(self.raw_path, RAW_DTYPE)
+        self.last_t_ms: Optional[int] = int(raw["t_ms"][-1]) if len(raw) else None
+        del raw
+        # Reopening: pull the last (possibly partial) bucket of each level back into memory
+        self.open: Dict[int, Optional[np.ndarray]] = {}
+        for width in GAZE_LEVELS_MS:
+            path = self.level_path(width)
+            buckets = _read(path, BUCKET_DTYPE)
+            if len(buckets):
+                self.open[width] = np.array(buckets[-1:])
+                del buckets
+                os.truncate(path, os.path.getsize(path) - BUCKET_DTYPE.itemsize)
+            else:
+                self.open[width] = None
+
+    def level_path(self, width: int) -> str:
+        return os.path.join(self.directory, f"level_{width}.bin")
+
+    def append(self, samples: np.ndarray) -> int:
+        samples = samples[np.argsort(samples["t_ms"], kind="stable")]
+        samples = samples[np.isfinite(samples["attention"])]
+        if self.last_t_ms is not None:
+            samples = samples[samples["t_ms"] >= self.last_t_ms]
+        if not len(samples):
+            return 0
+        _append(self.raw_path, samples)
+        self.last_t_ms = int(samples["t_ms"][-1])
+
+        for width in GAZE_LEVELS_MS:
+            buckets = _bucketize(samples, width)
+            pending = self.open[width]
+            if pending is not None:
+                if pending["t_ms"][0] == buckets["t_ms"][0]:
+                    buckets[:1] = _merge_bucket(pending[0], buckets[0])
+                else:
+                    _append(self.level_path(width), pending)
+            _append(self.level_path(width), buckets[:-1])
+            self.open[width] = buckets[-1:].copy()
+        return len(samples)
+
+    def close(self):
+        for width, pending in self.open.items():
+            if pending is not None:
+                _append(self.level_path(width), pending)
+        self.open = {width: None for width in self.open}
+
+
+class GazeSeriesStore:
+    """Per-interview gaze series, sharded on disk by interview id"""
+
+    def __init__(self, root: str = GAZE_SERIES_DIR, max_open_writers: int = GAZE_MAX_OPEN_WRITERS):
+        self.root = root
+        self.max_open_writers = max_open_writers
+        self._writers: "OrderedDict[int, _SeriesWriter]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _directory(self, interview_id: int) -> str:
+        return os.path.join(self.root, f"{interview_id % 256:02x}", str(interview_id))
+
+    def _writer(self, interview_id: int) -> _SeriesWriter:
+        writer = self._writers.get(interview_id)
+        if writer is None:
+            writer = self._writers[interview_id] = _SeriesWriter(self._directory(interview_id))
+            while len(self._writers) > self.max_open_writers:
+                _, evicted = self._writers.popitem(last=False)
+                evicted.close()
+        self._writers.move_to_end(interview_id)
+        return writer
+
+    def append(self, interview_id: int, samples: List[tuple]) -> int:
+        """Store (t_ms, attention, gaze_x, gaze_y, flags) samples; returns how many were kept"""
+        records = np.array(samples, dtype=RAW_DTYPE) if samples else np.empty(0, dtype=RAW_DTYPE)
+        with self._lock:
+            return self._writer(interview_id).append(records)
+
+    def close(self, interview_id: int):
+        """Flush open buckets, e.g. when the interview completes"""
+        with self._lock:
+            writer = self._writers.pop(interview_id, None)
+            if writer is not None:
+                writer.close()
+
+    def query(
+        self,
+        interview_id: int,
+        start_ms: int = 0,
+        end_ms: Optional[int] = None,
+        max_points: int = GAZE_DEFAULT_MAX_POINTS,
+    ) -> Dict[str, Any]:
+        """
+        Attention series over [start_ms, end_ms) with at most max_points points.
+
+        Raw samples are returned when they fit; otherwise the finest level that
+        fits, coarsened further if even the coarsest level does not.
+        """
+        max_points = max(1, max_points)
+        end_ms = end_ms if end_ms is not None else 2 ** 32
+        directory = self._directory(interview_id)
+        with self._lock:
+            writer = self._writers.get(interview_id)
+            open_buckets = dict(writer.open) if writer else {}
+
+            raw = _read(os.path.join(directory, "raw.bin"), RAW_DTYPE)
+            lo, hi = np.searchsorted(raw["t_ms"], [start_ms, end_ms])
+            if hi - lo <= max_points:
+                window = np.array(raw[lo:hi])
+                return {
+                    "interview_id": interview_id,
+                    "resolution_ms": 0,
+                    "points": [
+                        {
+                            "t_ms": int(row["t_ms"]),
+                            "attention": round(float(row["attention"]), 2),
+                            "distracted": bool(row["flags"] & FLAG_DISTRACTED),
+                        }
+                        for row in window
+                    ],
+                }
+
+            for width in GAZE_LEVELS_MS:
+                buckets = self._level(directory, width, open_buckets.get(width), start_ms, end_ms)
+                if len(buckets) <= max_points:
+                    break
+            factor = -(-len(buckets) // max_points)
+            if factor > 1:
+                buckets = _coarsen(buckets, factor)
+                width *= factor
+
+        return {
+            "interview_id": interview_id,
+            "resolution_ms": width,
+            "points": [
+                {
+                    "t_ms": int(row["t_ms"]),
+                    "attention_mean": round(float(row["attention_sum"] / row["count"]), 2),
+                    "attention_min": round(float(row["attention_min"]), 2),
+                    "attention_max": round(float(row["attention_max"]), 2),
+                    "distracted_ratio": round(float(row["distracted"] / row["count"]), 4),
+                    "count": int(row["count"]),
+                }
+                for row in buckets
+            ],
+        }
+
+    def _level(self, directory: str, width: int, pending, start_ms: int, end_ms: int) -> np.ndarray:
+        stored = _read(os.path.join(directory, f"level_{width}.bin"), BUCKET_DTYPE)
+        bucket_start = (start_ms // width) * width
+        lo, hi = np.searchsorted(stored["t_ms"], [bucket_start, end_ms])
+        buckets = np.array(stored[lo:hi])
+        if pending is not None and bucket_start <= pending["t_ms"][0] < end_ms:
+            buckets = np.concatenate([buckets, pending])
+        return buckets
+
+
+gaze_series = GazeSeriesStore()
@@ -1,16 +1,25 @@
 from typing import List, Dict, Any
-import openai
 import os
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
+from database import SessionLocal
 from models import Candidate, Job
+from services.llm import chat_completion
+from services.question_cache import EXPERIENCE_BANDS, question_cache, skill_profile
 
 load_dotenv()
 
-class InterviewAI:
-    def __init__(self):
-        openai.api_key = os.getenv("OPENAI_API_KEY")
+QUESTION_PREWARM_LIMIT = int(os.getenv("QUESTION_PREWARM_LIMIT", "8"))
+
+SCORE_KEYS = [
+    "overall_score",
+    "technical_knowledge",
+    "communication_skills",
+    "problem_solving",
+    "cultural_fit",
+]
 
+class InterviewAI:
     async def generate_questions(self, candidate_id: int, job_id: int, db: Session) -> List[str]:
         """Generate interview questions based on candidate and job"""
         try:
@@ -21,48 +30,74 @@ class InterviewAI:
             if not candidate or not job:
                 return self._get_default_questions()
             
-            # Generate questions using AI
-            prompt = f"""
-            Generate 5 interview questions for this candidate and job:
-            
-            Candidate:
-            - Name: {candidate.name}
-            - Skills: {', '.join(candidate.skills or [])}
-            - Experience: {candidate.experience_years} years
-            - Education: {candidate.education or 'Not specified'}
-            
-            Job:
-            - Title: {job.title}
-            - Description: {job.description}
-            - Required Skills: {', '.join(job.skills_required or [])}
-            - Experience Required: {job.experience_required} years
-            
-            Generate 5 questions:
-            1. One technical question related to the role
-            2. One behavioral question
-            3. One situational question
-            4. One question about their experience
-            5. One question about their motivation
-            
-            Return only the questions, one per line, without numbering.
-            """
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.7
+            profile = skill_profile(candidate.skills, candidate.experience_years, job)
+            return await question_cache.get_or_generate(
+                db, job, profile, self._generate_questions_for_profile
             )
             
-            questions = response.choices[0].message.content.strip().split('\n')
-            questions = [q.strip() for q in questions if q.strip()]
-            
-            return questions[:5]  # Ensure we have exactly 5 questions
-            
         except Exception as e:
             print(f"Error generating questions: {e}")
             return self._get_default_questions()
 
+    async def prewarm_questions(self, job_id: int, limit: int = QUESTION_PREWARM_LIMIT):
+        """Fill the question cache for a job's likely candidate profiles"""
+        db = SessionLocal()
+        try:
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if not job:
+                return
+            
+            # Existing candidates first, then an ideal candidate in every experience band
+            profiles = {}
+            for skills, years in db.query(Candidate.skills, Candidate.experience_years):
+                profile = skill_profile(skills, years, job)
+                profiles.setdefault(profile["fingerprint"], profile)
+            for _, low, _ in EXPERIENCE_BANDS:
+                profile = skill_profile(job.skills_required, low, job)
+                profiles.setdefault(profile["fingerprint"], profile)
+            
+            for profile in list(profiles.values())[:limit]:
+                await question_cache.get_or_generate(
+                    db, job, profile, self._generate_questions_for_profile
+                )
+        except Exception as e:
+            print(f"Error pre-warming questions for job {job_id}: {e}")
+        finally:
+            db.close()
+
+    async def _generate_questions_for_profile(self, job, profile: Dict[str, Any]) -> List[str]:
+        """Ask the model for questions; the prompt uses only the cached profile fields"""
+        prompt = f"""
+        Generate 5 interview questions for this candidate profile and job:
+        
+        Candidate:
+        - Experience level: {profile['band']}
+        - Required skills they have: {', '.join(profile['matched_skills']) or 'None'}
+        - Required skills they lack: {', '.join(profile['missing_skills']) or 'None'}
+        
+        Job:
+        - Title: {job.title}
+        - Description: {job.description}
+        - Required Skills: {', '.join(job.skills_required or [])}
+        - Experience Required: {job.experience_required} years
+        
+        Generate 5 questions:
+        1. One technical question related to the role
+        2. One behavioral question
+        3. One situational question
+        4. One question about their experience
+        5. One question about their motivation
+        
+        Return only the questions, one per line, without numbering.
+        """
+        
+        response = await chat_completion(prompt, max_tokens=500, temperature=0.7, operation="questions")
+        
+        questions = response.split('\n')
+        questions = [q.strip() for q in questions if q.strip()]
+        
+        return questions[:5]  # Ensure we have exactly 5 questions
+
     async def analyze_responses(self, questions: List[str], responses: List[str]) -> Dict[str, Any]:
         """Analyze interview responses and provide scoring"""
         try:
@@ -94,14 +129,7 @@ class InterviewAI:
             - Recommendation: [Hire/Maybe/No Hire with brief reason]
             """
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": analysis_prompt}],
-                max_tokens=800,
-                temperature=0.3
-            )
-            
-            analysis_text = response.choices[0].message.content.strip()
+            analysis_text = await chat_completion(analysis_prompt, max_tokens=800, temperature=0.3, operation="analysis")
             
             # Parse the analysis
             analysis = self._parse_analysis(analysis_text)
@@ -122,6 +150,61 @@ class InterviewAI:
                 "recommendation": "Unable to analyze"
             }
 
+    async def analyze_answer(self, question: str, response: str) -> Dict[str, Any]:
+        """Score a single answer; results are combined later by aggregate_answer_analyses"""
+        try:
+            answer_prompt = f"""
+            Evaluate this single interview answer:
+            
+            Question: {question}
+            Response: {response}
+            
+            Provide analysis in this format:
+            - Technical Knowledge: [score 0-10]
+            - Communication Skills: [score 0-10]
+            - Problem Solving: [score 0-10]
+            - Cultural Fit: [score 0-10]
+            - Overall Score: [score 0-10]
+            - Strengths: [list key strengths]
+            - Areas for Improvement: [list areas to improve]
+            """
+            
+            answer_text = await chat_completion(answer_prompt, max_tokens=200, temperature=0.3, operation="answer")
+            
+            analysis = self._parse_analysis(answer_text)
+            analysis.pop("recommendation", None)
+            return analysis
+            
+        except Exception as e:
+            print(f"Error analyzing answer: {e}")
+            return {"error": str(e)}
+
+    def aggregate_answer_analyses(self, answer_analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine per-answer results into the same shape analyze_responses returns"""
+        analysis: Dict[str, Any] = {}
+        for key in SCORE_KEYS:
+            scores = [a.get(key, 0) for a in answer_analyses]
+            analysis[key] = round(sum(scores) / len(scores), 1) if scores else 0
+        
+        for key in ("strengths", "areas_for_improvement"):
+            items = []
+            for a in answer_analyses:
+                items.extend(a.get(key, []))
+            analysis[key] = list(dict.fromkeys(items))[:5]
+        
+        overall = analysis["overall_score"]
+        if overall >= 7:
+            verdict = "Hire"
+        elif overall >= 5:
+            verdict = "Maybe"
+        else:
+            verdict = "No Hire"
+        analysis["recommendation"] = (
+            f"{verdict} - average score {overall}/10 across {len(answer_analyses)} answers"
+        )
+        analysis["answer_analyses"] = answer_analyses
+        return analysis
+
     def _parse_analysis(self, analysis_text: str) -> Dict[str, Any]:
         """Parse AI analysis into structured format"""
         analysis = {
@@ -210,14 +293,7 @@ class InterviewAI:
             Provide constructive, professional feedback that would help the candidate improve.
             """
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": feedback_prompt}],
-                max_tokens=400,
-                temperature=0.5
-            )
-            
-            return response.choices[0].message.content.strip()
+            return await chat_completion(feedback_prompt, max_tokens=400, temperature=0.5, operation="feedback")
             
         except Exception as e:
             return f"Thank you for your time. We will be in touch soon regarding the next steps."
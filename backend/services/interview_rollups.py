@@ -0,0 +1,141 @@
+"""
+Incrementally maintained aggregates over completed interviews.
+
+The admin dashboard summary is served from these counters instead of scanning
+every stored interview. Each interview's contribution is remembered so a newer
+version of the same interview replaces, rather than double counts, the old one.
+"""
+
+import heapq
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+SCORE_BUCKET_WIDTH = 10
+TOP_PERFORMERS = 3
+
+
+class _Contribution(NamedTuple):
+    score: float
+    fraud_passed: bool
+    attention: Optional[float]
+    job: str
+    day: str
+    requires_review: bool
+    summary: Dict[str, Any]
+
+
+def _score_bucket(score: float) -> str:
+    low = min(int(score // SCORE_BUCKET_WIDTH) * SCORE_BUCKET_WIDTH, 100 - SCORE_BUCKET_WIDTH)
+    return f"{low}-{low + SCORE_BUCKET_WIDTH}"
+
+
+def _contribution(record: Dict[str, Any]) -> _Contribution:
+    score = float(record.get("overall_score") or 0)
+    attention = (record.get("eye_tracking_analysis") or {}).get("attention_score")
+    return _Contribution(
+        score=score,
+        fraud_passed=bool((record.get("fraud_detection") or {}).get("passed")),
+        attention=float(attention) if attention is not None else None,
+        job=str(record.get("job_title") or record.get("job_id") or "Unknown"),
+        day=str(record.get("completed_at") or "")[:10] or "unknown",
+        requires_review=bool(record.get("requires_review")),
+        summary={
+            "interview_id": record.get("interview_id"),
+            "candidate_name": record.get("candidate_name"),
+            "job_title": record.get("job_title"),
+            "overall_score": score,
+            "recommendation": record.get("recommendation"),
+            "completed_at": record.get("completed_at"),
+        },
+    )
+
+
+class InterviewRollups:
+    """Score distribution, fraud pass rate, attention and per-job/per-day counts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._contributions: Dict[Any, _Contribution] = {}
+        self.total = 0
+        self.score_sum = 0.0
+        self.fraud_passed = 0
+        self.requires_review = 0
+        self.attention_sum = 0.0
+        self.attention_count = 0
+        self.score_buckets: Counter = Counter()
+        self.per_job: Counter = Counter()
+        self.per_day: Counter = Counter()
+        self._top: List[_Contribution] = []
+
+    def rebuild(self, records: Iterable[Dict[str, Any]]):
+        with self._lock:
+            self._reset()
+            for record in records:
+                self._add(record)
+
+    def add(self, record: Dict[str, Any], key: Any = None):
+        """
+        Count a completed interview, replacing any earlier one with the same key.
+
+        key defaults to the record's interview_id.
+        """
+        with self._lock:
+            self._add(record, key)
+
+    def _add(self, record: Dict[str, Any], key: Any = None):
+        if key is None:
+            key = record.get("interview_id")
+        previous = self._contributions.get(key)
+        if previous is not None:
+            self._apply(previous, -1)
+        contribution = _contribution(record)
+        self._contributions[key] = contribution
+        self._apply(contribution, 1)
+
+        if previous is not None and previous in self._top:
+            self._top = heapq.nlargest(TOP_PERFORMERS, self._contributions.values(), key=lambda c: c.score)
+        else:
+            self._top = heapq.nlargest(TOP_PERFORMERS, self._top + [contribution], key=lambda c: c.score)
+
+    def _apply(self, contribution: _Contribution, sign: int):
+        self.total += sign
+        self.score_sum += sign * contribution.score
+        self.fraud_passed += sign * contribution.fraud_passed
+        self.requires_review += sign * contribution.requires_review
+        if contribution.attention is not None:
+            self.attention_sum += sign * contribution.attention
+            self.attention_count += sign
+        for counter, key in (
+            (self.score_buckets, _score_bucket(contribution.score)),
+            (self.per_job, contribution.job),
+            (self.per_day, contribution.day),
+        ):
+            counter[key] += sign
+            if counter[key] <= 0:
+                del counter[key]
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.total
+            return {
+                "total_interviews": total,
+                "average_score": round(self.score_sum / total, 2) if total else 0,
+                "fraud_detection": {
+                    "passed": self.fraud_passed,
+                    "failed": total - self.fraud_passed,
+                    "pass_rate": round(self.fraud_passed / total, 4) if total else 0,
+                },
+                "average_attention": round(self.attention_sum / self.attention_count, 4) if self.attention_count else None,
+                "requires_review": self.requires_review,
+                "score_distribution": {
+                    _score_bucket(low): self.score_buckets.get(_score_bucket(low), 0)
+                    for low in range(0, 100, SCORE_BUCKET_WIDTH)
+                },
+                "per_job": dict(self.per_job.most_common()),
+                "per_day": dict(sorted(self.per_day.items())),
+                "top_performers": [entry.summary for entry in self._top],
+            }
@@ -0,0 +1,218 @@
+"""
+Persistent store for completed interview records.
+
+Records are appended to a SQLite table and never updated in place; storing an
+interview again appends a new version and reads return the latest one. The
+interview_latest table maps each interview to its newest version and is
+updated in the same transaction as the append, so listing a page walks that
+table instead of grouping every record. The log is indexed on interview id,
+candidate, job and completion time, and the most recently stored records are
+kept in a bounded in-memory cache so dashboard reads of recent interviews do
+not touch disk.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+INTERVIEW_DB_PATH = os.getenv("INTERVIEW_DB_PATH", "interviews.db")
+INTERVIEW_HOT_CACHE_SIZE = int(os.getenv("INTERVIEW_HOT_CACHE_SIZE", "256"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interview_records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    interview_id INTEGER NOT NULL,
+    candidate TEXT,
+    job TEXT,
+    completed_at TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_interview_records_interview_id ON interview_records (interview_id, seq);
+CREATE INDEX IF NOT EXISTS ix_interview_records_candidate ON interview_records (candidate, seq);
+CREATE INDEX IF NOT EXISTS ix_interview_records_job ON interview_records (job, seq);
+CREATE INDEX IF NOT EXISTS ix_interview_records_completed_at ON interview_records (completed_at);
+CREATE TABLE IF NOT EXISTS interview_latest (
+    interview_id INTEGER PRIMARY KEY,
+    seq INTEGER NOT NULL UNIQUE
+);
+"""
+
+# Only the newest version of each interview is visible
+_LATEST = "interview_latest l JOIN interview_records r ON r.seq = l.seq"
+
+
+def _candidate_of(record: Dict[str, Any]) -> Optional[str]:
+    value = record.get("candidate_id") or record.get("candidate_name")
+    return str(value) if value is not None else None
+
+
+def _job_of(record: Dict[str, Any]) -> Optional[str]:
+    value = record.get("job_id") or record.get("job_title")
+    return str(value) if value is not None else None
+
+
+class InterviewStore:
+    """Append-only SQLite interview log with a bounded cache of the newest records"""
+
+    def __init__(self, path: str = INTERVIEW_DB_PATH, hot_size: int = INTERVIEW_HOT_CACHE_SIZE):
+        self.path = path
+        self.hot_size = hot_size
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._backfill_latest()
+        # interview_id -> record, newest last
+        self._hot: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._warm()
+
+    def _backfill_latest(self):
+        """Build interview_latest for a log written before the table existed"""
+        if self._conn.execute("SELECT 1 FROM interview_latest LIMIT 1").fetchone():
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO interview_latest (interview_id, seq) "
+                "SELECT interview_id, MAX(seq) FROM interview_records GROUP BY interview_id"
+            )
+
+    def _warm(self):
+        rows = self._conn.execute(
+            f"SELECT r.interview_id, r.payload FROM {_LATEST} ORDER BY l.seq DESC LIMIT ?",
+            (self.hot_size,),
+        ).fetchall()
+        for interview_id, payload in reversed(rows):
+            self._hot[interview_id] = json.loads(payload)
+
+    def _remember(self, interview_id: int, record: Dict[str, Any]):
+        self._hot.pop(interview_id, None)
+        self._hot[interview_id] = record
+        while len(self._hot) > self.hot_size:
+            self._hot.popitem(last=False)
+
+    def add_interview(self, interview_data: Dict[str, Any]):
+        """Append a record; a record for an interview id already stored supersedes it"""
+        with self._lock, self._conn:
+            self._append(interview_data)
+
+    def add_test_interview(self, build: Callable[[int], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Append the record build(test_id) returns.
+
+        Test records get negative ids, below any stored one, so they never
+        supersede a real interview and a real interview never supersedes them.
+        """
+        with self._lock, self._conn:
+            lowest = self._conn.execute("SELECT MIN(interview_id) FROM interview_latest").fetchone()[0]
+            interview_data = build(min(lowest or 0, 0) - 1)
+            self._append(interview_data)
+        return interview_data
+
+    def _append(self, interview_data: Dict[str, Any]):
+        """Append a record and point interview_latest at it; the caller holds the lock and transaction"""
+        interview_id = int(interview_data["interview_id"])
+        cursor = self._conn.execute(
+            "INSERT INTO interview_records (interview_id, candidate, job, completed_at, payload) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                interview_id,
+                _candidate_of(interview_data),
+                _job_of(interview_data),
+                interview_data.get("completed_at"),
+                json.dumps(interview_data),
+            ),
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO interview_latest (interview_id, seq) VALUES (?, ?)",
+            (interview_id, cursor.lastrowid),
+        )
+        self._remember(interview_id, interview_data)
+
+    def get_interview(self, interview_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._hot.get(interview_id)
+            if record is not None:
+                return record
+            row = self._conn.execute(
+                "SELECT payload FROM interview_records WHERE interview_id = ? ORDER BY seq DESC LIMIT 1",
+                (interview_id,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_interviews(self, skip: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Latest version of every interview, oldest first"""
+        return self._select("", (), skip, limit)
+
+    def iter_interviews(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Latest version of every interview, oldest first, read batch_size at a time"""
+        after = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT l.seq, r.payload FROM {_LATEST} WHERE l.seq > ? ORDER BY l.seq LIMIT ?",
+                    (after, batch_size),
+                ).fetchall()
+            for _, payload in rows:
+                yield json.loads(payload)
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][0]
+
+    def get_recent_interviews(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """The last limit interviews stored, oldest first"""
+        with self._lock:
+            if limit <= len(self._hot) or len(self._hot) < self.hot_size:
+                return list(self._hot.values())[-limit:] if limit > 0 else []
+        rows = self._query(f"SELECT r.payload FROM {_LATEST} ORDER BY l.seq DESC LIMIT ?", (limit,))
+        return list(reversed(rows))
+
+    def find(
+        self,
+        candidate: Optional[str] = None,
+        job: Optional[str] = None,
+        completed_after: Optional[str] = None,
+        completed_before: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Interviews matching every given filter, oldest first. Times are ISO-8601 strings."""
+        clauses, params = [], []
+        if candidate is not None:
+            clauses.append("r.candidate = ?")
+            params.append(str(candidate))
+        if job is not None:
+            clauses.append("r.job = ?")
+            params.append(str(job))
+        if completed_after is not None:
+            clauses.append("r.completed_at >= ?")
+            params.append(completed_after)
+        if completed_before is not None:
+            clauses.append("r.completed_at < ?")
+            params.append(completed_before)
+        return self._select("".join(f" AND {clause}" for clause in clauses), tuple(params), skip, limit)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM interview_latest").fetchone()[0]
+
+    def _select(self, where: str, params: tuple, skip: int, limit: Optional[int]) -> List[Dict[str, Any]]:
+        return self._query(
+            f"SELECT r.payload FROM {_LATEST} WHERE 1 = 1{where} ORDER BY l.seq LIMIT ? OFFSET ?",
+            params + (-1 if limit is None else limit, skip),
+        )
+
+    def _query(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
@@ -0,0 +1,290 @@
+"""
+Shared entry point for chat completions.
+
+Every call is keyed by a hash of (model, prompt, params). Identical calls that
+are already in flight are merged into one upstream request, and completed
+responses are kept in a TTL'd on-disk store. How long a response may be reused
+depends on its temperature:
+
+- temperature <= LLM_CACHE_DETERMINISTIC_TEMPERATURE: near-deterministic, cached for LLM_CACHE_TTL_SECONDS
+- temperature <= 1.0: sampled, cached for LLM_CACHE_SAMPLED_TTL_SECONDS (absorbs refreshes and double clicks)
+- higher temperatures: never stored, only coalesced while in flight
+
+Cache files are private to the backend user, their mtime is their expiry, and
+a sweep at most every LLM_CACHE_SWEEP_INTERVAL_SECONDS (the first one on the
+first write after startup) deletes expired entries and then the soonest-expiring
+ones beyond LLM_CACHE_MAX_ENTRIES. Cache reads, writes and sweeps run in the
+default executor, off the event loop.
+
+Each call also has a latency budget for its operation, and a circuit breaker
+watches upstream error rate and p95 latency. A call that misses its budget, or
+arrives while the breaker is open, raises LLMUnavailable straight away so the
+caller can serve its deterministic fallback. A call that misses its budget
+still finishes in the background and fills the cache, but no upstream request
+(including the breaker's half-open probe) outlives LLM_REQUEST_TIMEOUT_SECONDS,
+and failed requests are not retried by the client.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import json
+import os
+import time
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+from services import metrics
+from services.circuit_breaker import CircuitBreaker
+
+load_dotenv()
+
+# Configuration
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "llm_cache")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 3600)))
+LLM_CACHE_SAMPLED_TTL_SECONDS = int(os.getenv("LLM_CACHE_SAMPLED_TTL_SECONDS", "300"))
+LLM_CACHE_DETERMINISTIC_TEMPERATURE = float(os.getenv("LLM_CACHE_DETERMINISTIC_TEMPERATURE", "0.3"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+LLM_CACHE_SWEEP_INTERVAL_SECONDS = float(os.getenv("LLM_CACHE_SWEEP_INTERVAL_SECONDS", "600"))
+
+# Seconds a caller will wait for each kind of call before falling back
+LLM_BUDGETS = {
+    "questions": float(os.getenv("LLM_BUDGET_QUESTIONS", "8")),
+    "analysis": float(os.getenv("LLM_BUDGET_ANALYSIS", "20")),
+    "answer": float(os.getenv("LLM_BUDGET_ANSWER", "6")),
+    "feedback": float(os.getenv("LLM_BUDGET_FEEDBACK", "6")),
+    "reasoning": float(os.getenv("LLM_BUDGET_REASONING", "3")),
+    "reasoning_batch": float(os.getenv("LLM_BUDGET_REASONING_BATCH", "15")),
+}
+LLM_DEFAULT_BUDGET = float(os.getenv("LLM_DEFAULT_BUDGET", "10"))
+# Hard cap on one upstream request; at least the largest budget so no caller is cut short
+LLM_REQUEST_TIMEOUT_SECONDS = max(
+    float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "0")),
+    LLM_DEFAULT_BUDGET,
+    *LLM_BUDGETS.values(),
+)
+
+breaker = CircuitBreaker(
+    window_size=int(os.getenv("LLM_BREAKER_WINDOW", "50")),
+    min_calls=int(os.getenv("LLM_BREAKER_MIN_CALLS", "10")),
+    max_error_rate=float(os.getenv("LLM_BREAKER_MAX_ERROR_RATE", "0.5")),
+    max_p95_seconds=float(os.getenv("LLM_BREAKER_MAX_P95_SECONDS", "10")),
+    cooldown_seconds=float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30")),
+)
+
+_client = None
+_inflight: Dict[str, "asyncio.Task"] = {}
+_last_sweep: Optional[float] = None
+_stats = {
+    "requests": 0,
+    "upstream_calls": 0,
+    "cache_hits": 0,
+    "coalesced": 0,
+    "budget_exceeded": 0,
+    "breaker_rejected": 0,
+    "cache_evicted": 0,
+}
+
+metrics.register_collector("llm", lambda: dict(_stats))
+metrics.register_collector("llm_breaker", breaker.stats)
+
+
+class LLMUnavailable(Exception):
+    """The call was refused by the breaker or did not finish within its budget"""
+
+
+def cache_ttl(temperature: float) -> int:
+    """Seconds a response at this temperature may be reused; 0 means never store it"""
+    if temperature <= LLM_CACHE_DETERMINISTIC_TEMPERATURE:
+        return LLM_CACHE_TTL_SECONDS
+    if temperature <= 1.0:
+        return LLM_CACHE_SAMPLED_TTL_SECONDS
+    return 0
+
+
+def request_key(model: str, prompt: str, **params) -> str:
+    payload = json.dumps({"model": model, "prompt": prompt, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _path(key: str) -> str:
+    return os.path.join(LLM_CACHE_DIR, key[:2], f"{key}.json")
+
+
+def _read(key: str) -> Optional[str]:
+    path = _path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("expires_at", 0) <= time.time():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    return entry.get("content")
+
+
+def _write(key: str, content: str, ttl: int):
+    path = _path(key)
+    expires_at = time.time() + ttl
+    try:
+        # Prompts carry candidate answers and resumes, so keep them private
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump({"expires_at": expires_at, "content": content}, f)
+        # The sweep reads expiry from mtime instead of opening every file
+        os.utime(tmp_path, (expires_at, expires_at))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not store LLM response: {e}")
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def sweep(max_entries: int = LLM_CACHE_MAX_ENTRIES) -> int:
+    """Delete expired entries, then the soonest-expiring ones beyond max_entries. Returns how many went."""
+    now = time.time()
+    live = []
+    removed = 0
+    try:
+        shards = [entry.path for entry in os.scandir(LLM_CACHE_DIR) if entry.is_dir()]
+    except OSError:
+        return 0
+    for shard in shards:
+        try:
+            entries = list(os.scandir(shard))
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                expires_at = entry.stat().st_mtime
+            except OSError:
+                continue
+            if expires_at <= now:
+                removed += _remove(entry.path)
+            else:
+                live.append((expires_at, entry.path))
+    excess = len(live) - max_entries
+    if excess > 0:
+        removed += sum(_remove(path) for _, path in heapq.nsmallest(excess, live))
+    _stats["cache_evicted"] += removed
+    return removed
+
+
+def _schedule_sweep(loop: asyncio.AbstractEventLoop):
+    global _last_sweep
+    now = time.monotonic()
+    if _last_sweep is not None and now - _last_sweep < LLM_CACHE_SWEEP_INTERVAL_SECONDS:
+        return
+    _last_sweep = now
+    loop.run_in_executor(None, sweep)
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        from openai import AsyncOpenAI
+        # OPENAI_BASE_URL lets the backend talk to mock_llm_server.py for load tests
+        _client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            base_url=os.getenv("OPENAI_BASE_URL") or None,
+            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
+            max_retries=0,
+        )
+    return _client
+
+
+async def _call_upstream(model: str, prompt: str, max_tokens: int, temperature: float) -> str:
+    _stats["upstream_calls"] += 1
+    response = await _get_client().chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=temperature,
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def _fetch(key: str, ttl: int, permit: str, model: str, prompt: str, max_tokens: int, temperature: float) -> str:
+    started = time.monotonic()
+    ok = False
+    try:
+        content = await _call_upstream(model, prompt, max_tokens, temperature)
+        ok = True
+    finally:
+        breaker.record(permit, time.monotonic() - started, ok)
+    if ttl:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _write, key, content, ttl)
+        _schedule_sweep(loop)
+    return content
+
+
+async def chat_completion(
+    prompt: str,
+    max_tokens: int,
+    temperature: float,
+    operation: str = "default",
+    model: str = LLM_MODEL,
+) -> str:
+    """
+    Return the completion text for a single-message prompt.
+
+    Raises LLMUnavailable when the breaker is open or the operation's budget
+    runs out; upstream errors propagate.
+    """
+    _stats["requests"] += 1
+    key = request_key(model, prompt, max_tokens=max_tokens, temperature=temperature)
+    ttl = cache_ttl(temperature)
+
+    if ttl:
+        cached = await asyncio.get_running_loop().run_in_executor(None, _read, key)
+        if cached is not None:
+            _stats["cache_hits"] += 1
+            return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        permit = breaker.acquire()
+        if permit is None:
+            _stats["breaker_rejected"] += 1
+            raise LLMUnavailable("LLM circuit breaker is open")
+        task = asyncio.ensure_future(_fetch(key, ttl, permit, model, prompt, max_tokens, temperature))
+        _inflight[key] = task
+        task.add_done_callback(_finish_task(key))
+    else:
+        _stats["coalesced"] += 1
+
+    budget = LLM_BUDGETS.get(operation, LLM_DEFAULT_BUDGET)
+    started = time.monotonic()
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), budget)
+    except asyncio.TimeoutError:
+        _stats["budget_exceeded"] += 1
+        raise LLMUnavailable(f"{operation} call exceeded its {budget}s budget")
+    finally:
+        metrics.observe(f"llm.{operation}", time.monotonic() - started)
+
+
+def _finish_task(key: str):
+    def done(task: "asyncio.Task"):
+        _inflight.pop(key, None)
+        if not task.cancelled():
+            # Retrieve the exception so an abandoned (over-budget) call does not log "never retrieved"
+            task.exception()
+    return done
@@ -1,65 +1,116 @@
-from typing import Tuple, List, Dict, Any
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import openai
+import asyncio
+import json
 import os
+import re
+from typing import Tuple, List, Dict, Any, Optional
+
 from dotenv import load_dotenv
 
+from services.llm import chat_completion
+
 load_dotenv()
 
+# Batched reasoning: one prompt carries the job once and up to MATCH_REASONING_MAX_BATCH
+# candidates, sized so prompt plus expected output stays under the token budget
+MATCH_REASONING_TOKEN_BUDGET = int(os.getenv("MATCH_REASONING_TOKEN_BUDGET", "3500"))
+MATCH_REASONING_MAX_BATCH = int(os.getenv("MATCH_REASONING_MAX_BATCH", "25"))
+MATCH_REASONING_OUTPUT_TOKENS = int(os.getenv("MATCH_REASONING_OUTPUT_TOKENS", "90"))
+# Upper bound on reasoning calls (batched or single) in flight per engine
+MATCH_REASONING_CONCURRENCY = int(os.getenv("MATCH_REASONING_CONCURRENCY", "8"))
+
+# Rough English/JSON ratio; good enough for sizing batches, not for billing
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+# Start of one {"id": ..., "reasoning": ...} row in batch output, in either key order
+_BATCH_ROW = re.compile(r'\{\s*"(?:id|reasoning)"\s*:')
+
+
 class MatchingEngine:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
-        openai.api_key = os.getenv("OPENAI_API_KEY")
+    def __init__(self, concurrency: int = MATCH_REASONING_CONCURRENCY):
+        self._llm_slots = asyncio.Semaphore(concurrency)
 
     async def calculate_match(self, candidate, job) -> Tuple[float, str]:
         """Calculate match score between candidate and job"""
         try:
-            # Extract features
-            candidate_skills = candidate.skills or []
-            job_skills = job.skills_required or []
-            job_requirements = job.requirements or []
-            
-            # Calculate different match components
-            skills_match = self._calculate_skills_match(candidate_skills, job_skills)
-            experience_match = self._calculate_experience_match(
-                candidate.experience_years, job.experience_required
-            )
-            education_match = self._calculate_education_match(
-                candidate.education, job_requirements
-            )
-            location_match = self._calculate_location_match(
-                candidate.location, job.location
-            )
-            
-            # Weighted scoring
-            weights = {
-                'skills': 0.4,
-                'experience': 0.3,
-                'education': 0.2,
-                'location': 0.1
-            }
-            
-            overall_score = (
-                skills_match * weights['skills'] +
-                experience_match * weights['experience'] +
-                education_match * weights['education'] +
-                location_match * weights['location']
-            )
+            overall_score, components = self._score(candidate, job)
             
             # Generate reasoning
-            reasoning = await self._generate_reasoning(
-                candidate, job, skills_match, experience_match, 
-                education_match, location_match
-            )
+            reasoning = await self._generate_reasoning(candidate, job, *components)
             
-            return min(overall_score, 1.0), reasoning
+            return overall_score, reasoning
             
         except Exception as e:
             print(f"Error calculating match: {e}")
             return 0.0, f"Error in matching calculation: {str(e)}"
 
+    async def calculate_matches(self, candidates: List[Any], job) -> List[Tuple[float, str]]:
+        """
+        Score many candidates against one job, in candidates order.
+
+        Reasoning is generated in batched prompts; candidates whose explanation
+        is missing from the batch output get a single-candidate call instead.
+        """
+        results: List[Optional[Tuple[float, str]]] = [None] * len(candidates)
+        scored = []
+        for index, candidate in enumerate(candidates):
+            try:
+                overall_score, components = self._score(candidate, job)
+            except Exception as e:
+                print(f"Error calculating match: {e}")
+                results[index] = (0.0, f"Error in matching calculation: {str(e)}")
+                continue
+            scored.append((index, candidate, overall_score, components))
+
+        batches = self._plan_reasoning_batches(job, scored)
+        reasonings = await asyncio.gather(
+            *[self._generate_reasoning_batch(job, batch) for batch in batches]
+        )
+        for batch, batch_reasonings in zip(batches, reasonings):
+            for (index, _, overall_score, _), reasoning in zip(batch, batch_reasonings):
+                results[index] = (overall_score, reasoning)
+        return results
+
+    def _score(self, candidate, job) -> Tuple[float, Tuple[float, float, float, float]]:
+        """Weighted overall score and its (skills, experience, education, location) components"""
+        # Extract features
+        candidate_skills = candidate.skills or []
+        job_skills = job.skills_required or []
+        job_requirements = job.requirements or []
+        
+        # Calculate different match components
+        skills_match = self._calculate_skills_match(candidate_skills, job_skills)
+        experience_match = self._calculate_experience_match(
+            candidate.experience_years, job.experience_required
+        )
+        education_match = self._calculate_education_match(
+            candidate.education, job_requirements
+        )
+        location_match = self._calculate_location_match(
+            candidate.location, job.location
+        )
+        
+        # Weighted scoring
+        weights = {
+            'skills': 0.4,
+            'experience': 0.3,
+            'education': 0.2,
+            'location': 0.1
+        }
+        
+        overall_score = (
+            skills_match * weights['skills'] +
+            experience_match * weights['experience'] +
+            education_match * weights['education'] +
+            location_match * weights['location']
+        )
+        
+        return min(overall_score, 1.0), (skills_match, experience_match, education_match, location_match)
+
     def _calculate_skills_match(self, candidate_skills: List[str], job_skills: List[str]) -> float:
         """Calculate skills matching score"""
         if not job_skills:
@@ -191,14 +242,8 @@ class MatchingEngine:
             Provide a brief, professional reasoning for why this candidate is a good/bad match.
             """
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content.strip()
+            async with self._llm_slots:
+                return await chat_completion(prompt, max_tokens=200, temperature=0.7, operation="reasoning")
             
         except Exception as e:
             # Fallback to simple reasoning
@@ -206,6 +251,117 @@ class MatchingEngine:
                 skills_match, experience_match, education_match, location_match
             )
 
+    def _batch_header(self, job) -> str:
+        return f"""
+            Explain how well each candidate below matches this job.
+            
+            Job: {job.title}
+            Required Skills: {', '.join(job.skills_required or [])}
+            Required Experience: {job.experience_required} years
+            Location: {job.location or 'Not specified'}
+            
+            Candidates (one JSON object per line, match scores are 0-1):
+            """
+
+    def _candidate_line(self, candidate, components) -> str:
+        skills_match, experience_match, education_match, location_match = components
+        return json.dumps({
+            "id": candidate.id,
+            "name": candidate.name,
+            "skills": candidate.skills or [],
+            "experience_years": candidate.experience_years,
+            "education": candidate.education or "Not specified",
+            "location": candidate.location or "Not specified",
+            "scores": {
+                "skills": round(skills_match, 2),
+                "experience": round(experience_match, 2),
+                "education": round(education_match, 2),
+                "location": round(location_match, 2),
+            },
+        })
+
+    def _plan_reasoning_batches(self, job, scored: List[tuple]) -> List[List[tuple]]:
+        """Split scored rows into batches whose prompt plus expected output fits the token budget"""
+        header_tokens = estimate_tokens(self._batch_header(job)) + 120  # plus the instructions footer
+        batches: List[List[tuple]] = []
+        current: List[tuple] = []
+        used = header_tokens
+        for row in scored:
+            _, candidate, _, components = row
+            cost = estimate_tokens(self._candidate_line(candidate, components)) + MATCH_REASONING_OUTPUT_TOKENS
+            if current and (used + cost > MATCH_REASONING_TOKEN_BUDGET or len(current) >= MATCH_REASONING_MAX_BATCH):
+                batches.append(current)
+                current, used = [], header_tokens
+            current.append(row)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _generate_reasoning_batch(self, job, batch: List[tuple]) -> List[str]:
+        """Reasoning for every row of a batch, in batch order"""
+        if len(batch) == 1:
+            _, candidate, _, components = batch[0]
+            return [await self._generate_reasoning(candidate, job, *components)]
+
+        lines = "\n".join(self._candidate_line(candidate, components) for _, candidate, _, components in batch)
+        prompt = self._batch_header(job) + lines + """
+            
+            For each candidate give a brief, professional reasoning for why they are a good/bad match.
+            Respond with only a JSON object of the form
+            {"reasonings": [{"id": <candidate id>, "reasoning": "<reasoning>"}]}
+            with one entry per candidate.
+            """
+        try:
+            async with self._llm_slots:
+                response = await chat_completion(
+                    prompt,
+                    max_tokens=MATCH_REASONING_OUTPUT_TOKENS * len(batch) + 50,
+                    temperature=0.7,
+                    operation="reasoning_batch",
+                )
+            parsed = self._parse_batch_reasoning(response)
+        except Exception as e:
+            # The LLM is down or slow; per-candidate calls would fail the same way
+            print(f"Batched reasoning failed, using simple reasoning: {e}")
+            return [self._generate_simple_reasoning(*components) for _, _, _, components in batch]
+
+        missing = [row for row in batch if row[1].id not in parsed]
+        if missing:
+            fallbacks = await asyncio.gather(
+                *[self._generate_reasoning(candidate, job, *components) for _, candidate, _, components in missing]
+            )
+            parsed.update({row[1].id: reasoning for row, reasoning in zip(missing, fallbacks)})
+        return [parsed[row[1].id] for row in batch]
+
+    def _parse_batch_reasoning(self, text: str) -> Dict[Any, str]:
+        """
+        Map candidate id -> reasoning from batch output; unparseable rows are left out.
+
+        Rows are decoded one at a time, so output cut off at max_tokens still
+        yields every row that was completed before the cut.
+        """
+        decoder = json.JSONDecoder()
+        parsed = {}
+        position = 0
+        for match in _BATCH_ROW.finditer(text):
+            if match.start() < position:
+                continue
+            try:
+                row, position = decoder.raw_decode(text, match.start())
+            except ValueError:
+                continue
+            if not isinstance(row, dict):
+                continue
+            reasoning = row.get("reasoning")
+            try:
+                candidate_id = int(row.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if isinstance(reasoning, str) and reasoning.strip():
+                parsed[candidate_id] = reasoning.strip()
+        return parsed
+
     def _generate_simple_reasoning(self, skills_match, experience_match, 
                                  education_match, location_match) -> str:
         """Generate simple reasoning without AI"""
@@ -336,14 +492,7 @@ class MatchingEngine:
             3. Overall fit assessment
             """
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=300,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content.strip()
+            return await chat_completion(prompt, max_tokens=300, temperature=0.7, operation="reasoning")
             
         except Exception as e:
             # Fallback to simple reasoning
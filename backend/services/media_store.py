@@ -0,0 +1,270 @@
+"""
+Interview recordings: resumable chunked uploads and byte-range downloads.
+
+An upload is started with init_upload(), filled with append_chunk() calls that
+must each start exactly where the stored data ends, and moved into place by
+finalize_upload().
+Upload state lives next to the partial file, so a client can ask for the
+current offset and resume after a dropped connection or a server restart.
+
+Finished files live under MEDIA_DIR/{interview_id}/, the layout the existing
+video_url/audio_url values already use: {kind}{ext} for the whole interview,
+or {kind}_q{question_id}{ext} for a single answer. RangeFileResponse serves them with
+HTTP Range support, using the ASGI zero-copy send extension (sendfile) when
+the server offers it and bounded chunked reads otherwise. The extension only
+survives plain ASGI middleware; BaseHTTPMiddleware re-streams bodies and
+accepts nothing but http.response.body.
+"""
+
+import asyncio
+import json
+import os
+import re
+import uuid
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+load_dotenv()
+
+# Configuration
+MEDIA_DIR = os.getenv("MEDIA_DIR", "uploads/interviews")
+MEDIA_MAX_FILE_SIZE = int(os.getenv("MEDIA_MAX_FILE_SIZE", str(2 * 1024 ** 3)))
+MEDIA_MAX_CHUNK_SIZE = int(os.getenv("MEDIA_MAX_CHUNK_SIZE", str(16 * 1024 ** 2)))
+MEDIA_READ_CHUNK_SIZE = int(os.getenv("MEDIA_READ_CHUNK_SIZE", str(256 * 1024)))
+
+MEDIA_KINDS = ("video", "audio")
+ALLOWED_EXTENSIONS = {".mp4", ".webm", ".mkv", ".mov", ".wav", ".mp3", ".ogg", ".m4a"}
+CONTENT_TYPES = {
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+    ".mkv": "video/x-matroska",
+    ".mov": "video/quicktime",
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".ogg": "audio/ogg",
+    ".m4a": "audio/mp4",
+}
+
+_UPLOAD_ID = re.compile(r"^[0-9a-f]{32}$")
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+def interview_dir(interview_id: int) -> str:
+    return os.path.join(MEDIA_DIR, str(interview_id))
+
+
+def _upload_paths(interview_id: int, upload_id: str) -> Tuple[str, str]:
+    if not _UPLOAD_ID.match(upload_id):
+        raise HTTPException(status_code=404, detail="Upload not found")
+    base = os.path.join(interview_dir(interview_id), ".uploads", upload_id)
+    return f"{base}.part", f"{base}.json"
+
+
+def _load_state(interview_id: int, upload_id: str) -> Dict[str, Any]:
+    _, state_path = _upload_paths(interview_id, upload_id)
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+
+def recording_name(kind: str, extension: str, question_id: Optional[int] = None) -> str:
+    """Stored file name of an interview's recording, or of one answer's when question_id is given"""
+    return f"{kind}{extension}" if question_id is None else f"{kind}_q{question_id}{extension}"
+
+
+def init_upload(
+    interview_id: int,
+    kind: str,
+    filename: str,
+    total_size: Optional[int] = None,
+    question_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Start an upload of the interview's video or audio recording, or of one answer's"""
+    if kind not in MEDIA_KINDS:
+        raise HTTPException(status_code=400, detail=f"kind must be one of {', '.join(MEDIA_KINDS)}")
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail=f"Unsupported file type: {extension or 'none'}")
+    if total_size is not None and not 0 < total_size <= MEDIA_MAX_FILE_SIZE:
+        raise HTTPException(status_code=413, detail=f"Recordings are limited to {MEDIA_MAX_FILE_SIZE} bytes")
+    if question_id is not None and (not isinstance(question_id, int) or isinstance(question_id, bool) or question_id < 0):
+        raise HTTPException(status_code=400, detail="question_id must be a non-negative integer")
+
+    upload_id = uuid.uuid4().hex
+    part_path, state_path = _upload_paths(interview_id, upload_id)
+    os.makedirs(os.path.dirname(part_path), exist_ok=True)
+    open(part_path, "wb").close()
+    state = {
+        "upload_id": upload_id,
+        "interview_id": interview_id,
+        "kind": kind,
+        "extension": extension,
+        "total_size": total_size,
+        "question_id": question_id,
+    }
+    with open(state_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    return {**state, "offset": 0}
+
+
+def upload_status(interview_id: int, upload_id: str) -> Dict[str, Any]:
+    state = _load_state(interview_id, upload_id)
+    part_path, _ = _upload_paths(interview_id, upload_id)
+    return {**state, "offset": os.path.getsize(part_path)}
+
+
+async def append_chunk(interview_id: int, upload_id: str, offset: int, chunks: AsyncIterator[bytes]) -> Dict[str, Any]:
+    """
+    Append a request body at offset. Returns the new offset.
+
+    The offset must equal the bytes already stored (409 otherwise, with the
+    expected offset), so a retried chunk is never written twice.
+    """
+    state = _load_state(interview_id, upload_id)
+    part_path, _ = _upload_paths(interview_id, upload_id)
+    limit = state["total_size"] or MEDIA_MAX_FILE_SIZE
+    lock = _locks.setdefault(upload_id, asyncio.Lock())
+    loop = asyncio.get_running_loop()
+    async with lock:
+        current = os.path.getsize(part_path)
+        if offset != current:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Offset does not match stored data", "expected_offset": current},
+            )
+        written = 0
+        # File writes run in the executor so a large upload does not stall the event loop
+        f = await loop.run_in_executor(None, open, part_path, "r+b")
+        try:
+            f.seek(current)
+            async for chunk in chunks:
+                written += len(chunk)
+                if written > MEDIA_MAX_CHUNK_SIZE or current + written > limit:
+                    raise HTTPException(status_code=413, detail="Chunk exceeds the upload's size limit")
+                await loop.run_in_executor(None, f.write, chunk)
+        except HTTPException:
+            # Drop the partial chunk so the client can retry from the same offset
+            await loop.run_in_executor(None, f.truncate, current)
+            raise
+        finally:
+            await loop.run_in_executor(None, f.close)
+    return {"upload_id": upload_id, "offset": current + written}
+
+
+def finalize_upload(interview_id: int, upload_id: str) -> Dict[str, Any]:
+    """Move a complete upload into place and return its URL"""
+    state = _load_state(interview_id, upload_id)
+    part_path, state_path = _upload_paths(interview_id, upload_id)
+    size = os.path.getsize(part_path)
+    if state["total_size"] is not None and size != state["total_size"]:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Upload is incomplete", "expected_size": state["total_size"], "offset": size},
+        )
+    if size == 0:
+        raise HTTPException(status_code=400, detail="Upload is empty")
+    filename = recording_name(state["kind"], state["extension"], state.get("question_id"))
+    final_path = os.path.join(interview_dir(interview_id), filename)
+    os.replace(part_path, final_path)
+    os.remove(state_path)
+    _locks.pop(upload_id, None)
+    return {"url": final_path, "filename": filename, "size": size}
+
+
+def media_path(interview_id: int, filename: str) -> str:
+    if not _SAFE_NAME.match(filename) or filename.startswith("."):
+        raise HTTPException(status_code=404, detail="Recording not found")
+    path = os.path.join(interview_dir(interview_id), filename)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Recording not found")
+    return path
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Inclusive (start, end) for a single-range "bytes=" header, or None to send the whole file.
+
+    Raises 416 when the range cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header)
+    if not match or not (match.group(1) or match.group(2)):
+        # Multiple or malformed ranges: ignoring Range and sending 200 is allowed
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        start = max(size - int(last), 0)
+        end = size - 1
+    if start >= size or start > end:
+        raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+class RangeFileResponse(Response):
+    """Response for a file or a byte range of it"""
+
+    def __init__(self, path: str, range_header: Optional[str] = None):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.range = parse_range(range_header, self.size)
+        start, end = self.range if self.range else (0, self.size - 1)
+        self.start = start
+        self.length = end - start + 1 if self.size else 0
+        headers = {"content-length": str(self.length), "accept-ranges": "bytes"}
+        if self.range:
+            headers["content-range"] = f"bytes {start}-{end}/{self.size}"
+        super().__init__(
+            status_code=206 if self.range else 200,
+            headers=headers,
+            media_type=CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), "application/octet-stream"),
+        )
+
+    async def __call__(self, scope, receive, send):
+        await self._send_file(scope, send)
+        if self.background is not None:
+            await self.background()
+
+    async def _send_file(self, scope, send):
+        start, length = self.start, self.length
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if scope.get("method") == "HEAD" or length == 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        with open(self.path, "rb") as f:
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                # The server copies file -> socket in the kernel (sendfile)
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": f.fileno(),
+                    "offset": start,
+                    "count": length,
+                })
+                return
+            fd = f.fileno()
+            position, remaining = start, length
+            loop = asyncio.get_running_loop()
+            while remaining > 0:
+                size = min(MEDIA_READ_CHUNK_SIZE, remaining)
+                chunk = await loop.run_in_executor(None, os.pread, fd, size, position)
+                if not chunk:
+                    break
+                position += len(chunk)
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b""})
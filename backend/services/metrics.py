@@ -0,0 +1,48 @@
+import threading
+from typing import Any, Callable, Dict
+
+_lock = threading.Lock()
+_gauges: Dict[str, float] = {}
+_timings: Dict[str, Dict[str, float]] = {}
+_collectors: Dict[str, Callable[[], Any]] = {}
+
+
+def set_gauge(name: str, value: float):
+    with _lock:
+        _gauges[name] = value
+
+
+def set_gauge_once(name: str, value: float) -> bool:
+    """Set a gauge only if it has never been set; returns True if this call set it"""
+    with _lock:
+        if name in _gauges:
+            return False
+        _gauges[name] = value
+        return True
+
+
+def observe(name: str, seconds: float):
+    """Record one duration sample under name"""
+    with _lock:
+        timing = _timings.setdefault(name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+        timing["count"] += 1
+        timing["total_seconds"] += seconds
+        timing["max_seconds"] = max(timing["max_seconds"], seconds)
+
+
+def register_collector(name: str, collector: Callable[[], Any]):
+    """Add a callable whose result is included in every snapshot under name"""
+    with _lock:
+        _collectors[name] = collector
+
+
+def snapshot() -> Dict[str, Any]:
+    with _lock:
+        gauges = dict(_gauges)
+        timings = {name: dict(timing) for name, timing in _timings.items()}
+        collectors = dict(_collectors)
+    return {
+        "gauges": gauges,
+        "timings": timings,
+        **{name: collector() for name, collector in collectors.items()},
+    }
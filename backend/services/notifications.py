@@ -0,0 +1,242 @@
+"""
+Outbound admin notifications, delivered off the request path.
+
+enqueue() only records the notification and returns; worker tasks deliver in
+batches. Notifications are deduplicated per (interview, type): a newer one for
+the same interview replaces one that has not been sent yet. When a batch
+holds NOTIFY_DIGEST_THRESHOLD or more notifications, they are sent as a single
+digest. Failed deliveries are retried with exponential backoff and jitter, and
+dropped to the log after NOTIFY_MAX_ATTEMPTS.
+
+By default the queue is in-process only. Set NOTIFY_DB_PATH to also keep
+pending notifications in SQLite, so they survive a restart.
+
+Delivery posts to NOTIFY_WEBHOOK_URL when it is set and logs otherwise.
+"""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from services.structured_logging import get_logger, log_event
+
+load_dotenv()
+
+# Configuration
+NOTIFY_WEBHOOK_URL = os.getenv("NOTIFY_WEBHOOK_URL")
+NOTIFY_DB_PATH = os.getenv("NOTIFY_DB_PATH")
+NOTIFY_WORKERS = int(os.getenv("NOTIFY_WORKERS", "2"))
+NOTIFY_BATCH_SIZE = int(os.getenv("NOTIFY_BATCH_SIZE", "20"))
+NOTIFY_BATCH_WINDOW_SECONDS = float(os.getenv("NOTIFY_BATCH_WINDOW_SECONDS", "1.0"))
+NOTIFY_DIGEST_THRESHOLD = int(os.getenv("NOTIFY_DIGEST_THRESHOLD", "5"))
+NOTIFY_MAX_ATTEMPTS = int(os.getenv("NOTIFY_MAX_ATTEMPTS", "5"))
+NOTIFY_BACKOFF_SECONDS = float(os.getenv("NOTIFY_BACKOFF_SECONDS", "1.0"))
+NOTIFY_MAX_BACKOFF_SECONDS = float(os.getenv("NOTIFY_MAX_BACKOFF_SECONDS", "300"))
+
+logger = get_logger("notifications")
+
+Deliver = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+def dedup_key(notification: Dict[str, Any]) -> str:
+    return f"{notification.get('notification_type', 'notification')}:{notification.get('interview_id')}"
+
+
+def digest(notifications: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """One notification summarizing a burst"""
+    scores = [
+        n["performance_summary"]["overall_score"]
+        for n in notifications
+        if isinstance(n.get("performance_summary"), dict) and "overall_score" in n["performance_summary"]
+    ]
+    return {
+        "notification_type": "digest",
+        "count": len(notifications),
+        "interview_ids": [n.get("interview_id") for n in notifications],
+        "requires_review": [n.get("interview_id") for n in notifications if n.get("requires_review")],
+        "average_score": round(sum(scores) / len(scores), 2) if scores else None,
+        "sent_at": datetime.now().isoformat(),
+    }
+
+
+async def default_deliver(batch: List[Dict[str, Any]]):
+    if NOTIFY_WEBHOOK_URL:
+        import httpx
+
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.post(NOTIFY_WEBHOOK_URL, json={"notifications": batch})
+            response.raise_for_status()
+        return
+    for notification in batch:
+        log_event(
+            logger, "admin_notification_delivered",
+            notification_type=notification.get("notification_type"),
+            interview_id=notification.get("interview_id"),
+            count=notification.get("count"),
+        )
+
+
+class _Entry:
+    __slots__ = ("key", "payload", "attempts")
+
+    def __init__(self, key: str, payload: Dict[str, Any], attempts: int = 0):
+        self.key = key
+        self.payload = payload
+        self.attempts = attempts
+
+
+class _DurableLog:
+    """SQLite mirror of the pending notifications"""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending_notifications ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.commit()
+
+    def load(self) -> List[_Entry]:
+        rows = self._conn.execute("SELECT key, payload, attempts FROM pending_notifications ORDER BY rowid").fetchall()
+        return [_Entry(key, json.loads(payload), attempts) for key, payload, attempts in rows]
+
+    def put(self, entry: _Entry):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pending_notifications (key, payload, attempts) VALUES (?, ?, ?)",
+            (entry.key, json.dumps(entry.payload, default=str), entry.attempts),
+        )
+        self._conn.commit()
+
+    def remove(self, keys: List[str]):
+        self._conn.executemany("DELETE FROM pending_notifications WHERE key = ?", [(key,) for key in keys])
+        self._conn.commit()
+
+
+class NotificationQueue:
+    def __init__(
+        self,
+        deliver: Deliver = default_deliver,
+        db_path: Optional[str] = NOTIFY_DB_PATH,
+        workers: int = NOTIFY_WORKERS,
+    ):
+        self.deliver = deliver
+        self.workers = workers
+        self._durable = _DurableLog(db_path) if db_path else None
+        self._pending: Dict[str, _Entry] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self.stats = {"enqueued": 0, "deduplicated": 0, "delivered": 0, "digests": 0, "retries": 0, "dropped": 0}
+
+    def start(self):
+        """Start delivery workers on the running loop and requeue anything persisted"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        if self._durable is not None:
+            for entry in self._durable.load():
+                self._pending[entry.key] = entry
+        for key in self._pending:
+            self._queue.put_nowait(key)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def enqueue(self, notification: Dict[str, Any]):
+        """Queue a notification for delivery; never waits on the delivery channel"""
+        key = dedup_key(notification)
+        self.stats["enqueued"] += 1
+        entry = self._pending.get(key)
+        if entry is not None:
+            # Not sent yet: the newer notification replaces it in its queue slot
+            entry.payload = notification
+            entry.attempts = 0
+            self.stats["deduplicated"] += 1
+        else:
+            entry = self._pending[key] = _Entry(key, notification)
+            if self._queue is not None:
+                self._queue.put_nowait(key)
+        if self._durable is not None:
+            self._durable.put(entry)
+
+    async def _next_batch(self) -> List[_Entry]:
+        keys = [await self._queue.get()]
+        deadline = time.monotonic() + NOTIFY_BATCH_WINDOW_SECONDS
+        while len(keys) < NOTIFY_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                keys.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return [self._pending[key] for key in dict.fromkeys(keys) if key in self._pending]
+
+    async def _worker(self):
+        while True:
+            batch = await self._next_batch()
+            if not batch:
+                continue
+            # Snapshot payloads: enqueue() may replace one while it is being delivered
+            sent = [(entry, entry.payload) for entry in batch]
+            payloads = [payload for _, payload in sent]
+            if len(payloads) >= NOTIFY_DIGEST_THRESHOLD:
+                payloads = [digest(payloads)]
+                self.stats["digests"] += 1
+            try:
+                await self.deliver(payloads)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._retry(batch, e)
+                continue
+            self._complete(sent)
+
+    def _complete(self, sent: List[tuple]):
+        done = []
+        for entry, payload in sent:
+            if entry.payload is payload:
+                self._pending.pop(entry.key, None)
+                done.append(entry.key)
+            else:
+                # Replaced during delivery; the replacement still has to go out
+                self._queue.put_nowait(entry.key)
+        if self._durable is not None:
+            self._durable.remove(done)
+        self.stats["delivered"] += len(sent)
+
+    def _retry(self, batch: List[_Entry], error: Exception):
+        loop = asyncio.get_running_loop()
+        for entry in batch:
+            entry.attempts += 1
+            if entry.attempts >= NOTIFY_MAX_ATTEMPTS:
+                self._pending.pop(entry.key, None)
+                if self._durable is not None:
+                    self._durable.remove([entry.key])
+                self.stats["dropped"] += 1
+                log_event(
+                    logger, "admin_notification_dropped",
+                    interview_id=entry.payload.get("interview_id"),
+                    attempts=entry.attempts,
+                    error=str(error),
+                )
+                continue
+            if self._durable is not None:
+                self._durable.put(entry)
+            backoff = min(NOTIFY_BACKOFF_SECONDS * 2 ** (entry.attempts - 1), NOTIFY_MAX_BACKOFF_SECONDS)
+            loop.call_later(backoff * random.uniform(0.5, 1.0), self._queue.put_nowait, entry.key)
+            self.stats["retries"] += 1
+
+
+admin_notifications = NotificationQueue()
@@ -0,0 +1,110 @@
+"""
+Bounded worker pool and admission control for password hashing.
+
+bcrypt costs 100-300 ms of CPU per call, so it must not run on the event loop.
+Work is handed to a dedicated thread pool with a cap on pending calls, and
+per-IP / per-account rate limits reject floods before they reach the pool.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from services import metrics
+
+# Configuration
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+AUTH_ATTEMPTS_PER_MINUTE_PER_IP = int(os.getenv("AUTH_ATTEMPTS_PER_MINUTE_PER_IP", "30"))
+AUTH_ATTEMPTS_PER_MINUTE_PER_ACCOUNT = int(os.getenv("AUTH_ATTEMPTS_PER_MINUTE_PER_ACCOUNT", "10"))
+
+
+class RateLimiter:
+    """Token bucket per key, remembering at most max_keys recently seen keys"""
+
+    def __init__(self, per_minute: int, max_keys: int = 10000):
+        self.capacity = float(per_minute)
+        self.refill_per_second = per_minute / 60.0
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.capacity, now]
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                tokens, updated = bucket
+                bucket[0] = min(self.capacity, tokens + (now - updated) * self.refill_per_second)
+                bucket[1] = now
+            if bucket[0] < 1:
+                return False
+            bucket[0] -= 1
+            return True
+
+
+class PasswordPool:
+    """Runs password hashing off the event loop, refusing work past max_pending"""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication is busy, please retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+password_pool = PasswordPool()
+ip_limiter = RateLimiter(AUTH_ATTEMPTS_PER_MINUTE_PER_IP)
+account_limiter = RateLimiter(AUTH_ATTEMPTS_PER_MINUTE_PER_ACCOUNT)
+
+metrics.register_collector(
+    "password_pool",
+    lambda: {"pending": password_pool.pending, "max_pending": password_pool.max_pending},
+)
+
+
+def admit_auth_attempt(client_ip: Optional[str], account: Optional[str]):
+    """Reject an auth attempt with 429 if its IP or account is over its rate limit"""
+    if client_ip and not ip_limiter.allow(client_ip):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many authentication attempts from this address",
+            headers={"Retry-After": "60"},
+        )
+    if account and not account_limiter.allow(account.lower()):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many authentication attempts for this account",
+            headers={"Retry-After": "60"},
+        )
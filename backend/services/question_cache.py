@@ -0,0 +1,130 @@
+"""
+Cache of generated interview questions.
+
+Questions are keyed by job id and version plus a fingerprint of the parts of
+the candidate's profile the prompt uses: which of the job's required skills
+they have and their experience band. Candidates with the same profile for the
+same job share one question set. Lookups go through the LRU/Redis tier in
+services.cache, then the interview_question_sets table, and only then to the
+model.
+"""
+
+import asyncio
+import hashlib
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import InterviewQuestionSet
+from services.cache import cache
+
+load_dotenv()
+
+# Configuration
+QUESTION_CACHE_TTL_SECONDS = int(os.getenv("QUESTION_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# (label, min years, max years); max None means open-ended
+EXPERIENCE_BANDS = [
+    ("entry", 0, 1),
+    ("mid", 2, 4),
+    ("senior", 5, 9),
+    ("staff", 10, None),
+]
+
+
+def experience_band(years: Optional[int]) -> str:
+    years = years or 0
+    for label, low, high in EXPERIENCE_BANDS:
+        if years >= low and (high is None or years <= high):
+            return label
+    return EXPERIENCE_BANDS[0][0]
+
+
+def job_version(job) -> str:
+    changed = job.updated_at or job.created_at
+    return str(int(changed.timestamp())) if changed else "0"
+
+
+def skill_profile(candidate_skills: List[str], years: Optional[int], job) -> Dict[str, Any]:
+    """Normalized view of a candidate relative to a job, plus its fingerprint"""
+    have = {skill.strip().lower() for skill in candidate_skills or [] if skill and skill.strip()}
+    required = sorted({skill.strip().lower() for skill in job.skills_required or [] if skill and skill.strip()})
+    matched = [skill for skill in required if skill in have]
+    missing = [skill for skill in required if skill not in have]
+    band = experience_band(years)
+    raw = f"{band}|{','.join(matched)}"
+    return {
+        "band": band,
+        "matched_skills": matched,
+        "missing_skills": missing,
+        "fingerprint": hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16],
+    }
+
+
+def _cache_key(job_id: int, version: str, fingerprint: str) -> str:
+    return f"questions:{job_id}:{version}:{fingerprint}"
+
+
+class QuestionCache:
+    def __init__(self):
+        # Generations in progress, so concurrent misses for one key share a model call
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+
+    async def get_or_generate(
+        self,
+        db: Session,
+        job,
+        profile: Dict[str, Any],
+        generate: Callable[[Any, Dict[str, Any]], Awaitable[List[str]]],
+    ) -> List[str]:
+        version = job_version(job)
+        key = _cache_key(job.id, version, profile["fingerprint"])
+
+        questions = cache.get_or_set(
+            key,
+            lambda: self._load(db, job.id, version, profile["fingerprint"]),
+            ttl=QUESTION_CACHE_TTL_SECONDS,
+        )
+        if questions:
+            return questions
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_and_store(key, job, version, profile, generate))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def _load(self, db: Session, job_id: int, version: str, fingerprint: str) -> Optional[List[str]]:
+        row = db.query(InterviewQuestionSet).filter(
+            InterviewQuestionSet.job_id == job_id,
+            InterviewQuestionSet.job_version == version,
+            InterviewQuestionSet.fingerprint == fingerprint,
+        ).first()
+        return row.questions if row else None
+
+    async def _generate_and_store(self, key, job, version, profile, generate) -> List[str]:
+        questions = await generate(job, profile)
+        db = SessionLocal()
+        try:
+            db.add(InterviewQuestionSet(
+                job_id=job.id,
+                job_version=version,
+                fingerprint=profile["fingerprint"],
+                questions=questions,
+            ))
+            db.commit()
+        except IntegrityError:
+            # Another worker stored the same set first
+            db.rollback()
+        finally:
+            db.close()
+        cache.set(key, questions, ttl=QUESTION_CACHE_TTL_SECONDS)
+        return questions
+
+
+question_cache = QuestionCache()
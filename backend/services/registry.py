@@ -0,0 +1,68 @@
+"""
+Lazily constructed AI services.
+
+The service modules pull in openai, pdfplumber and docx2txt, so they are only
+imported the first time a request needs them rather than when main.py loads.
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from services import metrics
+
+if TYPE_CHECKING:
+    from services.interview_ai import InterviewAI
+    from services.matching_engine import MatchingEngine
+    from services.resume_parser import ResumeParser
+
+_lock = threading.Lock()
+_instances = {}
+
+
+def _load(name: str, factory):
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+    with _lock:
+        instance = _instances.get(name)
+        if instance is None:
+            started = time.perf_counter()
+            instance = factory()
+            metrics.set_gauge(f"service_load_seconds.{name}", time.perf_counter() - started)
+            _instances[name] = instance
+    return instance
+
+
+def _resume_parser():
+    from services.resume_parser import ResumeParser
+    return ResumeParser()
+
+
+def _matching_engine():
+    from services.matching_engine import MatchingEngine
+    return MatchingEngine()
+
+
+def _interview_ai():
+    from services.interview_ai import InterviewAI
+    return InterviewAI()
+
+
+def get_resume_parser() -> "ResumeParser":
+    return _load("resume_parser", _resume_parser)
+
+
+def get_matching_engine() -> "MatchingEngine":
+    return _load("matching_engine", _matching_engine)
+
+
+def get_interview_ai() -> "InterviewAI":
+    return _load("interview_ai", _interview_ai)
+
+
+def preload_all():
+    """Import and construct every service up front (used when PRELOAD_SERVICES is set)"""
+    get_resume_parser()
+    get_matching_engine()
+    get_interview_ai()
@@ -0,0 +1,169 @@
+"""
+Indexed in-memory record store for the demo backend.
+
+Records are dicts keyed by an integer id allocated under a lock, so concurrent
+creates never collide. Declared fields get secondary indexes (value -> ids);
+list-valued fields such as skills index each element. Lookups by id and by
+indexed value are dict hits instead of list scans. A repository can be saved
+to and restored from a JSON snapshot.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+REPOSITORY_SNAPSHOT_DIR = os.getenv("REPOSITORY_SNAPSHOT_DIR")
+
+
+def normalize(value: Any) -> Any:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+class Repository:
+    def __init__(self, name: str, indexes: Iterable[str] = (), list_indexes: Iterable[str] = ()):
+        """
+        indexes: fields indexed by value; list_indexes: list fields indexed per element.
+        String values are indexed case-insensitively.
+        """
+        self.name = name
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._fields = {field: False for field in indexes}
+        self._fields.update({field: True for field in list_indexes})
+        self._indexes: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in self._fields}
+        self._next_id = 1
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _keys(self, field: str, record: Dict[str, Any]) -> Set[Any]:
+        value = record.get(field)
+        if self._fields[field]:
+            return {normalize(item) for item in value or []}
+        return {normalize(value)}
+
+    def _index(self, record: Dict[str, Any]):
+        for field in self._fields:
+            for key in self._keys(field, record):
+                self._indexes[field].setdefault(key, set()).add(record["id"])
+
+    def _unindex(self, record: Dict[str, Any]):
+        for field in self._fields:
+            index = self._indexes[field]
+            for key in self._keys(field, record):
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(record["id"])
+                    if not ids:
+                        del index[key]
+
+    def allocate_id(self) -> int:
+        with self._lock:
+            new_id = self._next_id
+            self._next_id += 1
+            return new_id
+
+    def add(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Store record, assigning an id if it has none. Returns the stored record."""
+        with self._lock:
+            if record.get("id") is None:
+                record = {**record, "id": self.allocate_id()}
+            else:
+                self._next_id = max(self._next_id, record["id"] + 1)
+                existing = self._rows.get(record["id"])
+                if existing is not None:
+                    self._unindex(existing)
+            self._rows[record["id"]] = record
+            self._index(record)
+            return record
+
+    def create(self, build: Callable[[int], Dict[str, Any]]) -> Dict[str, Any]:
+        """Store the record build(new_id) returns, for records that embed their own id"""
+        with self._lock:
+            return self.add(build(self.allocate_id()))
+
+    def get(self, record_id: int) -> Optional[Dict[str, Any]]:
+        return self._rows.get(record_id)
+
+    def update(self, record_id: int, **changes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            existing = self._rows.get(record_id)
+            if existing is None:
+                return None
+            return self.add({**existing, **changes, "id": record_id})
+
+    def delete(self, record_id: int) -> bool:
+        with self._lock:
+            existing = self._rows.pop(record_id, None)
+            if existing is None:
+                return False
+            self._unindex(existing)
+            return True
+
+    def list(self, skip: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records in id order"""
+        with self._lock:
+            ids = sorted(self._rows)
+        end = None if limit is None else skip + limit
+        return [self._rows[record_id] for record_id in ids[skip:end] if record_id in self._rows]
+
+    def find(self, skip: int = 0, limit: Optional[int] = None, **filters) -> List[Dict[str, Any]]:
+        """
+        Records matching every filter on an indexed field, in id order.
+
+        For list-indexed fields the filter matches records containing that element.
+        """
+        unknown = [field for field in filters if field not in self._fields]
+        if unknown:
+            raise ValueError(f"{self.name} has no index on {', '.join(unknown)}")
+        with self._lock:
+            matched: Optional[Set[int]] = None
+            for field, value in sorted(filters.items(), key=lambda item: len(self._indexes[item[0]].get(normalize(item[1]), ()))):
+                ids = self._indexes[field].get(normalize(value), set())
+                matched = set(ids) if matched is None else matched & ids
+                if not matched:
+                    return []
+            ids = sorted(matched) if matched is not None else sorted(self._rows)
+            end = None if limit is None else skip + limit
+            return [self._rows[record_id] for record_id in ids[skip:end]]
+
+    def values(self, field: str) -> List[Any]:
+        """Distinct (normalized) values of an indexed field"""
+        with self._lock:
+            return list(self._indexes[field])
+
+    def snapshot(self, path: str):
+        """Write all records to path atomically"""
+        with self._lock:
+            payload = {"next_id": self._next_id, "records": list(self._rows.values())}
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, default=str)
+        os.replace(tmp_path, path)
+
+    def restore(self, path: str) -> bool:
+        """Replace contents with a snapshot; returns False if there is none"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return False
+        with self._lock:
+            self._rows.clear()
+            self._indexes = {field: {} for field in self._fields}
+            for record in payload["records"]:
+                self.add(record)
+            self._next_id = max(self._next_id, payload.get("next_id", 1))
+        return True
+
+
+def snapshot_path(name: str) -> Optional[str]:
+    return os.path.join(REPOSITORY_SNAPSHOT_DIR, f"{name}.json") if REPOSITORY_SNAPSHOT_DIR else None
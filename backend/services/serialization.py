@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+
+from schemas import CandidateResponse, InterviewSummaryResponse, JobResponse
+
+# Response fields, kept in sync with the Pydantic schemas they mirror
+CANDIDATE_FIELDS = tuple(CandidateResponse.model_fields)
+JOB_FIELDS = tuple(JobResponse.model_fields)
+INTERVIEW_SUMMARY_FIELDS = tuple(InterviewSummaryResponse.model_fields)
+
+
+def candidate_row(candidate) -> Dict[str, Any]:
+    """CandidateResponse-shaped dict read straight from ORM attributes"""
+    return {field: getattr(candidate, field) for field in CANDIDATE_FIELDS}
+
+
+def job_row(job) -> Dict[str, Any]:
+    """JobResponse-shaped dict read straight from ORM attributes"""
+    return {field: getattr(job, field) for field in JOB_FIELDS}
+
+
+def as_record(row: Dict[str, Any]) -> SimpleNamespace:
+    """Attribute view of a serialized row, for code written against ORM objects"""
+    return SimpleNamespace(**row)
+
+
+def fast_response(content: Any) -> ORJSONResponse:
+    """
+    Serialize content with orjson, skipping response_model validation.
+
+    Content must already be response-shaped: dicts, lists, scalars and datetimes.
+    """
+    return ORJSONResponse(content=content)
+
+
+def sort_rows(rows: Iterable[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    return sorted(rows, key=lambda row: row[key], reverse=True)
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated fields= projection, always including id.
+
+    Returns None when no projection was requested.
+    """
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    if "id" not in requested:
+        requested.insert(0, "id")
+    return list(dict.fromkeys(requested))
+
+
+def select_fields(
+    db: Session, model, columns: List[str], skip: int = 0, limit: int = 100
+) -> List[Dict[str, Any]]:
+    """Load only the given columns of model, as dicts, without building ORM objects"""
+    rows = (
+        db.query(*[getattr(model, column) for column in columns])
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    return [dict(zip(columns, row)) for row in rows]
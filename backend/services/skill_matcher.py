@@ -0,0 +1,159 @@
+"""
+Fuzzy skill matching over a character-trigram index.
+
+Skills are normalized (lowercase, punctuation other than + and # dropped, so
+"Node.js", "NodeJS" and "node js" are one skill) and every distinct skill is
+added once to a vocabulary with an inverted trigram index. Requirements are
+often phrases ("3+ years of Python experience"), so a requirement is split
+into words and runs of up to SKILL_MAX_WORDS words, and it is satisfied by any
+vocabulary skill that one of those pieces matches. Pieces shorter than
+SKILL_MIN_FUZZY_CHARS must match a skill exactly; longer ones match skills
+whose trigram Dice similarity reaches SKILL_MATCH_THRESHOLD. Only skills
+sharing a trigram are ever compared, and resolutions are cached. Short skills
+no longer match by substring: "r" does not match "react", and "java" does not
+match "javascript".
+
+match_matrix() checks a whole candidate list against a job's requirements
+with one matrix product.
+"""
+
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, FrozenSet, List, Sequence, Set
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+SKILL_MATCH_THRESHOLD = float(os.getenv("SKILL_MATCH_THRESHOLD", "0.6"))
+SKILL_MIN_FUZZY_CHARS = int(os.getenv("SKILL_MIN_FUZZY_CHARS", "4"))
+SKILL_MAX_WORDS = int(os.getenv("SKILL_MAX_WORDS", "3"))
+
+_SEPARATORS = re.compile(r"[^a-z0-9+#]+")
+_WORDS = re.compile(r"[a-z0-9+#.]+")
+
+
+def normalize_skill(skill: str) -> str:
+    return _SEPARATORS.sub("", skill.lower())
+
+
+def requirement_pieces(requirement: str) -> Set[str]:
+    """Normalized words and word runs of a requirement, plus the whole requirement"""
+    words = [normalize_skill(word) for word in _WORDS.findall(requirement.lower())]
+    words = [word for word in words if word]
+    pieces = {normalize_skill(requirement)}
+    for size in range(1, SKILL_MAX_WORDS + 1):
+        pieces.update("".join(words[i:i + size]) for i in range(len(words) - size + 1))
+    pieces.discard("")
+    return pieces
+
+
+def trigrams(normalized: str) -> Set[str]:
+    padded = f"$${normalized}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """Dice coefficient of the trigram sets of two skills"""
+    grams_a, grams_b = trigrams(normalize_skill(a)), trigrams(normalize_skill(b))
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+class SkillMatcher:
+    def __init__(self, threshold: float = SKILL_MATCH_THRESHOLD):
+        self.threshold = threshold
+        self._ids: Dict[str, int] = {}
+        # Raw spelling -> id, so repeat lookups skip normalization
+        self._raw_ids: Dict[str, int] = {}
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._resolved: Dict[str, FrozenSet[int]] = {}
+        self._lock = threading.Lock()
+
+    def skill_ids(self, skills: Sequence[str]) -> List[int]:
+        """Vocabulary ids of skills, adding unseen ones to the index"""
+        ids = []
+        for skill in skills:
+            skill_id = self._raw_ids.get(skill)
+            if skill_id is None:
+                key = normalize_skill(skill)
+                if not key:
+                    continue
+                skill_id = self._ids.get(key)
+                if skill_id is None:
+                    skill_id = self._add(key)
+                self._raw_ids[skill] = skill_id
+            ids.append(skill_id)
+        return ids
+
+    def _add(self, key: str) -> int:
+        with self._lock:
+            if key in self._ids:
+                return self._ids[key]
+            skill_id = len(self._sizes)
+            grams = trigrams(key)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(skill_id)
+            self._sizes.append(len(grams))
+            self._ids[key] = skill_id
+            # A new skill can satisfy requirements resolved earlier
+            self._resolved.clear()
+            return skill_id
+
+    def resolve(self, requirement: str) -> FrozenSet[int]:
+        """Ids of the vocabulary skills that satisfy a requirement"""
+        cache_key = requirement.strip().lower()
+        cached = self._resolved.get(cache_key)
+        if cached is not None:
+            return cached
+        # Under the lock so a skill added meanwhile cannot leave a stale cache entry
+        with self._lock:
+            matched: Set[int] = set()
+            for piece in requirement_pieces(requirement):
+                skill_id = self._ids.get(piece)
+                if skill_id is not None:
+                    matched.add(skill_id)
+                if len(piece) >= SKILL_MIN_FUZZY_CHARS:
+                    matched.update(self._fuzzy(piece))
+            resolved = self._resolved[cache_key] = frozenset(matched)
+        return resolved
+
+    def _fuzzy(self, piece: str) -> List[int]:
+        """Vocabulary skills within the similarity threshold of a piece"""
+        grams = trigrams(piece)
+        shared = Counter(skill_id for gram in grams for skill_id in self._postings.get(gram, ()))
+        return [
+            skill_id
+            for skill_id, overlap in shared.items()
+            if 2 * overlap / (len(grams) + self._sizes[skill_id]) >= self.threshold
+        ]
+
+    def match_matrix(self, skill_lists: Sequence[Sequence[str]], requirements: Sequence[str]) -> np.ndarray:
+        """Boolean (candidates x requirements) matrix of satisfied requirements"""
+        candidate_ids = [self.skill_ids(skills) for skills in skill_lists]
+        resolved = [self.resolve(requirement) for requirement in requirements]
+        # Only vocabulary skills that satisfy some requirement need a column
+        columns = {skill_id: column for column, skill_id in enumerate(sorted(set().union(*resolved)))}
+
+        satisfies = np.zeros((len(requirements), len(columns)), dtype=np.float32)
+        for row, skill_ids in enumerate(resolved):
+            satisfies[row, [columns[skill_id] for skill_id in skill_ids]] = 1
+
+        rows = [row for row, ids in enumerate(candidate_ids) for skill_id in ids if skill_id in columns]
+        cols = [columns[skill_id] for ids in candidate_ids for skill_id in ids if skill_id in columns]
+        has = np.zeros((len(candidate_ids), len(columns)), dtype=np.float32)
+        has[rows, cols] = 1
+        return (has @ satisfies.T) > 0
+
+    def match(self, skills: Sequence[str], requirements: Sequence[str]) -> np.ndarray:
+        """Which requirements one candidate satisfies"""
+        return self.match_matrix([skills], requirements)[0]
+
+
+skill_matcher = SkillMatcher()
@@ -0,0 +1,176 @@
+"""
+Structured JSON logging that stays off the request path.
+
+Records are put on an in-memory queue by a QueueHandler and written to stderr
+by a background QueueListener, so a slow terminal or pipe never blocks a
+request. Every record carries the current request's correlation id. Field
+values are truncated before they are queued, and high-volume events can be
+sampled per event name with LOG_SAMPLE_RATES, e.g. "answer_submitted=0.1".
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+from typing import Any, Dict
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_MAX_FIELD_CHARS = int(os.getenv("LOG_MAX_FIELD_CHARS", "256"))
+LOG_MAX_LIST_ITEMS = int(os.getenv("LOG_MAX_LIST_ITEMS", "10"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+
+def _parse_sample_rates(value: str) -> Dict[str, float]:
+    rates = {}
+    for item in value.split(","):
+        event, _, rate = item.partition("=")
+        if event.strip() and rate.strip():
+            rates[event.strip()] = float(rate)
+    return rates
+
+
+LOG_SAMPLE_RATES = _parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", ""))
+
+request_id_var: contextvars.ContextVar = contextvars.ContextVar("request_id", default=None)
+
+_listener = None
+_dropped = 0
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The correlation id lives in a contextvar, so read it on the calling task
+        record.request_id = request_id_var.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        global _dropped
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _dropped += 1
+
+
+def configure_logging():
+    """Route the "teamsync" logger through the background queue. Safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(JsonFormatter())
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=False)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    logger = logging.getLogger("teamsync")
+    logger.setLevel(LOG_LEVEL)
+    logger.addHandler(_DroppingQueueHandler(log_queue))
+    logger.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    configure_logging()
+    return logging.getLogger(f"teamsync.{name}")
+
+
+def truncate(value: Any) -> Any:
+    """Shorten long strings and lists and summarize nested payloads so log lines stay small"""
+    if isinstance(value, str):
+        if len(value) > LOG_MAX_FIELD_CHARS:
+            return f"{value[:LOG_MAX_FIELD_CHARS]}...(+{len(value) - LOG_MAX_FIELD_CHARS} chars)"
+        return value
+    if isinstance(value, (list, tuple)):
+        items = [truncate(item) for item in value[:LOG_MAX_LIST_ITEMS]]
+        if len(value) > LOG_MAX_LIST_ITEMS:
+            items.append(f"...(+{len(value) - LOG_MAX_LIST_ITEMS} items)")
+        return items
+    if isinstance(value, dict):
+        return {key: truncate(item) for key, item in list(value.items())[:LOG_MAX_LIST_ITEMS]}
+    return value
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields):
+    """Log a named event with structured fields, subject to the event's sample rate"""
+    if not logger.isEnabledFor(level):
+        return
+    rate = LOG_SAMPLE_RATES.get(event, 1.0)
+    if rate < 1.0:
+        if random.random() >= rate:
+            return
+        fields["sample_rate"] = rate
+    logger.log(level, event, extra={"fields": {key: truncate(value) for key, value in fields.items()}})
+
+
+def new_request_id() -> str:
+    return f"{int(time.time() * 1000):x}-{random.getrandbits(32):08x}"
+
+
+def dropped_records() -> int:
+    return _dropped
+
+
+class CorrelationIdMiddleware:
+    """
+    Tag every log line for an HTTP request with its X-Request-ID (generated if absent)
+    and echo it on the response.
+
+    Plain ASGI, so streamed responses (SSE, Range downloads) pass through without
+    the task group and body copy of BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        request_id = request_id or new_request_id()
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,260 @@
+"""
+Live eye-tracking and speech telemetry for interviews in progress.
+
+The interview page streams batched samples over a WebSocket instead of posting
+full summaries with every answer. Each frame is folded into running statistics
+as it arrives, so the summary used when an interview completes is ready without
+reprocessing anything.
+
+Binary frames are struct-packed, little endian:
+
+    header  <BBH   version (1), kind, sample count
+    gaze    <IfffB t_ms, attention 0-100, gaze_x, gaze_y, flags   (kind 1)
+    speech  <Iff   t_ms, volume 0-1, voice_confidence 0-1          (kind 2)
+
+Gaze flags: bit 0 distracted, bit 1 eye movement. If msgpack is installed,
+frames may also be msgpack maps: {"kind": "gaze" | "speech", "samples": [[...], ...]}
+with the same fields per sample.
+"""
+
+import math
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+TELEMETRY_MAX_SAMPLES_PER_FRAME = int(os.getenv("TELEMETRY_MAX_SAMPLES_PER_FRAME", "2048"))
+TELEMETRY_SESSION_TTL_SECONDS = int(os.getenv("TELEMETRY_SESSION_TTL_SECONDS", str(4 * 3600)))
+
+FRAME_VERSION = 1
+KIND_GAZE = 1
+KIND_SPEECH = 2
+
+HEADER = struct.Struct("<BBH")
+GAZE_SAMPLE = struct.Struct("<IfffB")
+SPEECH_SAMPLE = struct.Struct("<Iff")
+SAMPLE_FORMATS = {KIND_GAZE: GAZE_SAMPLE, KIND_SPEECH: SPEECH_SAMPLE}
+KIND_NAMES = {"gaze": KIND_GAZE, "speech": KIND_SPEECH}
+
+FLAG_DISTRACTED = 1
+FLAG_EYE_MOVEMENT = 2
+MAX_T_MS = 2 ** 32 - 1
+
+# Volume above which a speech sample counts as speaking
+SPEAKING_VOLUME = 0.05
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class FrameError(ValueError):
+    """A telemetry frame could not be decoded"""
+
+
+def pack_frame(kind: int, samples: List[tuple]) -> bytes:
+    """Encode samples as a binary frame; the inverse of decode_frame"""
+    sample_format = SAMPLE_FORMATS[kind]
+    return HEADER.pack(FRAME_VERSION, kind, len(samples)) + b"".join(
+        sample_format.pack(*sample) for sample in samples
+    )
+
+
+def _number(value: Any, low: float = -math.inf, high: float = math.inf) -> float:
+    number = float(value)
+    if not (math.isfinite(number) and low <= number <= high):
+        raise ValueError(f"{value!r} is not a finite number in [{low}, {high}]")
+    return number
+
+
+def _timestamp(value: Any) -> int:
+    t_ms = int(value)
+    if not 0 <= t_ms <= MAX_T_MS:
+        raise ValueError(f"timestamp {value!r} is not an unsigned 32-bit value")
+    return t_ms
+
+
+def _coerce_sample(kind: int, sample: tuple) -> tuple:
+    """A msgpack sample converted to the types and ranges of the binary format"""
+    width = len(SAMPLE_FORMATS[kind].format) - 1
+    if len(sample) != width:
+        raise ValueError(f"samples need {width} fields")
+    if kind == KIND_GAZE:
+        t_ms, attention, gaze_x, gaze_y, flags = sample
+        flags = int(flags)
+        if not 0 <= flags <= 255:
+            raise ValueError(f"flags {flags} do not fit in a byte")
+        return (
+            _timestamp(t_ms),
+            _number(attention, 0.0, 100.0),
+            _number(gaze_x),
+            _number(gaze_y),
+            flags,
+        )
+    t_ms, volume, voice_confidence = sample
+    return _timestamp(t_ms), _number(volume, 0.0, 1.0), _number(voice_confidence, 0.0, 1.0)
+
+
+def decode_frame(data: bytes) -> Tuple[int, List[tuple]]:
+    """Return (kind, samples) from a struct-packed or msgpack frame"""
+    if len(data) >= HEADER.size and data[0] == FRAME_VERSION:
+        _, kind, count = HEADER.unpack_from(data)
+        sample_format = SAMPLE_FORMATS.get(kind)
+        if sample_format is None:
+            raise FrameError(f"Unknown frame kind {kind}")
+        if count > TELEMETRY_MAX_SAMPLES_PER_FRAME:
+            raise FrameError(f"Frame has {count} samples, limit is {TELEMETRY_MAX_SAMPLES_PER_FRAME}")
+        body = memoryview(data)[HEADER.size:]
+        if len(body) != count * sample_format.size:
+            raise FrameError("Frame length does not match its sample count")
+        return kind, list(sample_format.iter_unpack(body))
+
+    if msgpack is None:
+        raise FrameError("Unrecognized frame (msgpack frames need the msgpack package)")
+    try:
+        message = msgpack.unpackb(data, raw=False)
+        kind = KIND_NAMES[message["kind"]]
+        samples = message["samples"]
+        count = len(samples)
+    except Exception as e:
+        raise FrameError(f"Invalid msgpack frame: {e}")
+    if count > TELEMETRY_MAX_SAMPLES_PER_FRAME:
+        raise FrameError(f"Frame has {count} samples, limit is {TELEMETRY_MAX_SAMPLES_PER_FRAME}")
+    # Validate every sample before returning any, so a bad frame never partly updates a session
+    try:
+        return kind, [_coerce_sample(kind, tuple(sample)) for sample in samples]
+    except (TypeError, ValueError, OverflowError) as e:
+        raise FrameError(f"Invalid {message['kind']} sample: {e}")
+
+
+class TelemetrySession:
+    """Running attention, distraction and speech statistics for one interview"""
+
+    def __init__(self, interview_id: int):
+        self.interview_id = interview_id
+        self.updated_at = time.monotonic()
+        self.frames = 0
+        # Gaze: Welford running mean/variance of attention
+        self.gaze_samples = 0
+        self.attention_mean = 0.0
+        self._attention_m2 = 0.0
+        self.attention_min: Optional[float] = None
+        self.distraction_count = 0
+        self.distracted_samples = 0
+        self.eye_movements = 0
+        self._distracted = False
+        self.last_gaze: Optional[Tuple[float, float]] = None
+        # Speech
+        self.speech_samples = 0
+        self.speaking_samples = 0
+        self.voice_confidence_sum = 0.0
+        self.first_t_ms: Optional[int] = None
+        self.last_t_ms: Optional[int] = None
+
+    def add(self, kind: int, samples: List[tuple]):
+        self.frames += 1
+        self.updated_at = time.monotonic()
+        if kind == KIND_GAZE:
+            self._add_gaze(samples)
+        elif kind == KIND_SPEECH:
+            self._add_speech(samples)
+
+    def _track_time(self, t_ms: int):
+        if self.first_t_ms is None or t_ms < self.first_t_ms:
+            self.first_t_ms = t_ms
+        if self.last_t_ms is None or t_ms > self.last_t_ms:
+            self.last_t_ms = t_ms
+
+    def _add_gaze(self, samples: List[tuple]):
+        for t_ms, attention, gaze_x, gaze_y, flags in samples:
+            if not math.isfinite(attention):
+                continue
+            self._track_time(t_ms)
+            self.gaze_samples += 1
+            delta = attention - self.attention_mean
+            self.attention_mean += delta / self.gaze_samples
+            self._attention_m2 += delta * (attention - self.attention_mean)
+            if self.attention_min is None or attention < self.attention_min:
+                self.attention_min = attention
+
+            distracted = bool(flags & FLAG_DISTRACTED)
+            if distracted:
+                self.distracted_samples += 1
+                if not self._distracted:
+                    self.distraction_count += 1
+            self._distracted = distracted
+            if flags & FLAG_EYE_MOVEMENT:
+                self.eye_movements += 1
+            self.last_gaze = (gaze_x, gaze_y)
+
+    def _add_speech(self, samples: List[tuple]):
+        for t_ms, volume, voice_confidence in samples:
+            self._track_time(t_ms)
+            self.speech_samples += 1
+            if volume >= SPEAKING_VOLUME:
+                self.speaking_samples += 1
+            self.voice_confidence_sum += voice_confidence
+
+    def summary(self) -> Dict[str, Any]:
+        """Statistics in the eye_tracking_summary shape the interview page posts on completion"""
+        summary: Dict[str, Any] = {
+            "frames": self.frames,
+            "gazeSamples": self.gaze_samples,
+            "eyeMovements": self.eye_movements,
+            "distractionCount": self.distraction_count,
+        }
+        if self.gaze_samples:
+            summary.update(
+                attentionScore=round(self.attention_mean, 2),
+                attentionStdDev=round(math.sqrt(self._attention_m2 / self.gaze_samples), 2),
+                attentionMin=round(self.attention_min, 2),
+                distractedRatio=round(self.distracted_samples / self.gaze_samples, 4),
+            )
+        if self.speech_samples:
+            summary.update(
+                speakingRatio=round(self.speaking_samples / self.speech_samples, 4),
+                voiceConfidence=round(self.voice_confidence_sum / self.speech_samples, 4),
+            )
+        if self.first_t_ms is not None:
+            summary["durationSeconds"] = round((self.last_t_ms - self.first_t_ms) / 1000, 3)
+        return summary
+
+
+class TelemetrySessions:
+    """Per-interview sessions; idle sessions expire after TELEMETRY_SESSION_TTL_SECONDS"""
+
+    def __init__(self, ttl_seconds: int = TELEMETRY_SESSION_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._sessions: Dict[int, TelemetrySession] = {}
+        self._lock = threading.Lock()
+
+    def session(self, interview_id: int) -> TelemetrySession:
+        with self._lock:
+            self._expire()
+            session = self._sessions.get(interview_id)
+            if session is None:
+                session = self._sessions[interview_id] = TelemetrySession(interview_id)
+            return session
+
+    def get(self, interview_id: int) -> Optional[TelemetrySession]:
+        with self._lock:
+            return self._sessions.get(interview_id)
+
+    def pop(self, interview_id: int) -> Optional[TelemetrySession]:
+        with self._lock:
+            return self._sessions.pop(interview_id, None)
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.ttl_seconds
+        for interview_id in [i for i, s in self._sessions.items() if s.updated_at < cutoff]:
+            del self._sessions[interview_id]
+
+
+telemetry_sessions = TelemetrySessions()
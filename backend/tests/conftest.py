@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Services are imported as top-level "services.*", as the apps run from backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Never touch the database configured in .env; load_dotenv() does not override this
+os.environ["DATABASE_URL"] = "sqlite://"
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from services import answer_scoring as answer_scoring_module
+from services.answer_scoring import AnswerScoring
+
+
+class FakeInterviewAI:
+    def __init__(self):
+        self.scored = []
+        self.gates = {}
+        self.fail = set()
+
+    async def analyze_answer(self, question, response):
+        self.scored.append(response)
+        gate = self.gates.get(response)
+        if gate is not None:
+            await gate.wait()
+        if response in self.fail:
+            return {"error": "model unavailable"}
+        return {"response": response, "score": len(response)}
+
+    def aggregate_answer_analyses(self, results):
+        return {"responses": [result["response"] for result in results]}
+
+
+@pytest.fixture
+def ai(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scoring.db'}", connect_args={"check_same_thread": False})
+    import models  # noqa: F401  (registers the tables on Base.metadata)
+
+    Base.metadata.create_all(engine)
+    fake = FakeInterviewAI()
+    monkeypatch.setattr(answer_scoring_module, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(answer_scoring_module, "get_interview_ai", lambda: fake)
+    return fake
+
+
+def test_finish_aggregates_answers_scored_in_the_background(ai):
+    scoring = AnswerScoring()
+
+    async def main():
+        scoring.submit(1, 0, "q0", "first")
+        scoring.submit(1, 1, "q1", "second")
+        return await scoring.finish(1, ["q0", "q1"], ["first", "second"])
+
+    assert asyncio.run(main()) == {"responses": ["first", "second"]}
+    assert sorted(ai.scored) == ["first", "second"]
+
+
+def test_edited_answer_cancels_the_older_scoring(ai):
+    scoring = AnswerScoring()
+
+    async def main():
+        ai.gates["draft"] = asyncio.Event()
+        scoring.submit(1, 0, "q0", "draft")
+        await asyncio.sleep(0)
+        scoring.submit(1, 0, "q0", "final")
+        return await scoring.finish(1, ["q0"], ["final"])
+
+    assert asyncio.run(main()) == {"responses": ["final"]}
+    assert ai.scored == ["draft", "final"]
+
+
+def test_stale_or_failed_answers_are_rescored_on_finish(ai):
+    scoring = AnswerScoring()
+    ai.fail.add("second")
+
+    async def main():
+        scoring.submit(1, 0, "q0", "first")
+        scoring.submit(1, 1, "q1", "second")
+        await asyncio.sleep(0.01)
+        ai.fail.clear()
+        # Answer 0 changed without being resubmitted; answer 1 failed to score
+        return await scoring.finish(1, ["q0", "q1"], ["first, edited", "second"])
+
+    assert asyncio.run(main()) == {"responses": ["first, edited", "second"]}
+    assert ai.scored.count("second") == 2
+
+
+def test_finish_without_incremental_scoring_returns_none(ai):
+    assert asyncio.run(AnswerScoring().finish(1, ["q0"], ["answer"])) is None
+    assert ai.scored == []
@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+import redis
+
+from services import cache as cache_module
+from services.cache import Cache, MemoryBackend, RedisBackend
+
+
+def test_concurrent_misses_call_the_loader_once():
+    cache = Cache(MemoryBackend())
+    calls = []
+    release = threading.Event()
+
+    def load():
+        calls.append(1)
+        release.wait(2)
+        return {"id": 1}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_set("job:1", load))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    assert len(calls) == 1
+    assert results == [{"id": 1}] * 8
+    assert cache.get("job:1") == {"id": 1}
+
+
+def test_loader_error_reaches_every_waiter():
+    cache = Cache(MemoryBackend())
+    release = threading.Event()
+    errors = []
+
+    def load():
+        release.wait(2)
+        raise ValueError("db down")
+
+    def call():
+        try:
+            cache.get_or_set("job:1", load)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    assert len(errors) == 4
+    # Nothing cached, so the next call loads again
+    assert cache.get_or_set("job:1", lambda: {"id": 1}) == {"id": 1}
+
+
+def test_batch_loads_only_missing_keys():
+    cache = Cache(MemoryBackend())
+    cache.set("candidate:1", {"id": 1})
+    requested = []
+
+    def load(keys):
+        requested.append(keys)
+        return {key: {"id": key} for key in keys if key != "candidate:3"}
+
+    found = cache.get_or_set_many(["candidate:1", "candidate:2", "candidate:3"], load)
+    assert requested == [["candidate:2", "candidate:3"]]
+    assert list(found) == ["candidate:1", "candidate:2"]
+
+
+def test_load_that_races_an_invalidation_is_not_written_back():
+    cache = Cache(MemoryBackend())
+
+    def load():
+        # The row changes (and is invalidated) while the old version is being read
+        cache.invalidate("job:1")
+        return {"title": "old"}
+
+    assert cache.get_or_set("job:1", load) == {"title": "old"}
+    assert cache.get("job:1") is None
+
+
+def test_memory_backend_expires_and_evicts():
+    backend = MemoryBackend(max_entries=2)
+    backend.set_many({"a": 1}, ttl=0)
+    assert backend.get_many(["a"]) == {}
+    backend.set_many({"a": 1, "b": 2}, ttl=60)
+    backend.get_many(["a"])
+    backend.set_many({"c": 3}, ttl=60)
+    assert backend.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+class FakeRedis:
+    """Just enough of redis.Redis for RedisBackend, with a switch to fail every call"""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise redis.ConnectionError("connection refused")
+
+    def ping(self):
+        self._check()
+
+    def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        fake = self
+
+        class Pipeline:
+            def __init__(self):
+                self.ops = []
+
+            def set(self, key, value, ex=None):
+                self.ops.append((key, value))
+
+            def execute(self):
+                fake._check()
+                for key, value in self.ops:
+                    fake.data[key] = value.encode()
+
+        return Pipeline()
+
+    def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key if isinstance(key, str) else key.decode(), None)
+
+    def scan_iter(self, match):
+        self._check()
+        return [key for key in list(self.data) if key.startswith(match.rstrip("*"))]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(redis.Redis, "from_url", classmethod(lambda cls, url, **kwargs: client))
+    monkeypatch.setattr(cache_module, "CACHE_REDIS_RETRY_SECONDS", 0.05)
+    return client
+
+
+def test_redis_outage_falls_through_to_the_loader(fake_redis, capsys):
+    cache = Cache(RedisBackend("redis://fake"))
+    fake_redis.down = True
+    assert cache.get_or_set("job:1", lambda: {"id": 1}) == {"id": 1}
+    assert cache.backend.errors == 1
+    assert "bypassing" in capsys.readouterr().out
+    # Bypassed for the retry window: no further calls reach Redis
+    assert cache.get_or_set("job:1", lambda: {"id": 2}) == {"id": 2}
+    assert cache.backend.errors == 1
+
+
+def test_deletes_lost_to_an_outage_are_replayed(fake_redis):
+    cache = Cache(RedisBackend("redis://fake"))
+    cache.set("job:1", {"title": "old"})
+    fake_redis.down = True
+    cache.invalidate("job:1")
+    fake_redis.down = False
+    time.sleep(0.06)
+    assert cache.get("job:1") is None
+    assert fake_redis.data == {}
@@ -0,0 +1,81 @@
+import pytest
+
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def breaker(cooldown_seconds=0.0):
+    return CircuitBreaker(window_size=10, min_calls=4, max_error_rate=0.5, max_p95_seconds=1.0, cooldown_seconds=cooldown_seconds)
+
+
+def record_calls(b, outcomes, latency=0.1):
+    for ok in outcomes:
+        permit = b.acquire()
+        assert permit == "normal"
+        b.record(permit, latency, ok)
+
+
+def open_breaker(b):
+    record_calls(b, [False] * 4)
+    assert b.state == OPEN
+
+
+def test_stays_closed_until_min_calls():
+    b = breaker()
+    record_calls(b, [False] * 3)
+    assert b.state == CLOSED
+
+
+def test_opens_on_error_rate():
+    b = breaker(cooldown_seconds=60)
+    record_calls(b, [True, True, False, False])
+    assert b.state == OPEN
+    assert b.times_opened == 1
+    assert b.acquire() is None
+
+
+def test_opens_on_p95_latency():
+    b = breaker(cooldown_seconds=60)
+    record_calls(b, [True] * 4, latency=2.0)
+    assert b.state == OPEN
+
+
+def test_healthy_calls_keep_it_closed():
+    b = breaker()
+    record_calls(b, [True, True, True, False] + [True] * 6)
+    assert b.state == CLOSED
+
+
+def test_cooldown_admits_a_single_probe():
+    b = breaker()
+    open_breaker(b)
+    assert b.acquire() == "probe"
+    assert b.state == HALF_OPEN
+    # Everyone else is refused while the probe is out
+    assert b.acquire() is None
+
+
+def test_successful_probe_closes_and_resets_the_window():
+    b = breaker()
+    open_breaker(b)
+    b.record(b.acquire(), 0.1, True)
+    assert b.state == CLOSED
+    assert b.stats()["window_calls"] == 0
+    assert b.acquire() == "normal"
+
+
+@pytest.mark.parametrize("latency, ok", [(0.1, False), (5.0, True)])
+def test_failed_or_slow_probe_reopens(latency, ok):
+    b = breaker()
+    open_breaker(b)
+    b.record(b.acquire(), latency, ok)
+    assert b.state == OPEN
+    assert b.times_opened == 2
+
+
+def test_calls_admitted_before_opening_do_not_count_after():
+    b = breaker(cooldown_seconds=60)
+    late = b.acquire()
+    open_breaker(b)
+    b.record(late, 0.1, True)
+    assert b.state == OPEN
+    assert b.stats()["window_calls"] == 4
@@ -0,0 +1,94 @@
+import sqlite3
+
+import pytest
+
+from services.interview_store import InterviewStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return InterviewStore(str(tmp_path / "interviews.db"), hot_size=2)
+
+
+def record(interview_id, score=0, **fields):
+    return {"interview_id": interview_id, "overall_score": score, **fields}
+
+
+def ids(records):
+    return [r["interview_id"] for r in records]
+
+
+def test_newer_record_supersedes_older(store):
+    store.add_interview(record(1, 50))
+    store.add_interview(record(2, 60))
+    store.add_interview(record(1, 90))
+    assert store.count() == 2
+    assert store.get_interview(1)["overall_score"] == 90
+    # Ordered by latest version, so the re-stored interview moves to the end
+    assert ids(store.get_interviews()) == [2, 1]
+    assert [r["overall_score"] for r in store.get_interviews()] == [60, 90]
+
+
+def test_paging_walks_latest_versions_only(store):
+    for i in range(1, 8):
+        store.add_interview(record(i))
+    store.add_interview(record(3, 99))
+    assert ids(store.get_interviews(skip=0, limit=3)) == [1, 2, 4]
+    assert ids(store.get_interviews(skip=3, limit=3)) == [5, 6, 7]
+    assert ids(store.get_interviews(skip=6, limit=3)) == [3]
+    assert store.get_interviews(skip=7, limit=3) == []
+
+
+def test_iter_interviews_matches_full_listing(store):
+    for i in range(1, 12):
+        store.add_interview(record(i % 7))
+    assert ids(store.iter_interviews(batch_size=3)) == ids(store.get_interviews())
+
+
+def test_find_filters_latest_versions(store):
+    store.add_interview(record(1, candidate_id=10, job_id=5))
+    store.add_interview(record(2, candidate_id=11, job_id=5))
+    store.add_interview(record(1, candidate_id=10, job_id=6))
+    assert ids(store.find(job=5)) == [2]
+    assert ids(store.find(job=6, candidate=10)) == [1]
+
+
+def test_recent_interviews_beyond_hot_cache_come_from_disk(store):
+    for i in range(1, 5):
+        store.add_interview(record(i))
+    assert ids(store.get_recent_interviews(2)) == [3, 4]
+    assert ids(store.get_recent_interviews(3)) == [2, 3, 4]
+
+
+def test_survives_reopen(tmp_path):
+    path = str(tmp_path / "interviews.db")
+    first = InterviewStore(path)
+    first.add_interview(record(1, 10))
+    first.add_interview(record(1, 20))
+    reopened = InterviewStore(path)
+    assert reopened.count() == 1
+    assert reopened.get_interview(1)["overall_score"] == 20
+
+
+def test_latest_table_is_backfilled_for_old_logs(tmp_path):
+    path = str(tmp_path / "interviews.db")
+    InterviewStore(path).add_interview(record(1))
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO interview_records (interview_id, payload) VALUES (1, '{\"interview_id\": 1, \"v\": 2}')")
+    conn.execute("INSERT INTO interview_records (interview_id, payload) VALUES (2, '{\"interview_id\": 2}')")
+    conn.execute("DELETE FROM interview_latest")
+    conn.commit()
+    conn.close()
+    store = InterviewStore(path)
+    assert store.count() == 2
+    assert store.get_interview(1)["v"] == 2
+
+
+def test_test_interviews_never_replace_real_ones(store):
+    store.add_interview(record(1))
+    store.add_interview(record(3))
+    first = store.add_test_interview(lambda test_id: record(test_id, test=True))
+    second = store.add_test_interview(lambda test_id: record(test_id, test=True))
+    assert (first["interview_id"], second["interview_id"]) == (-1, -2)
+    assert store.count() == 4
+    assert "test" not in store.get_interview(3)
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from services import notifications
+from services.notifications import NotificationQueue
+
+
+@pytest.fixture(autouse=True)
+def fast_queue(monkeypatch):
+    monkeypatch.setattr(notifications, "NOTIFY_BATCH_WINDOW_SECONDS", 0.01)
+    monkeypatch.setattr(notifications, "NOTIFY_BACKOFF_SECONDS", 0.01)
+    monkeypatch.setattr(notifications, "NOTIFY_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(notifications, "NOTIFY_DIGEST_THRESHOLD", 3)
+
+
+def notification(interview_id, score=80, notification_type="interview_completed"):
+    return {
+        "notification_type": notification_type,
+        "interview_id": interview_id,
+        "performance_summary": {"overall_score": score},
+    }
+
+
+def run(queue, enqueue_before=(), enqueue_after=(), until=lambda: True, timeout=2.0):
+    async def main():
+        for n in enqueue_before:
+            queue.enqueue(n)
+        queue.start()
+        for n in enqueue_after:
+            queue.enqueue(n)
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not until():
+            assert asyncio.get_running_loop().time() < deadline, queue.stats
+            await asyncio.sleep(0.005)
+        # Give anything that should not happen a chance to
+        await asyncio.sleep(0.05)
+        await queue.stop()
+
+    asyncio.run(main())
+
+
+def test_same_interview_is_coalesced_before_delivery():
+    batches = []
+
+    async def deliver(batch):
+        batches.append(batch)
+
+    queue = NotificationQueue(deliver, db_path=None, workers=1)
+    run(queue, enqueue_before=[notification(1, 50), notification(1, 90)], until=lambda: batches)
+    assert batches == [[notification(1, 90)]]
+    assert queue.stats["deduplicated"] == 1
+    assert queue.stats["delivered"] == 1
+
+
+def test_different_types_are_not_coalesced():
+    batches = []
+
+    async def deliver(batch):
+        batches.append(batch)
+
+    queue = NotificationQueue(deliver, db_path=None, workers=1)
+    pending = [notification(1), notification(1, notification_type="review_required")]
+    run(queue, enqueue_after=pending, until=lambda: queue.stats["delivered"] == 2)
+    assert sorted(n["notification_type"] for batch in batches for n in batch) == ["interview_completed", "review_required"]
+
+
+def test_burst_is_sent_as_one_digest():
+    batches = []
+
+    async def deliver(batch):
+        batches.append(batch)
+
+    queue = NotificationQueue(deliver, db_path=None, workers=1)
+    run(queue, enqueue_before=[notification(i, 60 + i * 10) for i in (1, 2, 3)], until=lambda: batches)
+    assert len(batches) == 1 and len(batches[0]) == 1
+    sent = batches[0][0]
+    assert sent["notification_type"] == "digest"
+    assert sent["interview_ids"] == [1, 2, 3]
+    assert sent["average_score"] == 80
+    assert queue.stats["digests"] == 1
+
+
+def test_failed_delivery_is_retried():
+    attempts = []
+
+    async def deliver(batch):
+        attempts.append(batch)
+        if len(attempts) < 3:
+            raise RuntimeError("webhook down")
+
+    queue = NotificationQueue(deliver, db_path=None, workers=1)
+    run(queue, enqueue_after=[notification(1)], until=lambda: queue.stats["delivered"])
+    assert len(attempts) == 3
+    assert queue.stats["retries"] == 2
+    assert queue.stats["dropped"] == 0
+
+
+def test_gives_up_after_max_attempts():
+    attempts = []
+
+    async def deliver(batch):
+        attempts.append(batch)
+        raise RuntimeError("webhook down")
+
+    queue = NotificationQueue(deliver, db_path=None, workers=1)
+    run(queue, enqueue_after=[notification(1)], until=lambda: queue.stats["dropped"])
+    assert len(attempts) == 3
+    assert queue.stats["retries"] == 2
+    assert queue.stats["delivered"] == 0
+
+
+def test_pending_notifications_survive_restart(tmp_path):
+    path = str(tmp_path / "notifications.db")
+
+    async def fail(batch):
+        raise RuntimeError("webhook down")
+
+    first = NotificationQueue(fail, db_path=path, workers=1)
+    first.enqueue(notification(1))
+
+    batches = []
+
+    async def deliver(batch):
+        batches.append(batch)
+
+    second = NotificationQueue(deliver, db_path=path, workers=1)
+    run(second, until=lambda: batches)
+    assert batches == [[notification(1)]]
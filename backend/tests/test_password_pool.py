@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from services import password_pool as password_pool_module
+from services.password_pool import PasswordPool, RateLimiter
+
+
+def test_rate_limiter_allows_a_burst_then_refuses():
+    limiter = RateLimiter(per_minute=3)
+    assert [limiter.allow("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+    # Buckets are per key
+    assert limiter.allow("5.6.7.8")
+
+
+def test_rate_limiter_refills_over_time(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(password_pool_module.time, "monotonic", lambda: now[0])
+    limiter = RateLimiter(per_minute=60)
+    for _ in range(60):
+        assert limiter.allow("key")
+    assert not limiter.allow("key")
+    now[0] += 2
+    assert [limiter.allow("key") for _ in range(3)] == [True, True, False]
+
+
+def test_rate_limiter_forgets_least_recent_keys():
+    limiter = RateLimiter(per_minute=1, max_keys=2)
+    assert limiter.allow("a") and limiter.allow("b")
+    assert limiter.allow("c")
+    # "a" was evicted, so it starts with a full bucket again
+    assert limiter.allow("a")
+    assert not limiter.allow("c")
+
+
+def test_pool_refuses_work_past_max_pending():
+    pool = PasswordPool(workers=1, max_pending=2)
+    release = threading.Event()
+
+    def slow_hash():
+        release.wait(2)
+        return "hash"
+
+    async def main():
+        running = [asyncio.create_task(pool.run(slow_hash)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert pool.pending == 2
+        with pytest.raises(HTTPException) as refused:
+            await pool.run(slow_hash)
+        release.set()
+        return refused.value, await asyncio.gather(*running)
+
+    refused, results = asyncio.run(main())
+    assert refused.status_code == 503
+    assert refused.headers["Retry-After"] == "1"
+    assert results == ["hash", "hash"]
+    assert pool.pending == 0
+
+
+def test_failed_hash_releases_its_slot():
+    pool = PasswordPool(workers=1, max_pending=1)
+
+    def broken():
+        raise ValueError("bad salt")
+
+    async def main():
+        with pytest.raises(ValueError):
+            await pool.run(broken)
+        return await pool.run(lambda: "hash")
+
+    assert asyncio.run(main()) == "hash"
+
+
+def test_admission_limits_ip_and_account_separately(monkeypatch):
+    monkeypatch.setattr(password_pool_module, "ip_limiter", RateLimiter(per_minute=100))
+    monkeypatch.setattr(password_pool_module, "account_limiter", RateLimiter(per_minute=2))
+    password_pool_module.admit_auth_attempt("1.2.3.4", "Alice@example.com")
+    password_pool_module.admit_auth_attempt("5.6.7.8", "alice@example.com")
+    with pytest.raises(HTTPException) as refused:
+        password_pool_module.admit_auth_attempt("9.9.9.9", "ALICE@example.com")
+    assert refused.value.status_code == 429
+    assert "account" in refused.value.detail
+    password_pool_module.admit_auth_attempt("1.2.3.4", "bob@example.com")
@@ -0,0 +1,52 @@
+import pytest
+
+from services.skill_matcher import SkillMatcher
+
+
+@pytest.fixture
+def matcher():
+    return SkillMatcher(threshold=0.6)
+
+
+@pytest.mark.parametrize("requirement", [
+    "Python",
+    "Experience with React",
+    "3+ years of Python experience",
+    "Strong REACT skills",
+])
+def test_phrase_requirements_match_skills(matcher, requirement):
+    assert matcher.match(["Python", "React"], [requirement])[0]
+
+
+@pytest.mark.parametrize("skills, requirement", [
+    (["R"], "React"),
+    (["R"], "Experience with React"),
+    (["Java"], "JavaScript"),
+    (["JavaScript"], "Java"),
+    (["JavaScript"], "3+ years of Java experience"),
+    (["C"], "C++"),
+])
+def test_short_or_overlapping_skills_do_not_match(matcher, skills, requirement):
+    assert not matcher.match(skills, [requirement])[0]
+
+
+def test_short_skill_matches_exactly(matcher):
+    assert matcher.match(["R"], ["Statistics in R"])[0]
+
+
+def test_spelling_variants_and_multiword_skills(matcher):
+    result = matcher.match(["nodejs", "Machine Learning"], ["Node.js", "Strong machine learning background"])
+    assert result.tolist() == [True, True]
+
+
+def test_match_matrix_covers_every_candidate(matcher):
+    matrix = matcher.match_matrix(
+        [["Python", "Git"], ["React", "TypeScript"], []],
+        ["3+ years of Python experience", "Experience with React", "Git"],
+    )
+    assert matrix.tolist() == [[True, False, True], [False, True, False], [False, False, False]]
+
+
+def test_new_skills_invalidate_cached_resolutions(matcher):
+    assert not matcher.match(["Go"], ["Kubernetes"])[0]
+    assert matcher.match(["Kubernetes"], ["Kubernetes"])[0]
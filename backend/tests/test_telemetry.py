@@ -0,0 +1,32 @@
+import pytest
+
+from services.telemetry import KIND_GAZE, KIND_SPEECH, FrameError, decode_frame, pack_frame
+
+msgpack = pytest.importorskip("msgpack")
+
+
+def test_binary_frame_round_trip():
+    samples = [(1000, 80.0, 0.25, 0.5, 1)]
+    assert decode_frame(pack_frame(KIND_GAZE, samples)) == (KIND_GAZE, samples)
+
+
+def test_msgpack_samples_are_coerced():
+    frame = msgpack.packb({"kind": "speech", "samples": [[5, 0.5, 1]]})
+    assert decode_frame(frame) == (KIND_SPEECH, [(5, 0.5, 1.0)])
+
+
+@pytest.mark.parametrize("kind, sample", [
+    ("gaze", [1, "x", 0.5, 0.5, 1]),
+    ("gaze", [-1, 50, 0.5, 0.5, 1]),
+    ("gaze", [1, float("nan"), 0.5, 0.5, 1]),
+    ("gaze", [1, 150, 0.5, 0.5, 1]),
+    ("gaze", [1, 50, 0.5, 0.5, 300]),
+    ("gaze", [1, 50, 0.5]),
+    ("gaze", None),
+    ("speech", [2 ** 32, 0.5, 0.5]),
+    ("speech", [1, 2.0, 0.5]),
+])
+def test_invalid_msgpack_samples_raise_frame_error(kind, sample):
+    frame = msgpack.packb({"kind": kind, "samples": [[1, 50, 0.5, 0.5, 0] if kind == "gaze" else [1, 0.5, 0.5], sample]})
+    with pytest.raises(FrameError):
+        decode_frame(frame)
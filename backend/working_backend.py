@@ -1,36 +1,34 @@
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Optional
 import os
 import json
+import logging
 import re
 from datetime import datetime
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Global storage for completed interviews
-completed_interviews = []
+from services.interview_rollups import InterviewRollups
+from services.interview_store import InterviewStore
+from services.repository import Repository, snapshot_path
+from services.skill_matcher import skill_matcher
+from services import media_store
+from services.audio_features import AudioFormatError, audio_pool, speech_scores
+from services.fraud_rules import fraud_engine
+from services.event_feed import admin_feed
+from services.notifications import admin_notifications
+from services.gaze_series import GAZE_DEFAULT_MAX_POINTS, gaze_series
+from services.telemetry import KIND_GAZE, FrameError, decode_frame, telemetry_sessions
+from services.structured_logging import CorrelationIdMiddleware, get_logger, log_event
 
-class InterviewStorage:
-    def __init__(self):
-        self.interviews = []
-    
-    def add_interview(self, interview_data):
-        self.interviews.append(interview_data)
-        print(f"=== INTERVIEW STORED ===")
-        print(f"Interview ID: {interview_data['interview_id']}")
-        print(f"Total stored: {len(self.interviews)}")
-        print(f"=======================")
-    
-    def get_interviews(self):
-        return self.interviews
-    
-    def get_recent_interviews(self, limit=10):
-        return self.interviews[-limit:] if len(self.interviews) > limit else self.interviews
+logger = get_logger("working_backend")
 
-# Global interview storage instance
-interview_storage = InterviewStorage()
+# Completed interviews, persisted across restarts
+interview_storage = InterviewStore()
 
 app = FastAPI(
     title="AI Recruitment Platform - Working",
@@ -45,7 +43,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
+app.add_middleware(CorrelationIdMiddleware)
+
+@app.on_event("startup")
+async def start_background_workers():
+    admin_notifications.start()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    await admin_notifications.stop()
+    for repository in (jobs, candidates, interviews):
+        path = snapshot_path(repository.name)
+        if path:
+            await run_in_threadpool(repository.snapshot, path)
 
 # Mock data for testing
 MOCK_JOBS = [
@@ -110,6 +122,227 @@ MOCK_CANDIDATES = [
     }
 ]
 
+MOCK_INTERVIEWS = [
+    {
+        "id": 1,
+        "candidate_id": 1,
+        "job_id": 1,
+        "scheduled_at": "2024-02-01T10:00:00Z",
+        "status": "scheduled",
+        "questions": [
+            "Tell me about your experience with Python",
+            "How do you handle debugging complex issues?",
+            "Describe a challenging project you worked on"
+        ],
+        "responses": [],
+        "score": None,
+        "analysis": None
+    }
+]
+
+def _load_repository(repository: Repository, seed: List[Dict[str, Any]]) -> Repository:
+    """Restore from the snapshot if REPOSITORY_SNAPSHOT_DIR has one, else seed with mock data"""
+    path = snapshot_path(repository.name)
+    if not (path and repository.restore(path)):
+        for record in seed:
+            repository.add(dict(record))
+    return repository
+
+jobs = _load_repository(
+    Repository("jobs", indexes=("status", "company"), list_indexes=("requirements",)), MOCK_JOBS
+)
+candidates = _load_repository(
+    Repository("candidates", indexes=("location",), list_indexes=("skills",)), MOCK_CANDIDATES
+)
+interviews = _load_repository(
+    Repository("interviews", indexes=("status", "job_id", "candidate_id")), MOCK_INTERVIEWS
+)
+
+# Sample interviews shown on the admin dashboard alongside stored ones
+SAMPLE_INTERVIEWS = [
+    {
+        "interview_id": 4,
+        "candidate_id": "candidate_4",
+        "candidate_name": "Alex Rodriguez",
+        "job_title": "Full Stack Developer",
+        "overall_score": 91.2,
+        "fraud_detection": {
+            "passed": True,
+            "score": 0.94,
+            "red_flags": []
+        },
+        "eye_tracking_analysis": {
+            "attention_score": 0.92,
+            "eye_movements": 28,
+            "distraction_count": 1,
+            "focus_quality": "Excellent"
+        },
+        "speech_analysis": {
+            "confidence": 0.95,
+            "clarity": 0.96,
+            "communication_quality": 0.94
+        },
+        "technical_assessment": {
+            "score": 0.89,
+            "relevance": 0.91,
+            "technical_depth": 0.87,
+            "keywords_found": ["React", "Node.js", "MongoDB", "TypeScript", "AWS"],
+            "strengths": ["Excellent technical skills", "Clear communication", "Strong problem-solving"],
+            "areas_for_improvement": []
+        },
+        "interview_answers": [
+            {
+                "question_id": 1,
+                "question": "Describe your experience with React and state management",
+                "answer": "I have extensive experience with React, including hooks, context API, and Redux for state management. I've built complex applications with real-time updates...",
+                "score": 9.2,
+                "keywords_found": ["React", "hooks", "Redux", "state management", "applications"]
+            },
+            {
+                "question_id": 2,
+                "question": "How do you handle API integration and error handling?",
+                "answer": "I use async/await patterns with proper error handling, implement retry mechanisms, and use interceptors for request/response handling...",
+                "score": 8.8,
+                "keywords_found": ["API", "async/await", "error handling", "retry", "interceptors"]
+            },
+            {
+                "question_id": 3,
+                "question": "Explain your approach to database design and optimization",
+                "answer": "I focus on proper indexing, query optimization, and use both SQL and NoSQL databases based on requirements. I've worked with PostgreSQL, MongoDB...",
+                "score": 9.5,
+                "keywords_found": ["database", "indexing", "optimization", "PostgreSQL", "MongoDB"]
+            }
+        ],
+        "recommendation": "Exceptional candidate",
+        "completed_at": "2024-01-16T14:45:00Z",
+        "requires_review": False
+    },
+    {
+        "interview_id": 1,
+        "candidate_id": "candidate_1",
+        "candidate_name": "John Smith",
+        "job_title": "Senior Software Engineer",
+        "overall_score": 87.5,
+        "fraud_detection": {
+            "passed": True,
+            "score": 0.92,
+            "red_flags": []
+        },
+        "eye_tracking_analysis": {
+            "attention_score": 0.85,
+            "eye_movements": 45,
+            "distraction_count": 2,
+            "focus_quality": "Good"
+        },
+        "speech_analysis": {
+            "confidence": 0.88,
+            "clarity": 0.92,
+            "communication_quality": 0.90
+        },
+        "technical_assessment": {
+            "score": 0.85,
+            "relevance": 0.88,
+            "technical_depth": 0.82,
+            "keywords_found": ["Python", "Django", "React", "AWS"],
+            "strengths": ["Strong technical knowledge", "Clear communication", "Good problem-solving"],
+            "areas_for_improvement": ["Could provide more specific examples"]
+        },
+        "interview_answers": [
+            {
+                "question_id": 1,
+                "question": "Tell me about your experience with Python",
+                "answer": "I have 5 years of experience with Python, working on web applications using Django and Flask...",
+                "score": 8.5,
+                "keywords_found": ["Python", "Django", "Flask", "experience"]
+            },
+            {
+                "question_id": 2,
+                "question": "How do you handle debugging complex issues?",
+                "answer": "I use systematic debugging approaches, starting with logs and then using debugging tools...",
+                "score": 9.0,
+                "keywords_found": ["debugging", "logs", "systematic", "tools"]
+            }
+        ],
+        "recommendation": "Strong candidate",
+        "completed_at": "2024-01-15T10:30:00Z",
+        "requires_review": False
+    },
+    {
+        "interview_id": 2,
+        "candidate_id": "candidate_2",
+        "candidate_name": "Sarah Johnson",
+        "job_title": "Frontend Developer",
+        "overall_score": 72.3,
+        "fraud_detection": {
+            "passed": True,
+            "score": 0.78,
+            "red_flags": ["Low attention score"]
+        },
+        "eye_tracking_analysis": {
+            "attention_score": 0.65,
+            "eye_movements": 78,
+            "distraction_count": 8,
+            "focus_quality": "Needs improvement"
+        },
+        "speech_analysis": {
+            "confidence": 0.75,
+            "clarity": 0.80,
+            "communication_quality": 0.78
+        },
+        "technical_assessment": {
+            "score": 0.70,
+            "relevance": 0.75,
+            "technical_depth": 0.68,
+            "keywords_found": ["JavaScript", "React", "CSS"],
+            "strengths": ["Good frontend skills", "Creative thinking"],
+            "areas_for_improvement": ["Needs more backend knowledge", "Could improve focus during interview"]
+        },
+        "recommendation": "Needs further evaluation",
+        "completed_at": "2024-01-14T14:20:00Z",
+        "requires_review": True
+    },
+    {
+        "interview_id": 3,
+        "candidate_id": "candidate_3",
+        "candidate_name": "Mike Chen",
+        "job_title": "Data Scientist",
+        "overall_score": 94.2,
+        "fraud_detection": {
+            "passed": True,
+            "score": 0.96,
+            "red_flags": []
+        },
+        "eye_tracking_analysis": {
+            "attention_score": 0.95,
+            "eye_movements": 32,
+            "distraction_count": 1,
+            "focus_quality": "Excellent"
+        },
+        "speech_analysis": {
+            "confidence": 0.94,
+            "clarity": 0.96,
+            "communication_quality": 0.95
+        },
+        "technical_assessment": {
+            "score": 0.92,
+            "relevance": 0.95,
+            "technical_depth": 0.94,
+            "keywords_found": ["Python", "Machine Learning", "TensorFlow", "Pandas", "SQL"],
+            "strengths": ["Exceptional technical expertise", "Clear communication", "Strong analytical skills"],
+            "areas_for_improvement": []
+        },
+        "recommendation": "Exceptional candidate",
+        "completed_at": "2024-01-13T09:15:00Z",
+        "requires_review": False
+    }
+]
+
+# Dashboard aggregates over stored and sample interviews
+interview_rollups = InterviewRollups()
+interview_rollups.rebuild(interview_storage.iter_interviews())
+for sample in SAMPLE_INTERVIEWS:
+    interview_rollups.add(sample, key=("sample", sample["interview_id"]))
+
 class ResumeParser:
     def __init__(self):
         self.technical_skills = [
@@ -177,48 +410,33 @@ class ResumeParser:
 
     def calculate_skill_match(self, candidate_skills: List[str], job_requirements: List[str]) -> Dict[str, Any]:
         """Calculate skill matching between candidate and job"""
+        return self.calculate_skill_matches([candidate_skills], job_requirements)[0]
+
+    def calculate_skill_matches(self, skill_lists: List[List[str]], job_requirements: List[str]) -> List[Dict[str, Any]]:
+        """Skill match of every candidate against one job, in a single pass"""
         if not job_requirements:
-            return {
+            return [{
                 "match_percentage": 0,
                 "matched_skills": [],
                 "missing_skills": [],
                 "reasoning": "No job requirements specified"
-            }
+            } for _ in skill_lists]
         
-        candidate_skills_lower = [skill.lower().strip() for skill in candidate_skills]
-        job_requirements_lower = [req.lower().strip() for req in job_requirements]
+        requirements = [req.strip() for req in job_requirements]
+        matched = skill_matcher.match_matrix(skill_lists, requirements)
+        percentages = matched.mean(axis=1) * 100
         
-        matched_skills = []
-        missing_skills = []
-        
-        for requirement in job_requirements_lower:
-            requirement_words = requirement.split()
-            is_matched = False
-            
-            for candidate_skill in candidate_skills_lower:
-                # Check if any word from requirement is in candidate skill
-                for req_word in requirement_words:
-                    if req_word in candidate_skill or candidate_skill in req_word:
-                        is_matched = True
-                        break
-                if is_matched:
-                    break
-            
-            if is_matched:
-                matched_skills.append(requirement.title())
-            else:
-                missing_skills.append(requirement.title())
-        
-        # Calculate percentage correctly
-        match_percentage = (len(matched_skills) / len(job_requirements)) * 100
-        match_percentage = min(match_percentage, 100)  # Cap at 100%
-        
-        return {
-            "match_percentage": round(match_percentage, 2),
-            "matched_skills": matched_skills,
-            "missing_skills": missing_skills,
-            "reasoning": f"Matched {len(matched_skills)} out of {len(job_requirements)} required skills"
-        }
+        results = []
+        for row, match_percentage in zip(matched, percentages):
+            matched_skills = [req.title() for req, hit in zip(requirements, row) if hit]
+            missing_skills = [req.title() for req, hit in zip(requirements, row) if not hit]
+            results.append({
+                "match_percentage": round(float(match_percentage), 2),
+                "matched_skills": matched_skills,
+                "missing_skills": missing_skills,
+                "reasoning": f"Matched {len(matched_skills)} out of {len(job_requirements)} required skills"
+            })
+        return results
 
 resume_parser = ResumeParser()
 
@@ -294,13 +512,16 @@ async def get_current_user_info():
 
 # Job endpoints
 @app.get("/api/jobs/")
-async def get_jobs(skip: int = 0, limit: int = 100):
-    return MOCK_JOBS[skip:skip+limit]
+async def get_jobs(skip: int = 0, limit: int = 100, status: str = None, company: str = None, skill: str = None):
+    filters = {"status": status, "company": company, "requirements": skill}
+    filters = {field: value for field, value in filters.items() if value}
+    if filters:
+        return jobs.find(skip=skip, limit=limit, **filters)
+    return jobs.list(skip, limit)
 
 @app.post("/api/jobs/")
 async def create_job(job_data: dict):
-    new_job = {
-        "id": len(MOCK_JOBS) + 1,
+    new_job = jobs.add({
         "title": job_data.get("title", "New Job"),
         "description": job_data.get("description", ""),
         "requirements": job_data.get("requirements", []),
@@ -310,21 +531,24 @@ async def create_job(job_data: dict):
         "company": job_data.get("company", "Unknown Company"),
         "status": "active",
         "created_at": datetime.now().isoformat()
-    }
-    MOCK_JOBS.append(new_job)
+    })
     return new_job
 
 @app.get("/api/jobs/{job_id}")
 async def get_job(job_id: int):
-    job = next((job for job in MOCK_JOBS if job["id"] == job_id), None)
+    job = jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
 # Candidate endpoints
 @app.get("/api/candidates/")
-async def get_candidates(skip: int = 0, limit: int = 100):
-    return MOCK_CANDIDATES[skip:skip+limit]
+async def get_candidates(skip: int = 0, limit: int = 100, skill: str = None, location: str = None):
+    filters = {"skills": skill, "location": location}
+    filters = {field: value for field, value in filters.items() if value}
+    if filters:
+        return candidates.find(skip=skip, limit=limit, **filters)
+    return candidates.list(skip, limit)
 
 @app.post("/api/candidates/upload-resume")
 async def upload_resume(file: UploadFile = File(...)):
@@ -338,8 +562,7 @@ async def upload_resume(file: UploadFile = File(...)):
         
         parsed_data = await resume_parser.parse_resume(file_path)
         
-        new_candidate = {
-            "id": len(MOCK_CANDIDATES) + 1,
+        new_candidate = candidates.add({
             "name": parsed_data.get("name", "Unknown"),
             "email": parsed_data.get("email", ""),
             "resume_url": file_path,
@@ -348,8 +571,7 @@ async def upload_resume(file: UploadFile = File(...)):
             "education": parsed_data.get("education", ""),
             "location": parsed_data.get("location", ""),
             "raw_data": parsed_data
-        }
-        MOCK_CANDIDATES.append(new_candidate)
+        })
         
         return {
             "message": "Resume uploaded and parsed successfully",
@@ -363,14 +585,17 @@ async def upload_resume(file: UploadFile = File(...)):
 # Job matching endpoints
 @app.get("/api/matches/{job_id}")
 async def get_matches(job_id: int):
-    job = next((job for job in MOCK_JOBS if job["id"] == job_id), None)
+    job = jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
+    all_candidates = candidates.list()
+    match_results = resume_parser.calculate_skill_matches(
+        [candidate["skills"] for candidate in all_candidates], job["requirements"]
+    )
+    
     matches = []
-    for candidate in MOCK_CANDIDATES:
-        match_result = resume_parser.calculate_skill_match(candidate["skills"], job["requirements"])
-        
+    for candidate, match_result in zip(all_candidates, match_results):
         match = {
             "candidate": candidate,
             "job": job,
@@ -434,7 +659,7 @@ async def get_user_job_matches():
     user_skills = ["Python", "React", "JavaScript", "SQL", "Git"]
     
     matches = []
-    for job in MOCK_JOBS:
+    for job in jobs.find(status="active"):
         match_result = resume_parser.calculate_skill_match(user_skills, job["requirements"])
         
         match = {
@@ -453,28 +678,16 @@ async def get_user_job_matches():
 
 # Interview endpoints
 @app.get("/api/interviews/")
-async def get_interviews(skip: int = 0, limit: int = 100):
-    # Mock interview data
-    return [{
-        "id": 1,
-        "candidate_id": 1,
-        "job_id": 1,
-        "scheduled_at": "2024-02-01T10:00:00Z",
-        "status": "scheduled",
-        "questions": [
-            "Tell me about your experience with Python",
-            "How do you handle debugging complex issues?",
-            "Describe a challenging project you worked on"
-        ],
-        "responses": [],
-        "score": None,
-        "analysis": None
-    }]
+async def get_interviews(skip: int = 0, limit: int = 100, status: str = None, job_id: int = None, candidate_id: int = None):
+    filters = {"status": status, "job_id": job_id, "candidate_id": candidate_id}
+    filters = {field: value for field, value in filters.items() if value is not None}
+    if filters:
+        return interviews.find(skip=skip, limit=limit, **filters)
+    return interviews.list(skip, limit)
 
 @app.post("/api/interviews/")
 async def create_interview(interview_data: dict):
-    new_interview = {
-        "id": 1,
+    new_interview = interviews.add({
         "candidate_id": interview_data.get("candidate_id", 1),
         "job_id": interview_data.get("job_id", 1),
         "scheduled_at": interview_data.get("scheduled_at", datetime.now().isoformat()),
@@ -487,27 +700,26 @@ async def create_interview(interview_data: dict):
         "responses": [],
         "score": None,
         "analysis": None
-    }
+    })
     return new_interview
 
 # Job Application endpoints
 @app.post("/api/jobs/{job_id}/apply")
 async def apply_for_job(job_id: int, application_data: dict = None):
     """Apply for a job - creates interview and sends admin notification"""
-    job = next((job for job in MOCK_JOBS if job["id"] == job_id), None)
+    job = jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
     # Create interview automatically
-    interview = {
-        "id": len(MOCK_JOBS) + 1,
+    interview = interviews.add({
         "job_id": job_id,
         "candidate_id": application_data.get("candidate_id", 1) if application_data else 1,
         "status": "pending_approval",
         "applied_at": datetime.now().isoformat(),
         "admin_message": f"New application received for {job['title']} at {job['company']}. Interview scheduled pending approval.",
         "interview_link": f"/interview/{job_id}/candidate/{application_data.get('candidate_id', 1) if application_data else 1}"
-    }
+    })
     
     return {
         "message": "Application submitted successfully!",
@@ -593,14 +805,15 @@ async def submit_answer(interview_id: int, answer_data: dict):
     answer_text = answer_data.get("answer", "")
     audio_duration = answer_data.get("audio_duration", 0)
     voice_confidence = answer_data.get("voice_confidence", 0.8)
-    eye_tracking = answer_data.get("eye_tracking", {})
+    eye_tracking = answer_data.get("eye_tracking") or _live_eye_tracking(interview_id)
     speech_analysis = answer_data.get("speech_analysis", {})
     
     # Enhanced fraud detection analysis
+    fraud_result = fraud_engine.evaluate([{**answer_data, "eye_tracking": eye_tracking}])[0]
     fraud_analysis = {
-        "is_authentic": True,
-        "confidence_score": 0.85,
-        "red_flags": [],
+        "is_authentic": fraud_result["is_authentic"],
+        "confidence_score": fraud_result["confidence_score"],
+        "red_flags": fraud_result["red_flags"],
         "analysis": {
             "voice_consistency": "Good",
             "response_time": "Appropriate",
@@ -609,28 +822,6 @@ async def submit_answer(interview_id: int, answer_data: dict):
         }
     }
     
-    # Check for potential fraud indicators
-    if voice_confidence < 0.6:
-        fraud_analysis["red_flags"].append("Low voice confidence")
-        fraud_analysis["is_authentic"] = False
-    
-    if audio_duration < 5:  # Less than 5 seconds
-        fraud_analysis["red_flags"].append("Very short response")
-        fraud_analysis["is_authentic"] = False
-    
-    if len(answer_text) < 20:
-        fraud_analysis["red_flags"].append("Very brief text response")
-        fraud_analysis["is_authentic"] = False
-    
-    # Check eye tracking for attention
-    if eye_tracking.get("attentionScore", 100) < 50:
-        fraud_analysis["red_flags"].append("Low attention score")
-        fraud_analysis["is_authentic"] = False
-    
-    if eye_tracking.get("distractionCount", 0) > 10:
-        fraud_analysis["red_flags"].append("High distraction count")
-        fraud_analysis["is_authentic"] = False
-    
     # AI analysis of the answer
     answer_analysis = {
         "relevance_score": 0.8,
@@ -654,7 +845,16 @@ async def submit_answer(interview_id: int, answer_data: dict):
         "submitted_at": datetime.now().isoformat()
     }
     
-    print(f"Saving answer for interview {interview_id}, question {question_id}: {answer_record}")
+    log_event(
+        logger, "answer_submitted",
+        interview_id=interview_id,
+        question_id=question_id,
+        answer_chars=len(answer_text),
+        audio_duration=audio_duration,
+        is_authentic=fraud_analysis["is_authentic"],
+        red_flags=fraud_analysis["red_flags"],
+    )
+    log_event(logger, "answer_record", level=logging.DEBUG, record=answer_record)
     
     return {
         "interview_id": interview_id,
@@ -666,11 +866,45 @@ async def submit_answer(interview_id: int, answer_data: dict):
         "submitted_at": datetime.now().isoformat()
     }
 
+def _live_eye_tracking(interview_id: int) -> Dict[str, Any]:
+    session = telemetry_sessions.get(interview_id)
+    return session.summary() if session is not None else {}
+
+@app.websocket("/ws/interview/{interview_id}/telemetry")
+async def interview_telemetry(websocket: WebSocket, interview_id: int):
+    """
+    Stream eye-tracking and speech samples for an interview in progress.
+
+    Accepts binary frames (see services/telemetry.py) and acknowledges each one
+    with the running summary. Undecodable frames get an error message and are skipped.
+    """
+    await websocket.accept()
+    session = telemetry_sessions.session(interview_id)
+    try:
+        while True:
+            data = await websocket.receive_bytes()
+            try:
+                kind, samples = decode_frame(data)
+            except FrameError as e:
+                await websocket.send_json({"error": str(e)})
+                continue
+            session.add(kind, samples)
+            if kind == KIND_GAZE:
+                await run_in_threadpool(gaze_series.append, interview_id, samples)
+            await websocket.send_json({"received": len(samples), "summary": session.summary()})
+    except WebSocketDisconnect:
+        log_event(logger, "telemetry_disconnected", interview_id=interview_id, frames=session.frames)
+
 @app.post("/api/interview/{interview_id}/complete")
 async def complete_interview(interview_id: int, completion_data: dict):
     """Complete the interview and get final analysis"""
     total_answers = completion_data.get("total_answers", 5)
     eye_tracking_summary = completion_data.get("eye_tracking_summary", {})
+    session = telemetry_sessions.pop(interview_id)
+    await run_in_threadpool(gaze_series.close, interview_id)
+    if session is not None:
+        # Streamed telemetry is complete and already aggregated; prefer it to the posted summary
+        eye_tracking_summary = {**(eye_tracking_summary or {}), **session.summary()}
     overall_analysis = completion_data.get("overall_analysis", {})
     all_answers = completion_data.get("all_answers", [])
     interview_questions = completion_data.get("interview_questions", [])
@@ -678,7 +912,13 @@ async def complete_interview(interview_id: int, completion_data: dict):
     audio_url = completion_data.get("audio_url", "")
     
     # Calculate comprehensive scores
-    fraud_score = overall_analysis.get("confidence_score", 0.85) if overall_analysis else 0.85
+    # Every answer in one batch; the interview-wide eye tracking summary is an interview-level feature
+    interview_fraud = fraud_engine.evaluate_interviews(
+        [all_answers], interview_level=[{"eye_tracking": eye_tracking_summary or {}}]
+    )[0]
+    # The rule engine decides; a client-posted verdict is kept only for reference
+    fraud_score = interview_fraud["confidence_score"]
+    red_flags = interview_fraud["red_flags"]
     technical_score = overall_analysis.get("content_analysis", {}).get("relevance_score", 0.8) if overall_analysis else 0.8
     attention_score = eye_tracking_summary.get("attentionScore", 100) / 100 if eye_tracking_summary else 0.85
     
@@ -692,8 +932,12 @@ async def complete_interview(interview_id: int, completion_data: dict):
         "fraud_detection": {
             "passed": fraud_score > 0.7,
             "score": fraud_score,
-            "red_flags": overall_analysis.get("red_flags", []) if overall_analysis else [],
-            "recommendation": "Proceed with hiring" if fraud_score > 0.7 else "Requires manual review"
+            "red_flags": red_flags,
+            "recommendation": "Proceed with hiring" if fraud_score > 0.7 else "Requires manual review",
+            "client_reported": {
+                "confidence_score": overall_analysis.get("confidence_score"),
+                "red_flags": overall_analysis.get("red_flags", []),
+            } if overall_analysis else None
         },
         "eye_tracking_analysis": {
             "attention_score": attention_score,
@@ -757,24 +1001,39 @@ async def complete_interview(interview_id: int, completion_data: dict):
         "audio_url": audio_url
     }
     
-    # Store in both global array and storage class for redundancy
-    global completed_interviews
-    completed_interviews.append(interview_data)
     interview_storage.add_interview(interview_data)
+    interview_rollups.add(interview_data)
     
-    print(f"=== SAVING COMPLETE INTERVIEW DATA ===")
-    print(f"Interview ID: {interview_id}")
-    print(f"Total Answers: {total_answers}")
-    print(f"Overall Score: {final_analysis['overall_score']}")
-    print(f"Interview Answers: {len(all_answers)} answers saved")
-    print(f"Eye Tracking: {eye_tracking_summary}")
-    print(f"Video URL: {video_url}")
-    print(f"Audio URL: {audio_url}")
-    print(f"Complete Data: {interview_data}")
-    print(f"Total Saved Interviews: {len(completed_interviews)}")
-    print(f"=====================================")
+    log_event(
+        logger, "interview_completed",
+        interview_id=interview_id,
+        total_answers=total_answers,
+        answers_saved=len(all_answers),
+        overall_score=final_analysis["overall_score"],
+        fraud_passed=final_analysis["fraud_detection"]["passed"],
+        attention_score=attention_score,
+        has_video=bool(video_url),
+        has_audio=bool(audio_url),
+    )
+    log_event(logger, "interview_record", level=logging.DEBUG, record=interview_data)
     
-    # Send admin notification
+    summary = interview_rollups.summary()
+    admin_feed.publish("interview_completed", {
+        "interview_id": interview_id,
+        "candidate_name": interview_data["candidate_name"],
+        "job_title": interview_data["job_title"],
+        "overall_score": final_analysis["overall_score"],
+        "fraud_passed": final_analysis["fraud_detection"]["passed"],
+        "recommendation": final_analysis["recommendation"],
+        "requires_review": interview_data["requires_review"],
+        "completed_at": interview_data["completed_at"],
+        "totals": {
+            "total_interviews": summary["total_interviews"],
+            "average_score": summary["average_score"],
+        },
+    })
+    
+    # Queue admin notification; delivery happens in the background
     admin_notification = {
         "interview_id": interview_id,
         "candidate_id": f"candidate_{interview_id}",
@@ -792,204 +1051,37 @@ async def complete_interview(interview_id: int, completion_data: dict):
         "sent_at": datetime.now().isoformat()
     }
     
-    print(f"Admin notification sent: {admin_notification}")
+    admin_notifications.enqueue(admin_notification)
     
     return final_analysis
 
 @app.get("/api/admin/interview-analytics")
-async def get_interview_analytics():
-    """Get comprehensive interview analytics for admin dashboard"""
-    global completed_interviews
-    
-    # Get interviews from both sources
-    stored_interviews = interview_storage.get_interviews()
-    
-    print(f"=== ADMIN REQUESTING INTERVIEW ANALYTICS ===")
-    print(f"Global completed interviews: {len(completed_interviews)}")
-    print(f"Storage class interviews: {len(stored_interviews)}")
-    print(f"All interviews: {stored_interviews}")
-    print(f"===========================================")
-    
-    # Use stored interviews as primary source
-    analytics = stored_interviews + [
-        {
-            "interview_id": 4,
-            "candidate_id": "candidate_4",
-            "candidate_name": "Alex Rodriguez",
-            "job_title": "Full Stack Developer",
-            "overall_score": 91.2,
-            "fraud_detection": {
-                "passed": True,
-                "score": 0.94,
-                "red_flags": []
-            },
-            "eye_tracking_analysis": {
-                "attention_score": 0.92,
-                "eye_movements": 28,
-                "distraction_count": 1,
-                "focus_quality": "Excellent"
-            },
-            "speech_analysis": {
-                "confidence": 0.95,
-                "clarity": 0.96,
-                "communication_quality": 0.94
-            },
-            "technical_assessment": {
-                "score": 0.89,
-                "relevance": 0.91,
-                "technical_depth": 0.87,
-                "keywords_found": ["React", "Node.js", "MongoDB", "TypeScript", "AWS"],
-                "strengths": ["Excellent technical skills", "Clear communication", "Strong problem-solving"],
-                "areas_for_improvement": []
-            },
-            "interview_answers": [
-                {
-                    "question_id": 1,
-                    "question": "Describe your experience with React and state management",
-                    "answer": "I have extensive experience with React, including hooks, context API, and Redux for state management. I've built complex applications with real-time updates...",
-                    "score": 9.2,
-                    "keywords_found": ["React", "hooks", "Redux", "state management", "applications"]
-                },
-                {
-                    "question_id": 2,
-                    "question": "How do you handle API integration and error handling?",
-                    "answer": "I use async/await patterns with proper error handling, implement retry mechanisms, and use interceptors for request/response handling...",
-                    "score": 8.8,
-                    "keywords_found": ["API", "async/await", "error handling", "retry", "interceptors"]
-                },
-                {
-                    "question_id": 3,
-                    "question": "Explain your approach to database design and optimization",
-                    "answer": "I focus on proper indexing, query optimization, and use both SQL and NoSQL databases based on requirements. I've worked with PostgreSQL, MongoDB...",
-                    "score": 9.5,
-                    "keywords_found": ["database", "indexing", "optimization", "PostgreSQL", "MongoDB"]
-                }
-            ],
-            "recommendation": "Exceptional candidate",
-            "completed_at": "2024-01-16T14:45:00Z",
-            "requires_review": False
-        },
-        {
-            "interview_id": 1,
-            "candidate_id": "candidate_1",
-            "candidate_name": "John Smith",
-            "job_title": "Senior Software Engineer",
-            "overall_score": 87.5,
-            "fraud_detection": {
-                "passed": True,
-                "score": 0.92,
-                "red_flags": []
-            },
-            "eye_tracking_analysis": {
-                "attention_score": 0.85,
-                "eye_movements": 45,
-                "distraction_count": 2,
-                "focus_quality": "Good"
-            },
-            "speech_analysis": {
-                "confidence": 0.88,
-                "clarity": 0.92,
-                "communication_quality": 0.90
-            },
-            "technical_assessment": {
-                "score": 0.85,
-                "relevance": 0.88,
-                "technical_depth": 0.82,
-                "keywords_found": ["Python", "Django", "React", "AWS"],
-                "strengths": ["Strong technical knowledge", "Clear communication", "Good problem-solving"],
-                "areas_for_improvement": ["Could provide more specific examples"]
-            },
-            "interview_answers": [
-                {
-                    "question_id": 1,
-                    "question": "Tell me about your experience with Python",
-                    "answer": "I have 5 years of experience with Python, working on web applications using Django and Flask...",
-                    "score": 8.5,
-                    "keywords_found": ["Python", "Django", "Flask", "experience"]
-                },
-                {
-                    "question_id": 2,
-                    "question": "How do you handle debugging complex issues?",
-                    "answer": "I use systematic debugging approaches, starting with logs and then using debugging tools...",
-                    "score": 9.0,
-                    "keywords_found": ["debugging", "logs", "systematic", "tools"]
-                }
-            ],
-            "recommendation": "Strong candidate",
-            "completed_at": "2024-01-15T10:30:00Z",
-            "requires_review": False
-        },
-        {
-            "interview_id": 2,
-            "candidate_id": "candidate_2",
-            "candidate_name": "Sarah Johnson",
-            "job_title": "Frontend Developer",
-            "overall_score": 72.3,
-            "fraud_detection": {
-                "passed": True,
-                "score": 0.78,
-                "red_flags": ["Low attention score"]
-            },
-            "eye_tracking_analysis": {
-                "attention_score": 0.65,
-                "eye_movements": 78,
-                "distraction_count": 8,
-                "focus_quality": "Needs improvement"
-            },
-            "speech_analysis": {
-                "confidence": 0.75,
-                "clarity": 0.80,
-                "communication_quality": 0.78
-            },
-            "technical_assessment": {
-                "score": 0.70,
-                "relevance": 0.75,
-                "technical_depth": 0.68,
-                "keywords_found": ["JavaScript", "React", "CSS"],
-                "strengths": ["Good frontend skills", "Creative thinking"],
-                "areas_for_improvement": ["Needs more backend knowledge", "Could improve focus during interview"]
-            },
-            "recommendation": "Needs further evaluation",
-            "completed_at": "2024-01-14T14:20:00Z",
-            "requires_review": True
-        },
-        {
-            "interview_id": 3,
-            "candidate_id": "candidate_3",
-            "candidate_name": "Mike Chen",
-            "job_title": "Data Scientist",
-            "overall_score": 94.2,
-            "fraud_detection": {
-                "passed": True,
-                "score": 0.96,
-                "red_flags": []
-            },
-            "eye_tracking_analysis": {
-                "attention_score": 0.95,
-                "eye_movements": 32,
-                "distraction_count": 1,
-                "focus_quality": "Excellent"
-            },
-            "speech_analysis": {
-                "confidence": 0.94,
-                "clarity": 0.96,
-                "communication_quality": 0.95
-            },
-            "technical_assessment": {
-                "score": 0.92,
-                "relevance": 0.95,
-                "technical_depth": 0.94,
-                "keywords_found": ["Python", "Machine Learning", "TensorFlow", "Pandas", "SQL"],
-                "strengths": ["Exceptional technical expertise", "Clear communication", "Strong analytical skills"],
-                "areas_for_improvement": []
-            },
-            "recommendation": "Exceptional candidate",
-            "completed_at": "2024-01-13T09:15:00Z",
-            "requires_review": False
-        }
-    ]
-    
-    return analytics
+async def get_interview_analytics(skip: int = 0, limit: int = 100):
+    """One page of interview records, stored interviews first then samples; totals are served by /summary"""
+    return _analytics_records(skip, limit)
+
+@app.get("/api/admin/interview-analytics/summary")
+async def get_interview_analytics_summary():
+    """Dashboard aggregates, maintained incrementally as interviews complete"""
+    return interview_rollups.summary()
+
+@app.get("/api/admin/interview-analytics/records")
+async def get_interview_analytics_records(skip: int = 0, limit: int = 20):
+    """Paginated detailed interview records"""
+    limit = max(1, min(limit, 100))
+    return {
+        "total": interview_storage.count() + len(SAMPLE_INTERVIEWS),
+        "skip": skip,
+        "limit": limit,
+        "records": _analytics_records(skip, limit),
+    }
+
+def _analytics_records(skip: int, limit: int) -> List[Dict[str, Any]]:
+    records = interview_storage.get_interviews(skip=skip, limit=limit)
+    if len(records) < limit:
+        sample_skip = max(0, skip - interview_storage.count())
+        records += SAMPLE_INTERVIEWS[sample_skip:sample_skip + limit - len(records)]
+    return records
 
 @app.post("/api/admin/interview-feedback")
 async def send_admin_feedback(feedback_data: dict):
@@ -1017,12 +1109,14 @@ async def send_admin_feedback(feedback_data: dict):
             "sent_at": datetime.now().isoformat()
         }
         
-        print(f"=== ADMIN NOTIFICATION ===")
-        print(f"Interview ID: {interview_id}")
-        print(f"Overall Score: {candidate_performance.get('overall_score', 0)}")
-        print(f"Answers Count: {len(all_answers)}")
-        print(f"Notification: {admin_notification}")
-        print(f"==========================")
+        admin_notifications.enqueue(admin_notification)
+        log_event(
+            logger, "admin_feedback_queued",
+            interview_id=interview_id,
+            overall_score=candidate_performance.get("overall_score", 0),
+            answers=len(all_answers),
+            requires_review=admin_notification["requires_review"],
+        )
         
         return {
             "status": "feedback_sent",
@@ -1032,6 +1126,25 @@ async def send_admin_feedback(feedback_data: dict):
     except Exception as e:
         return {"error": str(e)}
 
+@app.get("/api/admin/events")
+async def admin_events(request: Request, last_event_id: str = None):
+    """
+    Server-sent events for the admin dashboard: interview_completed and analysis_ready deltas.
+
+    Reconnects resume after the Last-Event-ID header (or last_event_id query parameter).
+    """
+    resume_from = request.headers.get("Last-Event-ID") or last_event_id
+    return StreamingResponse(
+        admin_feed.stream(resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/api/admin/notifications/stats")
+async def get_notification_stats():
+    """Counters for the admin notification queue"""
+    return admin_notifications.stats
+
 @app.get("/api/admin/interview-data/{interview_id}")
 async def get_interview_data(interview_id: int):
     """Get specific interview data for admin review"""
@@ -1067,103 +1180,134 @@ async def get_interview_data(interview_id: int):
     
     return interview_data
 
+@app.get("/api/admin/interview-data/{interview_id}/gaze")
+async def get_interview_gaze(
+    interview_id: int,
+    start_ms: int = 0,
+    end_ms: int = None,
+    max_points: int = GAZE_DEFAULT_MAX_POINTS,
+):
+    """Attention over time for an interview, downsampled to at most max_points points"""
+    return await run_in_threadpool(gaze_series.query, interview_id, start_ms, end_ms, min(max_points, 5000))
+
 @app.get("/api/admin/recent-interviews")
 async def get_recent_interviews():
     """Get recently completed interviews for admin dashboard"""
-    global completed_interviews
-    
-    # Return the most recent interviews (last 10)
-    recent_interviews = completed_interviews[-10:] if len(completed_interviews) > 10 else completed_interviews
-    
     return {
-        "total_interviews": len(completed_interviews),
-        "recent_interviews": recent_interviews,
+        "total_interviews": interview_storage.count(),
+        "recent_interviews": interview_storage.get_recent_interviews(10),
         "last_updated": datetime.now().isoformat()
     }
 
 @app.post("/api/admin/test-interview")
 async def add_test_interview():
     """Add a test interview for admin visibility testing"""
-    global completed_interviews
-    
-    # Get current count from storage class
-    current_count = len(interview_storage.get_interviews())
-    
-    test_interview = {
-        "interview_id": current_count + 1,
-        "candidate_name": f"Test Candidate {current_count + 1}",
-        "job_title": "Software Engineer",
-        "overall_score": 85.5,
-        "fraud_detection": {
-            "passed": True,
-            "score": 0.88,
-            "red_flags": []
-        },
-        "eye_tracking_analysis": {
-            "attention_score": 0.82,
-            "eye_movements": 35,
-            "distraction_count": 3,
-            "focus_quality": "Good"
-        },
-        "speech_analysis": {
-            "confidence": 0.87,
-            "clarity": 0.89,
-            "communication_quality": 0.85
-        },
-        "technical_assessment": {
-            "score": 0.83,
-            "relevance": 0.86,
-            "technical_depth": 0.80,
-            "keywords_found": ["Python", "React", "JavaScript"],
-            "strengths": ["Good technical knowledge", "Clear communication"],
-            "areas_for_improvement": ["Could provide more examples"]
-        },
-        "interview_answers": [
-            {
-                "question_id": 1,
-                "question": "Tell me about your experience with Python",
-                "answer": "I have 3 years of experience with Python, working on web applications and data analysis...",
-                "score": 8.5,
-                "keywords_found": ["Python", "experience", "web applications"]
-            }
-        ],
-        "recommendation": "Good candidate",
-        "completed_at": datetime.now().isoformat(),
-        "requires_review": False,
-        "video_url": f"uploads/interviews/{current_count + 1}/video.mp4",
-        "audio_url": f"uploads/interviews/{current_count + 1}/audio.wav"
-    }
+    # Test records get their own (negative) ids so they never replace a real interview
+    def build(test_id: int) -> Dict[str, Any]:
+        return {
+            "interview_id": test_id,
+            "candidate_name": f"Test Candidate {abs(test_id)}",
+            "job_title": "Software Engineer",
+            "overall_score": 85.5,
+            "fraud_detection": {
+                "passed": True,
+                "score": 0.88,
+                "red_flags": []
+            },
+            "eye_tracking_analysis": {
+                "attention_score": 0.82,
+                "eye_movements": 35,
+                "distraction_count": 3,
+                "focus_quality": "Good"
+            },
+            "speech_analysis": {
+                "confidence": 0.87,
+                "clarity": 0.89,
+                "communication_quality": 0.85
+            },
+            "technical_assessment": {
+                "score": 0.83,
+                "relevance": 0.86,
+                "technical_depth": 0.80,
+                "keywords_found": ["Python", "React", "JavaScript"],
+                "strengths": ["Good technical knowledge", "Clear communication"],
+                "areas_for_improvement": ["Could provide more examples"]
+            },
+            "interview_answers": [
+                {
+                    "question_id": 1,
+                    "question": "Tell me about your experience with Python",
+                    "answer": "I have 3 years of experience with Python, working on web applications and data analysis...",
+                    "score": 8.5,
+                    "keywords_found": ["Python", "experience", "web applications"]
+                }
+            ],
+            "recommendation": "Good candidate",
+            "completed_at": datetime.now().isoformat(),
+            "requires_review": False,
+            "video_url": f"uploads/interviews/test_{abs(test_id)}/video.mp4",
+            "audio_url": f"uploads/interviews/test_{abs(test_id)}/audio.wav"
+        }
     
-    # Store in both global array and storage class
-    completed_interviews.append(test_interview)
-    interview_storage.add_interview(test_interview)
+    test_interview = interview_storage.add_test_interview(build)
+    interview_rollups.add(test_interview)
     
-    print(f"=== TEST INTERVIEW ADDED ===")
-    print(f"Interview ID: {test_interview['interview_id']}")
-    print(f"Total interviews: {len(interview_storage.get_interviews())}")
-    print(f"==========================")
+    log_event(logger, "test_interview_added", interview_id=test_interview["interview_id"])
     
     return {
         "status": "test_interview_added",
         "interview_id": test_interview["interview_id"],
-        "total_interviews": len(interview_storage.get_interviews())
+        "total_interviews": interview_storage.count()
     }
 
 @app.get("/api/admin/debug-interviews")
 async def debug_interviews():
     """Debug endpoint to check stored interviews"""
-    global completed_interviews
-    
     stored_interviews = interview_storage.get_interviews()
     
     return {
-        "global_completed_interviews": len(completed_interviews),
         "storage_class_interviews": len(stored_interviews),
-        "global_data": completed_interviews,
         "storage_data": stored_interviews,
         "timestamp": datetime.now().isoformat()
     }
 
+# Interview recording uploads and playback
+@app.post("/api/interview/{interview_id}/media/uploads")
+async def init_media_upload(interview_id: int, upload_data: dict):
+    """
+    Start a resumable upload: {"kind": "video" | "audio", "filename": ..., "total_size": bytes}
+
+    Add "question_id" to upload the recording of a single answer.
+    """
+    return await run_in_threadpool(
+        media_store.init_upload,
+        interview_id,
+        upload_data.get("kind"),
+        upload_data.get("filename"),
+        upload_data.get("total_size"),
+        upload_data.get("question_id"),
+    )
+
+@app.get("/api/interview/{interview_id}/media/uploads/{upload_id}")
+async def get_media_upload(interview_id: int, upload_id: str):
+    """Current offset of an upload, to resume from"""
+    return media_store.upload_status(interview_id, upload_id)
+
+@app.put("/api/interview/{interview_id}/media/uploads/{upload_id}")
+async def append_media_upload(interview_id: int, upload_id: str, offset: int, request: Request):
+    """Append the raw request body at offset; 409 with expected_offset if it is not where the data ends"""
+    return await media_store.append_chunk(interview_id, upload_id, offset, request.stream())
+
+@app.post("/api/interview/{interview_id}/media/uploads/{upload_id}/finalize")
+async def finalize_media_upload(interview_id: int, upload_id: str):
+    return await run_in_threadpool(media_store.finalize_upload, interview_id, upload_id)
+
+@app.get("/api/interview/{interview_id}/media/{filename}")
+async def get_interview_media(interview_id: int, filename: str, request: Request):
+    """Stream a recording, honouring Range so players can seek"""
+    path = media_store.media_path(interview_id, filename)
+    return media_store.RangeFileResponse(path, request.headers.get("range"))
+
 # Voice recording endpoints
 @app.post("/api/interview/{interview_id}/voice/start")
 async def start_voice_recording(interview_id: int):
@@ -1176,32 +1320,76 @@ async def start_voice_recording(interview_id: int):
         "started_at": datetime.now().isoformat()
     }
 
+async def _recording_features(interview_id: int, data: dict) -> Optional[Dict[str, Any]]:
+    """
+    Speech features of an uploaded WAV recording, or None if there is none.
+
+    Prefers the answer's own recording (audio_q{question_id}.wav) and falls back
+    to the whole-interview audio.wav; "scope" says which one was measured.
+    """
+    candidates = []
+    if data.get("audio_filename"):
+        candidates.append((data["audio_filename"], "file"))
+    if data.get("question_id") is not None:
+        candidates.append((media_store.recording_name("audio", ".wav", data["question_id"]), "answer"))
+    candidates.append((media_store.recording_name("audio", ".wav"), "interview"))
+
+    for filename, scope in candidates:
+        if not str(filename).lower().endswith(".wav"):
+            continue
+        try:
+            path = media_store.media_path(interview_id, str(filename))
+        except HTTPException:
+            continue
+        try:
+            features = await audio_pool.analyze(path)
+        except AudioFormatError as e:
+            log_event(logger, "audio_analysis_failed", level=logging.WARNING, interview_id=interview_id, error=str(e))
+            return None
+        return {**features, "scope": scope}
+    return None
+
 @app.post("/api/interview/{interview_id}/analyze")
 async def analyze_interview_data(interview_id: int, analysis_data: dict):
     """Comprehensive analysis of interview data including video, audio, and eye tracking"""
     try:
         # Extract data from form
-        audio_duration = analysis_data.get("duration", 0)
         eye_tracking_data = analysis_data.get("eye_tracking_data", {})
         
         # Comprehensive analysis
+        fraud_result = fraud_engine.evaluate([analysis_data])[0]
+        features = await _recording_features(interview_id, analysis_data)
+        if features:
+            speech_analysis = {
+                **speech_scores(features),
+                # Filler words and transcripts need speech-to-text, which is not available locally
+                "filler_words": None,
+                "transcription": None,
+                "features": features,
+                "source": "audio",
+                # "answer" when the answer has its own recording, "interview" for the whole-interview one
+                "scope": features["scope"],
+            }
+        else:
+            speech_analysis = {
+                "confidence": 0.85,
+                "clarity": 0.9,
+                "pace": 0.8,
+                "filler_words": 2,
+                "transcription": "Mock transcription of candidate response",
+                "source": "placeholder",
+            }
         analysis = {
-            "is_authentic": True,
-            "confidence_score": 0.85,
-            "red_flags": [],
+            "is_authentic": fraud_result["is_authentic"],
+            "confidence_score": fraud_result["confidence_score"],
+            "red_flags": fraud_result["red_flags"],
             "eye_tracking": {
                 "eye_movements": eye_tracking_data.get("eyeMovements", 0),
                 "gaze_direction": eye_tracking_data.get("gazeDirection", "center"),
                 "attention_score": eye_tracking_data.get("attentionScore", 100),
                 "distraction_count": eye_tracking_data.get("distractionCount", 0)
             },
-            "speech_analysis": {
-                "confidence": 0.85,
-                "clarity": 0.9,
-                "pace": 0.8,
-                "filler_words": 2,
-                "transcription": "Mock transcription of candidate response"
-            },
+            "speech_analysis": speech_analysis,
             "content_analysis": {
                 "relevance_score": 0.8,
                 "technical_depth": 0.7,
@@ -1212,28 +1400,28 @@ async def analyze_interview_data(interview_id: int, analysis_data: dict):
             "overall_score": 82.5
         }
         
-        # Check for suspicious behavior
-        if eye_tracking_data.get("attentionScore", 100) < 60:
-            analysis["red_flags"].append("Low attention score")
-            analysis["is_authentic"] = False
-        
-        if eye_tracking_data.get("distractionCount", 0) > 5:
-            analysis["red_flags"].append("High distraction count")
-            analysis["is_authentic"] = False
-        
-        if audio_duration < 5:
-            analysis["red_flags"].append("Very short response")
-            analysis["is_authentic"] = False
-        
         # Save analysis to database (mock implementation)
         # In a real implementation, this would save to the database
-        print(f"Saving interview analysis for interview {interview_id}: {analysis}")
+        admin_feed.publish("analysis_ready", {
+            "interview_id": interview_id,
+            "overall_score": analysis["overall_score"],
+            "is_authentic": analysis["is_authentic"],
+            "red_flags": analysis["red_flags"],
+        })
+        log_event(
+            logger, "interview_analyzed",
+            interview_id=interview_id,
+            is_authentic=analysis["is_authentic"],
+            red_flags=analysis["red_flags"],
+        )
         
         return {
             "interview_id": interview_id,
             "analysis": analysis,
             "processed_at": datetime.now().isoformat()
         }
+    except HTTPException:
+        raise
     except Exception as e:
         return {"error": str(e)}
 
@@ -1244,17 +1432,34 @@ async def stop_voice_recording(interview_id: int, recording_data: dict):
         audio_duration = recording_data.get("duration", 0)
         audio_quality = recording_data.get("quality", "good")
         
-        # Mock speech-to-text processing
-        transcribed_text = "This is a mock transcription of the candidate's response. In a real implementation, this would use speech-to-text services."
+        features = await _recording_features(interview_id, recording_data)
+        if features:
+            audio_duration = features["duration_seconds"]
+            # No speech-to-text runs locally, so there is no transcription
+            speech = {
+                "transcription": None,
+                "confidence_score": speech_scores(features)["confidence"],
+                "source": "audio",
+            }
+        else:
+            # Nothing uploaded to measure; keep the demo values, marked as such
+            speech = {
+                "transcription": "This is a mock transcription of the candidate's response. In a real implementation, this would use speech-to-text services.",
+                "confidence_score": 0.92,
+                "source": "placeholder",
+            }
         
         return {
             "interview_id": interview_id,
-            "transcription": transcribed_text,
+            **speech,
             "audio_duration": int(audio_duration) if audio_duration else 0,
             "audio_quality": str(audio_quality),
-            "confidence_score": 0.92,
+            "speech_metrics": features,
+            "metrics_scope": features["scope"] if features else None,
             "processed_at": datetime.now().isoformat()
         }
+    except HTTPException:
+        raise
     except Exception as e:
         return {
             "interview_id": interview_id,
@@ -43,9 +43,32 @@ interface InterviewAnalytics {
   requires_review: boolean;
 }
 
+interface AnalyticsSummary {
+  total_interviews: number;
+  average_score: number;
+  fraud_detection: {
+    passed: number;
+    failed: number;
+    pass_rate: number;
+  };
+  score_distribution: Record<string, number>;
+  top_performers: Array<{
+    interview_id: number;
+    candidate_name: string;
+    job_title: string;
+    overall_score: number;
+  }>;
+}
+
+const API_BASE = 'http://localhost:8000/api/admin/interview-analytics';
+const PAGE_SIZE = 50;
+
 const InterviewAnalytics: React.FC = () => {
   const [analytics, setAnalytics] = useState<InterviewAnalytics[]>([]);
+  const [summary, setSummary] = useState<AnalyticsSummary | null>(null);
+  const [totalRecords, setTotalRecords] = useState(0);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selectedInterview, setSelectedInterview] = useState<InterviewAnalytics | null>(null);
   const [activeTab, setActiveTab] = useState('overview');
 
@@ -53,19 +76,24 @@ const InterviewAnalytics: React.FC = () => {
     fetchAnalytics();
   }, []);
 
+  const authHeaders = () => ({
+    'Authorization': `Bearer ${localStorage.getItem('token')}`,
+    'Content-Type': 'application/json',
+  });
+
+  // Totals come from the server-side rollups; detailed records are paged
   const fetchAnalytics = async () => {
     try {
-      const token = localStorage.getItem('token');
-      const response = await fetch('http://localhost:8000/api/admin/interview-analytics', {
-        headers: {
-          'Authorization': `Bearer ${token}`,
-          'Content-Type': 'application/json',
-        },
-      });
-
-      if (response.ok) {
-        const data = await response.json();
-        setAnalytics(data);
+      const [summaryResponse, recordsResponse] = await Promise.all([
+        fetch(`${API_BASE}/summary`, { headers: authHeaders() }),
+        fetch(`${API_BASE}/records?skip=0&limit=${PAGE_SIZE}`, { headers: authHeaders() }),
+      ]);
+
+      if (summaryResponse.ok && recordsResponse.ok) {
+        const page = await recordsResponse.json();
+        setSummary(await summaryResponse.json());
+        setAnalytics(page.records);
+        setTotalRecords(page.total);
       } else {
         toast.error('Failed to fetch analytics data');
       }
@@ -76,6 +104,27 @@ const InterviewAnalytics: React.FC = () => {
     }
   };
 
+  const loadMoreRecords = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await fetch(`${API_BASE}/records?skip=${analytics.length}&limit=${PAGE_SIZE}`, {
+        headers: authHeaders(),
+      });
+
+      if (response.ok) {
+        const page = await response.json();
+        setAnalytics(prev => [...prev, ...page.records]);
+        setTotalRecords(page.total);
+      } else {
+        toast.error('Failed to fetch more interviews');
+      }
+    } catch (error) {
+      toast.error('Error fetching more interviews');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const logout = () => {
     localStorage.removeItem('token');
     localStorage.removeItem('user');
@@ -94,23 +143,25 @@ const InterviewAnalytics: React.FC = () => {
     return 'bg-red-100';
   };
 
-  const calculateAverageScore = (interviews: InterviewAnalytics[]) => {
-    if (interviews.length === 0) return 0;
-    const total = interviews.reduce((sum, interview) => sum + interview.overall_score, 0);
-    return total / interviews.length;
+  const countScoresFrom = (distribution: Record<string, number>, low: number) => {
+    return Object.entries(distribution)
+      .filter(([bucket]) => Number(bucket.split('-')[0]) >= low)
+      .reduce((sum, [, count]) => sum + count, 0);
   };
 
-  const getTopPerformers = (interviews: InterviewAnalytics[]) => {
-    return [...interviews]
-      .sort((a, b) => b.overall_score - a.overall_score)
-      .slice(0, 3);
-  };
-
-  const getFraudDetectionStats = (interviews: InterviewAnalytics[]) => {
-    const passed = interviews.filter(i => i.fraud_detection.passed).length;
-    const failed = interviews.length - passed;
-    return { passed, failed, total: interviews.length };
-  };
+  const renderLoadMore = () => (
+    analytics.length < totalRecords && (
+      <div className="mt-6 text-center">
+        <button
+          onClick={loadMoreRecords}
+          disabled={loadingMore}
+          className="bg-indigo-600 text-white px-4 py-2 rounded-md hover:bg-indigo-700 disabled:opacity-50"
+        >
+          {loadingMore ? 'Loading...' : `Load more (${analytics.length} of ${totalRecords})`}
+        </button>
+      </div>
+    )
+  );
 
   if (loading) {
     return (
@@ -123,9 +174,18 @@ const InterviewAnalytics: React.FC = () => {
     );
   }
 
-  const averageScore = calculateAverageScore(analytics);
-  const topPerformers = getTopPerformers(analytics);
-  const fraudStats = getFraudDetectionStats(analytics);
+  const totalInterviews = summary?.total_interviews ?? 0;
+  const averageScore = summary?.average_score ?? 0;
+  const topPerformers = summary?.top_performers ?? [];
+  const fraudStats = {
+    passed: summary?.fraud_detection.passed ?? 0,
+    failed: summary?.fraud_detection.failed ?? 0,
+    total: totalInterviews,
+    passRate: summary?.fraud_detection.pass_rate ?? 0,
+  };
+  const scoreDistribution = summary?.score_distribution ?? {};
+  const excellentCount = countScoresFrom(scoreDistribution, 90);
+  const goodCount = countScoresFrom(scoreDistribution, 80) - excellentCount;
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-50 via-blue-50 to-indigo-100">
@@ -196,7 +256,7 @@ const InterviewAnalytics: React.FC = () => {
                   </div>
                   <div className="ml-4">
                     <p className="text-sm font-medium text-gray-500">Total Interviews</p>
-                    <p className="text-2xl font-semibold text-gray-900">{analytics.length}</p>
+                    <p className="text-2xl font-semibold text-gray-900">{totalInterviews}</p>
                   </div>
                 </div>
               </div>
@@ -324,6 +384,7 @@ const InterviewAnalytics: React.FC = () => {
                   </div>
                 ))}
               </div>
+              {renderLoadMore()}
             </div>
           </div>
         )}
@@ -337,19 +398,19 @@ const InterviewAnalytics: React.FC = () => {
               <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
                 <div className="text-center">
                   <div className="text-3xl font-bold text-green-600">
-                    {analytics.filter(i => i.overall_score >= 90).length}
+                    {excellentCount}
                   </div>
                   <div className="text-sm text-gray-500">Excellent (90+)</div>
                 </div>
                 <div className="text-center">
                   <div className="text-3xl font-bold text-yellow-600">
-                    {analytics.filter(i => i.overall_score >= 80 && i.overall_score < 90).length}
+                    {goodCount}
                   </div>
                   <div className="text-sm text-gray-500">Good (80-89)</div>
                 </div>
                 <div className="text-center">
                   <div className="text-3xl font-bold text-red-600">
-                    {analytics.filter(i => i.overall_score < 80).length}
+                    {totalInterviews - excellentCount - goodCount}
                   </div>
                   <div className="text-sm text-gray-500">Needs Improvement (&lt;80)</div>
                 </div>
@@ -402,6 +463,7 @@ const InterviewAnalytics: React.FC = () => {
                 </div>
               </div>
             </div>
+            {renderLoadMore()}
           </div>
         )}
 
@@ -421,7 +483,7 @@ const InterviewAnalytics: React.FC = () => {
                 </div>
                 <div className="text-center">
                   <div className="text-3xl font-bold text-blue-600">
-                    {((fraudStats.passed / fraudStats.total) * 100).toFixed(1)}%
+                    {(fraudStats.passRate * 100).toFixed(1)}%
                   </div>
                   <div className="text-sm text-gray-500">Pass Rate</div>
                 </div>
@@ -460,6 +522,7 @@ const InterviewAnalytics: React.FC = () => {
                     </div>
                   ))}
                 </div>
+                {renderLoadMore()}
               </div>
             </div>
           </div>